@@ -19,29 +19,63 @@ proxies its calls to the API through Mycroft's officially supported API,
 Selene.  The Selene API is also used to get geographical information about the
 city name provided in the request.
 """
-from datetime import datetime
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from time import sleep
-from typing import List, Tuple
+from typing import FrozenSet, Iterable, Iterator, List, Tuple
 
 from requests import HTTPError
 
+from mycroft.audio import wait_while_speaking
 from mycroft.skills import MycroftSkill, intent_handler
 from mycroft.skills.intent_service import AdaptIntent
 from mycroft.messagebus.message import Message
 from mycroft.util.parse import extract_number
 from .skill import (
+    build_forecast_key,
+    build_likely_dialogs,
+    CONDITION_IMAGES,
     CurrentDialog,
     DAILY,
     DailyDialog,
+    DailyForecastSpan,
     DailyWeather,
+    ForecastCache,
+    ForecastFetcher,
+    get_city_geolocation,
     HOURLY,
     HourlyDialog,
     get_dialog_for_timeframe,
+    group_dialogs,
+    GuiAssets,
+    GuiPages,
+    IDLE_SCREEN_EVENT,
+    join_sentences,
+    LocalForecastSubscriptions,
     LocationNotFoundError,
     OpenWeatherMapApi,
+    profile_request,
+    QUERY_EVENT,
+    RenderedDialogs,
+    RequestProfiler,
+    Slideshow,
+    SpeakableDays,
+    trace_request,
+    TRACE_EVENT,
+    traced,
+    TranslationTable,
+    TTS_PREFETCH_EVENT,
+    TTS_PREFETCH_RESPONSE_EVENT,
+    VocabularyMatcher,
     WeatherConfig,
+    WeatherDialog,
+    WeatherDisplay,
     WeatherIntent,
+    WeatherOverlay,
+    WeatherQuery,
+    WeatherQueryError,
     WeatherReport,
     WeeklyDialog,
 )
@@ -54,7 +88,9 @@ from .skill import (
 #       invoke datetime skill
 
 MARK_II = "mycroft_mark_2"
-TWELVE_HOUR = "half"
+LOCAL_FORECAST_MAX_AGE = 300
+LOCAL_FORECAST_REFRESH_EVENT = "WeatherLocalForecastRefresh"
+LOCAL_FORECAST_REFRESH_INTERVAL = 600
 
 
 class WeatherSkill(MycroftSkill):
@@ -66,45 +102,310 @@ class WeatherSkill(MycroftSkill):
         self.platform = self.config_core["enclosure"].get("platform", "unknown")
         self.gui_image_directory = Path(self.root_dir).joinpath("ui")
         self.weather_config = None
+        self.forecast_cache = None
+        self.forecast_fetcher = None
+        self.local_forecast_subscriptions = LocalForecastSubscriptions()
+        self.rendered_dialogs = RenderedDialogs()
+        self.speech_prefetch_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="WeatherSpeechPrefetch"
+        )
+        self.request_profiler = None
+        self.slideshow = None
+        self.gui_pages = None
+        self.translation_tables = dict()
+        self.vocabulary_matchers = dict()
 
     def initialize(self):
         """Do these things after the skill is loaded."""
         self.weather_config = WeatherConfig(self.config_core, self.settings)
+        self.forecast_cache = ForecastCache(self.weather_config.cache_memory_budget)
+        self.forecast_fetcher = ForecastFetcher(self.forecast_cache)
+        self._configure_request_profiler()
+        self.slideshow = Slideshow(self.schedule_event, self.cancel_scheduled_event)
+        self.gui_pages = GuiPages(self.gui, self.bus, self.skill_id)
+        self.schedule_event(self._prepare_gui_assets, 1, name="WeatherGuiAssets")
+        self.settings_change_callback = self.handle_settings_change
         self.add_event(
             "skill.weather.request-local-forecast", self.handle_get_local_forecast
         )
+        self.add_event(QUERY_EVENT, self.handle_weather_query)
+        self.add_event(IDLE_SCREEN_EVENT, self.handle_idle_screen)
+        self.add_event(TTS_PREFETCH_RESPONSE_EVENT, self.handle_tts_prefetch_response)
+        self.add_event(
+            "skill.weather.subscribe-local-forecast",
+            self.handle_subscribe_local_forecast,
+        )
+        self.add_event(
+            "skill.weather.unsubscribe-local-forecast",
+            self.handle_unsubscribe_local_forecast,
+        )
+
+    def _prepare_gui_assets(self):
+        """Rasterize the condition images displayed by a Mark II.
+
+        This runs once, after the skill has loaded, from the event scheduler.
+        """
+        if self.platform != MARK_II:
+            return
+        gui_assets = GuiAssets(
+            self.gui_image_directory, Path(self.file_system.path).joinpath("ui")
+        )
+        try:
+            asset_count = gui_assets.prepare_images(CONDITION_IMAGES)
+        except Exception:
+            self.log.exception("Failed to prepare the GUI assets")
+        else:
+            self.log.info("{} GUI assets ready".format(asset_count))
+
+    def handle_idle_screen(self, _):
+        """Forget the page showing once the idle screen has replaced it."""
+        self.gui_pages.forget()
+
+    def handle_tts_prefetch_response(self, message: Message):
+        """Reuse the text of the prefetched dialogs the TTS service has cached.
+
+        Args:
+            message: the language and the utterances the TTS service cached
+        """
+        confirmed_count = self.rendered_dialogs.confirm(
+            message.data.get("lang", self.lang), message.data.get("utterances", [])
+        )
+        self.log.debug("{} prefetched dialogs cached by TTS".format(confirmed_count))
+
+    def handle_settings_change(self):
+        """Apply changes to the skill settings made on the Mycroft Home website."""
+        self.forecast_cache.set_memory_budget(self.weather_config.cache_memory_budget)
+        self._configure_request_profiler()
+
+    def _configure_request_profiler(self):
+        """Create or remove the profiler of intent requests per the skill settings."""
+        profile_every = self.weather_config.profile_every
+        if not profile_every:
+            self.request_profiler = None
+        elif (
+            self.request_profiler is None
+            or self.request_profiler.sample_every != profile_every
+        ):
+            self.request_profiler = RequestProfiler(
+                Path(self.file_system.path).joinpath("profiles"), profile_every
+            )
+
+    def shutdown(self):
+        """Stop the speech prefetch thread when the skill is unloaded."""
+        self.speech_prefetch_executor.shutdown(wait=False)
 
+    @trace_request
     def handle_get_local_forecast(self, _):
         """Handles a message bus command requesting current local weather information.
 
         Such a request will typically come from a domain external to this skill that
         requires weather information but should not go through the intent system
-        to get it.
+        to get it.  A report retrieved in the last few minutes is good enough.  The
+        response also serves as the update of the local forecast subscribers, so a
+        new report is not pushed to them separately.
         """
-        system_unit = self.config_core.get("system_unit")
         try:
-            weather = self.weather_api.get_weather_for_coordinates(
-                system_unit, self.weather_config.latitude, self.weather_config.longitude, self.lang
-            )
+            weather = self._get_local_weather(push_local_forecast=False)
         except Exception:
             self.log.exception("Unexpected error getting weather.")
             self.bus.emit(Message("skill.weather.local-forecast-failure."))
         else:
             self._emit_local_weather_response(weather)
 
+    def handle_subscribe_local_forecast(self, message: Message):
+        """Start sending the local weather to a consumer whenever it changes.
+
+        The subscription lasts an hour and is renewed by subscribing again.  The
+        current local weather is sent right away.
+
+        Args:
+            message: the request, naming the consumer in its "subscriber" field
+        """
+        subscriber = message.data.get("subscriber")
+        if not subscriber:
+            self.log.warning("Ignoring a local forecast subscription without a name")
+            return
+        if self.local_forecast_subscriptions.subscribe(subscriber):
+            # Leases that expired leave the refresh scheduled until it next runs.
+            self.cancel_scheduled_event(LOCAL_FORECAST_REFRESH_EVENT)
+            self.schedule_repeating_event(
+                self._refresh_local_forecast,
+                None,
+                LOCAL_FORECAST_REFRESH_INTERVAL,
+                name=LOCAL_FORECAST_REFRESH_EVENT,
+            )
+        self._refresh_local_forecast()
+
+    def handle_unsubscribe_local_forecast(self, message: Message):
+        """Stop sending the local weather to a consumer.
+
+        Args:
+            message: the request, naming the consumer in its "subscriber" field
+        """
+        subscriber = message.data.get("subscriber")
+        if not subscriber:
+            self.log.warning("Ignoring a local forecast unsubscription without a name")
+            return
+        if self.local_forecast_subscriptions.unsubscribe(subscriber):
+            self.cancel_scheduled_event(LOCAL_FORECAST_REFRESH_EVENT)
+
+    @trace_request
+    def handle_weather_query(self, message: Message):
+        """Answer a request for weather data from another skill.
+
+        The response is sent even when the query fails, with an error message in
+        place of the forecast, so the requester does not wait in vain.
+
+        Args:
+            message: the query, see skill/query.py for its contents
+        """
+        try:
+            query = WeatherQuery(message.data)
+            if query.location is None:
+                latitude = self.weather_config.latitude
+                longitude = self.weather_config.longitude
+            else:
+                geolocation = get_city_geolocation(query.location)
+                latitude = geolocation["latitude"]
+                longitude = geolocation["longitude"]
+            weather = self._fetch_weather(latitude, longitude)
+        except WeatherQueryError as query_error:
+            response_data = dict(error=str(query_error))
+        except LocationNotFoundError as location_error:
+            response_data = dict(error=str(location_error))
+        except Exception:
+            self.log.exception("Unexpected error answering a weather query")
+            response_data = dict(error="Weather information is unavailable")
+        else:
+            response_data = query.answer(weather)
+        self.bus.emit(message.response(response_data))
+
+    def _refresh_local_forecast(self):
+        """Send the local weather to the subscribers if it changed.
+
+        Refreshing stops once every subscription has ended.
+        """
+        if not self.local_forecast_subscriptions:
+            self.cancel_scheduled_event(LOCAL_FORECAST_REFRESH_EVENT)
+        else:
+            try:
+                weather = self._get_local_weather()
+            except Exception:
+                self.log.exception("Unexpected error refreshing the local weather.")
+            else:
+                self._push_local_forecast(weather)
+
+    def _get_local_weather(self, push_local_forecast: bool = True) -> WeatherReport:
+        """Return the weather at the device's location, from the cache if recent.
+
+        Args:
+            push_local_forecast: send a newly retrieved report to the subscribers
+        """
+        weather = self.forecast_cache.get(
+            self._build_local_forecast_key(), max_age=LOCAL_FORECAST_MAX_AGE
+        )
+        if weather is None:
+            weather = self._fetch_weather(
+                self.weather_config.latitude,
+                self.weather_config.longitude,
+                push_local_forecast=push_local_forecast,
+            )
+
+        return weather
+
+    def _build_local_forecast_key(self) -> tuple:
+        """Build the forecast cache key of the device's location."""
+        return build_forecast_key(
+            self.config_core.get("system_unit"),
+            self.weather_config.latitude,
+            self.weather_config.longitude,
+            self.lang,
+        )
+
+    def _push_local_forecast(self, weather: WeatherReport):
+        """Send the local weather to the subscribers unless they already have it.
+
+        Args:
+            weather: the report for the device's location
+        """
+        event_data = self.local_forecast_subscriptions.filter_update(
+            self._build_local_weather_response(weather)
+        )
+        if event_data is not None:
+            event = Message("skill.weather.local-forecast-obtained", data=event_data)
+            self.bus.emit(event)
+
+    def _match_vocabulary(self, utterance: str) -> FrozenSet[str]:
+        """Find all the vocabulary of the configured language in an utterance.
+
+        The vocabulary and regex files of a language are compiled into a single
+        matcher the first time the language is used.
+
+        Args:
+            utterance: the words spoken by the user
+
+        Returns:
+            the names of the vocabulary files matching the utterance
+        """
+        matcher = self.vocabulary_matchers.get(self.lang)
+        if matcher is None:
+            locale_directory = Path(self.root_dir).joinpath("locale", self.lang)
+            matcher = VocabularyMatcher.from_locale_directory(locale_directory)
+            self.vocabulary_matchers[self.lang] = matcher
+
+        return matcher.match(utterance)
+
+    def _load_translation_table(self) -> TranslationTable:
+        """Return the translations of the configured language, loading them once.
+
+        The table of a language is loaded the first time a word is translated.
+        """
+        translation_table = self.translation_tables.get(self.lang)
+        if translation_table is None:
+            locale_directory = Path(self.root_dir).joinpath("locale", self.lang)
+            translation_table = TranslationTable.from_locale_directory(locale_directory)
+            self.translation_tables[self.lang] = translation_table
+
+        return translation_table
+
+    def _translate_word(self, text: str, data: dict = None) -> str:
+        """Translate a condition, direction or percentage to the configured language.
+
+        Args:
+            text: the name of the dialog to render, like a condition description
+            data: values to substitute in the dialog
+
+        Returns:
+            the translated text
+        """
+        return self._load_translation_table().translate(text, data)
+
     def _emit_local_weather_response(self, weather):
         """Emits an event indicating that the request for local weather was satisfied.
 
-        Responds to the command for local weather retrieval.
+        Responds to the command for local weather retrieval.  The subscribers
+        receive the same event, so it is remembered as the last update sent to them.
         """
-        image_path = self.gui_image_directory.joinpath(weather.current.condition.image)
-        weather_condition_url = "file://" + str(image_path)
-        event_data = dict(
+        event_data = self._build_local_weather_response(weather)
+        self.local_forecast_subscriptions.record_update(event_data)
+        event = Message("skill.weather.local-forecast-obtained", data=event_data)
+        self.bus.emit(event)
+
+    def _build_local_weather_response(self, weather: WeatherReport) -> dict:
+        """Build the data of the event describing the local weather.
+
+        Args:
+            weather: the report for the device's location
+        """
+        weather_condition_url = weather.current.condition.image
+        if not weather_condition_url.startswith("file://"):
+            image_path = self.gui_image_directory.joinpath(weather_condition_url)
+            weather_condition_url = "file://" + str(image_path)
+
+        return dict(
             temperature=weather.current.temperature,
             weather_condition=weather_condition_url,
         )
-        event = Message("skill.weather.local-forecast-obtained", data=event_data)
-        self.bus.emit(event)
 
     @intent_handler(
         AdaptIntent()
@@ -113,6 +414,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("location")
         .optionally("today")
     )
+    @trace_request
+    @profile_request
     def handle_current_weather(self, message: Message):
         """Handle current weather requests such as: what is the weather like?
 
@@ -129,6 +432,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("location")
         .optionally("today")
     )
+    @trace_request
+    @profile_request
     def handle_like_outside(self, message: Message):
         """Handle current weather requests such as: what's it like outside?
 
@@ -144,6 +449,8 @@ class WeatherSkill(MycroftSkill):
         .require("number-days")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_number_days_forecast(self, message: Message):
         """Handle multiple day forecast without specified location.
 
@@ -154,9 +461,10 @@ class WeatherSkill(MycroftSkill):
         Args:
             message: Message Bus event information from the intent parser
         """
-        if self.voc_match(message.data["utterance"], "couple"):
+        vocabulary = self._match_vocabulary(message.data["utterance"])
+        if "couple" in vocabulary:
             days = 2
-        elif self.voc_match(message.data["utterance"], "few"):
+        elif "few" in vocabulary:
             days = 3
         else:
             # Some STT engines hyphenate the day count (i.e. 3-day).  This is not
@@ -172,6 +480,8 @@ class WeatherSkill(MycroftSkill):
         .require("relative-day")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_one_day_forecast(self, message):
         """Handle forecast for a single day.
 
@@ -192,6 +502,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("location")
         .optionally("today")
     )
+    @trace_request
+    @profile_request
     def handle_weather_later(self, message: Message):
         """Handle future weather requests such as: what's the weather later?
 
@@ -208,6 +520,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("relative-day")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_weather_at_time(self, message: Message):
         """Handle future weather requests such as: what's the weather tonight?
 
@@ -223,6 +537,8 @@ class WeatherSkill(MycroftSkill):
         .require("weekend")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_weekend_forecast(self, message: Message):
         """Handle requests for the weekend forecast.
 
@@ -238,6 +554,8 @@ class WeatherSkill(MycroftSkill):
         .require("week")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_week_weather(self, message: Message):
         """Handle weather for week (i.e. seven days).
 
@@ -255,6 +573,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("today")
         .optionally("now")
     )
+    @trace_request
+    @profile_request
     def handle_current_temperature(self, message: Message):
         """Handle requests for current temperature.
 
@@ -275,6 +595,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("location")
         .optionally("unit")
     )
+    @trace_request
+    @profile_request
     def handle_daily_temperature(self, message: Message):
         """Handle simple requests for current temperature.
 
@@ -293,6 +615,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("relative-day")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_hourly_temperature(self, message: Message):
         """Handle requests for current temperature at a relative time.
 
@@ -316,6 +640,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("now")
         .optionally("today")
     )
+    @trace_request
+    @profile_request
     def handle_high_temperature(self, message: Message):
         """Handle a request for the high temperature.
 
@@ -339,6 +665,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("now")
         .optionally("today")
     )
+    @trace_request
+    @profile_request
     def handle_low_temperature(self, message: Message):
         """Handle a request for the high temperature.
 
@@ -358,6 +686,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("location")
         .optionally("today")
     )
+    @trace_request
+    @profile_request
     def handle_is_it_hot(self, message: Message):
         """Handler for temperature requests such as: is it going to be hot today?
 
@@ -375,6 +705,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("relative-day")
         .optionally("today")
     )
+    @trace_request
+    @profile_request
     def handle_how_hot_or_cold(self, message):
         """Handler for temperature requests such as: how cold will it be today?
 
@@ -382,7 +714,8 @@ class WeatherSkill(MycroftSkill):
             message: Message Bus event information from the intent parser
         """
         utterance = message.data["utterance"]
-        temperature_type = "high" if self.voc_match(utterance, "hot") else "low"
+        vocabulary = self._match_vocabulary(utterance)
+        temperature_type = "high" if "hot" in vocabulary else "low"
         self._report_temperature(message, temperature_type)
 
     @intent_handler(
@@ -392,6 +725,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("location")
         .optionally("relative-day")
     )
+    @trace_request
+    @profile_request
     def handle_is_it_windy(self, message: Message):
         """Handler for weather requests such as: is it windy today?
 
@@ -408,6 +743,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("relative-day")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_windy(self, message):
         """Handler for weather requests such as: how windy is it?
 
@@ -419,6 +756,8 @@ class WeatherSkill(MycroftSkill):
     @intent_handler(
         AdaptIntent().require("confirm-query").require("snow").optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_is_it_snowing(self, message: Message):
         """Handler for weather requests such as: is it snowing today?
 
@@ -430,6 +769,8 @@ class WeatherSkill(MycroftSkill):
     @intent_handler(
         AdaptIntent().require("confirm-query").require("clear").optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_is_it_clear(self, message: Message):
         """Handler for weather requests such as: is the sky clear today?
 
@@ -445,6 +786,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("location")
         .optionally("relative-time")
     )
+    @trace_request
+    @profile_request
     def handle_is_it_cloudy(self, message: Message):
         """Handler for weather requests such as: is it cloudy today?
 
@@ -456,6 +799,8 @@ class WeatherSkill(MycroftSkill):
     @intent_handler(
         AdaptIntent().require("confirm-query").require("fog").optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_is_it_foggy(self, message: Message):
         """Handler for weather requests such as: is it foggy today?
 
@@ -467,6 +812,8 @@ class WeatherSkill(MycroftSkill):
     @intent_handler(
         AdaptIntent().require("confirm-query").require("rain").optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_is_it_raining(self, message: Message):
         """Handler for weather requests such as: is it raining today?
 
@@ -476,6 +823,8 @@ class WeatherSkill(MycroftSkill):
         self._report_weather_condition(message, "rain")
 
     @intent_handler("do-i-need-an-umbrella.intent")
+    @trace_request
+    @profile_request
     def handle_need_umbrella(self, message: Message):
         """Handler for weather requests such as: will I need an umbrella today?
 
@@ -490,6 +839,8 @@ class WeatherSkill(MycroftSkill):
         .require("thunderstorm")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_is_it_storming(self, message: Message):
         """Handler for weather requests such as:  is it storming today?
 
@@ -505,6 +856,8 @@ class WeatherSkill(MycroftSkill):
         .require("precipitation")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_next_precipitation(self, message: Message):
         """Handler for weather requests such as: when will it rain next?
 
@@ -516,10 +869,15 @@ class WeatherSkill(MycroftSkill):
         if weather is not None:
             forecast, timeframe = weather.get_next_precipitation(intent_data)
             intent_data.timeframe = timeframe
-            dialog_args = intent_data, self.weather_config, forecast
+            dialog_args = (
+                intent_data,
+                self.weather_config,
+                forecast,
+                weather.get_speakable_days(self.lang),
+            )
             dialog = get_dialog_for_timeframe(intent_data.timeframe, dialog_args)
             dialog.build_next_precipitation_dialog()
-            spoken_percentage = self.translate(
+            spoken_percentage = self._translate_word(
                 "percentage-number", data=dict(number=dialog.data["percent"])
             )
             dialog.data.update(percent=spoken_percentage)
@@ -532,6 +890,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("relative-day")
         .optionally("location")
     )
+    @trace_request
+    @profile_request
     def handle_humidity(self, message: Message):
         """Handler for weather requests such as: how humid is it?
 
@@ -542,13 +902,17 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             intent_weather = weather.get_weather_for_intent(intent_data)
-            dialog_args = intent_data, self.weather_config, intent_weather
+            dialog_args = (
+                intent_data,
+                self.weather_config,
+                intent_weather,
+                weather.get_speakable_days(self.lang),
+            )
             dialog = get_dialog_for_timeframe(intent_data.timeframe, dialog_args)
             dialog.build_humidity_dialog()
             dialog.data.update(
-                percent=self.translate(
-                    "percentage-number",
-                    data=dict(number=dialog.data["percent"])
+                percent=self._translate_word(
+                    "percentage-number", data=dict(number=dialog.data["percent"])
                 )
             )
             self._speak_weather(dialog)
@@ -561,6 +925,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("today")
         .optionally("relative-day")
     )
+    @trace_request
+    @profile_request
     def handle_sunrise(self, message: Message):
         """Handler for weather requests such as: when is the sunrise?
 
@@ -571,11 +937,16 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             intent_weather = weather.get_weather_for_intent(intent_data)
-            dialog_args = intent_data, self.weather_config, intent_weather
+            dialog_args = (
+                intent_data,
+                self.weather_config,
+                intent_weather,
+                weather.get_speakable_days(self.lang),
+            )
             dialog = get_dialog_for_timeframe(intent_data.timeframe, dialog_args)
             dialog.build_sunrise_dialog()
             weather_location = self._build_display_location(intent_data)
-            self._display_sunrise_sunset(intent_weather, weather_location)
+            self._display_sunrise_sunset(weather, intent_weather, weather_location)
             self._speak_weather(dialog)
 
     @intent_handler(
@@ -586,6 +957,8 @@ class WeatherSkill(MycroftSkill):
         .optionally("today")
         .optionally("relative-day")
     )
+    @trace_request
+    @profile_request
     def handle_sunset(self, message: Message):
         """Handler for weather requests such as: when is the sunset?
 
@@ -596,60 +969,56 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             intent_weather = weather.get_weather_for_intent(intent_data)
-            dialog_args = intent_data, self.weather_config, intent_weather
+            dialog_args = (
+                intent_data,
+                self.weather_config,
+                intent_weather,
+                weather.get_speakable_days(self.lang),
+            )
             dialog = get_dialog_for_timeframe(intent_data.timeframe, dialog_args)
             dialog.build_sunset_dialog()
             weather_location = self._build_display_location(intent_data)
-            self._display_sunrise_sunset(intent_weather, weather_location)
+            self._display_sunrise_sunset(weather, intent_weather, weather_location)
             self._speak_weather(dialog)
 
-    def _display_sunrise_sunset(self, forecast: DailyWeather, weather_location: str):
+    @traced()
+    def _display_sunrise_sunset(
+        self, weather: WeatherReport, forecast: DailyWeather, weather_location: str
+    ):
         """Display the sunrise and sunset.
 
         Args:
+            weather: the report containing the forecast
             forecast: daily forecasts to display
             weather_location: the geographical location of the weather
         """
         if self.platform == MARK_II:
-            self._display_sunrise_sunset_mark_ii(forecast, weather_location)
+            display = self._get_weather_display(weather)
+            self._display_sunrise_sunset_mark_ii(display, forecast, weather_location)
 
+    @traced()
     def _display_sunrise_sunset_mark_ii(
-        self, forecast: DailyWeather, weather_location: str
+        self, display: WeatherDisplay, forecast: DailyWeather, weather_location: str
     ):
         """Display the sunrise and sunset on a Mark II device using a grid layout.
 
         Args:
+            display: the screen values prepared for the report
             forecast: daily forecasts to display
             weather_location: the geographical location of the weather
         """
-        self.gui.clear()
-        self.gui["weatherDate"] = forecast.date_time.strftime("%A %b %d")
-        self.gui["weatherLocation"] = weather_location
-        self.gui["sunrise"] = self._format_sunrise_sunset_time(forecast.sunrise)
-        self.gui["sunset"] = self._format_sunrise_sunset_time(forecast.sunset)
-        self.gui["ampm"] = self.config_core["time_format"] == TWELVE_HOUR
-        self.gui.show_page("sunrise_sunset_mark_ii.qml")
-
-    def _format_sunrise_sunset_time(self, date_time: datetime) -> str:
-        """Format a the sunrise or sunset datetime into a string for GUI display.
+        model = dict(
+            display.get_sunrise_sunset(forecast), weatherLocation=weather_location
+        )
+        self.gui_pages.show("sunrise_sunset_mark_ii.qml", model)
 
-        The datetime builtin returns hour in two character format.  Remove the
-        leading zero when present.
+    def _get_weather_display(self, weather: WeatherReport) -> WeatherDisplay:
+        """Return the screen values of a report in the device's time format.
 
         Args:
-            date_time: the sunrise or sunset
-
-        Returns:
-            the value to display on the screen
+            weather: the report to display
         """
-        if self.config_core["time_format"] == TWELVE_HOUR:
-            display_time = date_time.strftime("%I:%M")
-            if display_time.startswith("0"):
-                display_time = display_time[1:]
-        else:
-            display_time = date_time.strftime("%H:%M")
-
-        return display_time
+        return weather.get_display(self.config_core["time_format"])
 
     def _report_current_weather(self, message: Message):
         """Handles all requests for current weather conditions.
@@ -661,53 +1030,54 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             weather_location = self._build_display_location(intent_data)
-            self._display_current_conditions(weather, weather_location)
+            display = self._get_weather_display(weather)
+            self._display_current_conditions(display, weather_location)
             dialog = CurrentDialog(intent_data, self.weather_config, weather.current)
             dialog.build_weather_dialog()
-            self._speak_weather(dialog)
-            if self.gui.connected and self.platform != MARK_II:
-                self._display_more_current_conditions(weather, weather_location)
+            self._speak_weather(dialog, wait=False)
             dialog = CurrentDialog(intent_data, self.weather_config, weather.current)
             dialog.build_high_low_temperature_dialog()
-            self._speak_weather(dialog)
+            if self.gui.connected and self.platform != MARK_II:
+                self._wait_while_speaking()
+                self._display_more_current_conditions(display, weather_location)
+            self._speak_weather(dialog, wait=False)
+            self._wait_while_speaking()
             if self.gui.connected:
                 if self.platform == MARK_II:
-                    self._display_more_current_conditions(weather, weather_location)
-                    sleep(5)
-                    self._display_hourly_forecast(weather, weather_location)
+                    self._display_more_current_conditions(display, weather_location)
+                    display_hourly_forecast = partial(
+                        self._display_hourly_forecast, display, weather_location
+                    )
+                    self.slideshow.start([(5, display_hourly_forecast)])
                 else:
                     four_day_forecast = weather.daily[1:5]
-                    self._display_multi_day_forecast(four_day_forecast, intent_data)
+                    self._display_multi_day_forecast(
+                        display, four_day_forecast, intent_data
+                    )
 
+    @traced()
     def _display_current_conditions(
-        self, weather: WeatherReport, weather_location: str
+        self, display: WeatherDisplay, weather_location: str
     ):
         """Display current weather conditions on a screen.
 
         This is the first screen that shows.  Others will follow.
 
         Args:
-            weather: current weather conditions from Open Weather Maps
+            display: the screen values prepared for the report
             weather_location: the geographical location of the reported weather
         """
         if self.gui.connected:
-            page_name = "current_1_scalable.qml"
-            self.gui.clear()
-            self.gui["currentTemperature"] = weather.current.temperature
-            self.gui["weatherLocation"] = weather_location
-            self.gui["highTemperature"] = weather.current.high_temperature
-            self.gui["lowTemperature"] = weather.current.low_temperature
             if self.platform == MARK_II:
-                self.gui["weatherCondition"] = weather.current.condition.image
-                page_name = page_name.replace("scalable", "mark_ii")
+                page_name = "current_1_mark_ii.qml"
+                model = dict(display.current_mark_ii, weatherLocation=weather_location)
             else:
-                self.gui["weatherCode"] = weather.current.condition.code
-            self.gui.show_page(page_name)
+                page_name = "current_1_scalable.qml"
+                model = dict(display.current_scalable, weatherLocation=weather_location)
+            self.gui_pages.show(page_name, model)
         else:
             self.enclosure.deactivate_mouth_events()
-            self.enclosure.weather_display(
-                weather.current.condition.code, weather.current.temperature
-            )
+            self.enclosure.weather_display(*display.mark_i_current)
 
     def _build_display_location(self, intent_data: WeatherIntent) -> str:
         """Build a string representing the location of the weather for display on GUI
@@ -735,27 +1105,25 @@ class WeatherSkill(MycroftSkill):
 
         return ", ".join(location)
 
+    @traced()
     def _display_more_current_conditions(
-        self, weather: WeatherReport, weather_location: str
+        self, display: WeatherDisplay, weather_location: str
     ):
         """Display current weather conditions on a device that supports a GUI.
 
         This is the second screen that shows for current weather.
 
         Args
-            weather: current weather conditions from Open Weather Maps
+            display: the screen values prepared for the report
             weather_location: geographical location of the reported weather
         """
         page_name = "current_2_scalable.qml"
-        self.gui.clear()
-        self.gui["weatherLocation"] = weather_location
-        self.gui["windSpeed"] = weather.current.wind_speed
-        self.gui["humidity"] = weather.current.humidity
+        model = dict(display.current_details, weatherLocation=weather_location)
         if self.platform == MARK_II:
             page_name = page_name.replace("scalable", "mark_ii")
-            self.gui.replace_page(page_name)
+            self.gui_pages.show(page_name, model, replace=True)
         else:
-            self.gui.show_page(page_name)
+            self.gui_pages.show(page_name, model)
 
     def _report_one_hour_weather(self, message: Message):
         """Handles requests for a one hour forecast.
@@ -771,46 +1139,32 @@ class WeatherSkill(MycroftSkill):
             except IndexError:
                 self.speak_dialog("forty-eight-hours-available")
             else:
-                dialog = HourlyDialog(intent_data, self.weather_config, forecast)
+                dialog = HourlyDialog(
+                    intent_data,
+                    self.weather_config,
+                    forecast,
+                    weather.get_speakable_days(self.lang),
+                )
                 dialog.build_weather_dialog()
                 self._speak_weather(dialog)
 
-    def _display_hourly_forecast(self, weather: WeatherReport, weather_location: str):
+    @traced()
+    def _display_hourly_forecast(self, display: WeatherDisplay, weather_location: str):
         """Display hourly forecast on a device that supports the GUI.
 
         On the Mark II this screen is the final for current weather.  It can
         also be shown when the hourly forecast is requested.
 
-        :param weather: hourly weather conditions from Open Weather Maps
-        """
-        hourly_forecast = []
-        for hour_count, hourly in enumerate(weather.hourly):
-            if not hour_count:
-                continue
-            if hour_count > 4:
-                break
-            if self.config_core["time_format"] == TWELVE_HOUR:
-                # The datetime builtin returns hour in two character format.  Convert
-                # to a integer and back again to remove the leading zero when present.
-                hour = int(hourly.date_time.strftime("%I"))
-                am_pm = hourly.date_time.strftime(" %p")
-                formatted_time = str(hour) + am_pm
-            else:
-                formatted_time = hourly.date_time.strftime("%H:00")
-            hourly_forecast.append(
-                dict(
-                    time=hourly.date_time.strftime(formatted_time),
-                    precipitation=hourly.chance_of_precipitation,
-                    temperature=hourly.temperature,
-                    weatherCondition=hourly.condition.image,
-                )
-            )
-        self.gui["weatherLocation"] = weather_location
-        self.gui["hourlyForecast"] = dict(hours=hourly_forecast)
-        if self.gui.page is not None:
-            self.gui.replace_page("hourly_mark_ii.qml")
-        else:
-            self.gui.show_page("hourly_mark_ii.qml")
+        :param display: the screen values prepared for the report
+        :param weather_location: geographical location of the reported weather
+        """
+        model = dict(
+            weatherLocation=weather_location,
+            hourlyForecast=dict(hours=display.hourly_mark_ii),
+        )
+        self.gui_pages.show(
+            "hourly_mark_ii.qml", model, replace=self.gui.page is not None
+        )
 
     def _report_one_day_forecast(self, message: Message):
         """Handles all requests for a single day forecast.
@@ -822,27 +1176,33 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             forecast = weather.get_forecast_for_date(intent_data)
-            dialogs = self._build_forecast_dialogs([forecast], intent_data)
+            dialogs = self._build_forecast_dialogs(
+                [forecast], intent_data, weather.get_speakable_days(self.lang)
+            )
+            self._speak_dialogs(dialogs)
             if self.platform == MARK_II:
-                self._display_one_day_mark_ii(forecast, intent_data)
-            for dialog in dialogs:
-                self._speak_weather(dialog)
+                display = self._get_weather_display(weather)
+                self._display_one_day_mark_ii(display, forecast, intent_data)
+            self._wait_while_speaking()
 
+    @traced()
     def _display_one_day_mark_ii(
-        self, forecast: DailyWeather, intent_data: WeatherIntent
+        self,
+        display: WeatherDisplay,
+        forecast: DailyWeather,
+        intent_data: WeatherIntent,
     ):
         """Display the forecast for a single day on a Mark II.
 
+        :param display: the screen values prepared for the report
         :param forecast: daily forecasts to display
+        :param intent_data: Parsed intent data
         """
-        self.gui.clear()
-        self.gui["weatherLocation"] = self._build_display_location(intent_data)
-        self.gui["weatherCondition"] = forecast.condition.image
-        self.gui["weatherDate"] = forecast.date_time.strftime("%A %b %d")
-        self.gui["highTemperature"] = forecast.temperature.high
-        self.gui["lowTemperature"] = forecast.temperature.low
-        self.gui["chanceOfPrecipitation"] = str(forecast.chance_of_precipitation)
-        self.gui.show_page("single_day_mark_ii.qml")
+        model = dict(
+            display.get_single_day(forecast),
+            weatherLocation=self._build_display_location(intent_data),
+        )
+        self.gui_pages.show("single_day_mark_ii.qml", model)
 
     def _report_multi_day_forecast(self, message: Message, days: int):
         """Handles all requests for multiple day forecasts.
@@ -857,10 +1217,13 @@ class WeatherSkill(MycroftSkill):
             except IndexError:
                 self.speak_dialog("seven-days-available")
                 forecast = weather.get_forecast_for_multiple_days(7)
-            dialogs = self._build_forecast_dialogs(forecast, intent_data)
-            self._display_multi_day_forecast(forecast, intent_data)
-            for dialog in dialogs:
-                self._speak_weather(dialog)
+            dialogs = self._build_forecast_dialogs(
+                forecast, intent_data, weather.get_speakable_days(self.lang)
+            )
+            self._speak_dialogs(dialogs)
+            display = self._get_weather_display(weather)
+            self._display_multi_day_forecast(display, forecast, intent_data)
+            self._wait_while_speaking()
 
     def _report_weekend_forecast(self, message: Message):
         """Handles requests for a weekend forecast.
@@ -872,28 +1235,37 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             forecast = weather.get_weekend_forecast()
-            dialogs = self._build_forecast_dialogs(forecast, intent_data)
-            self._display_multi_day_forecast(forecast, intent_data)
-            for dialog in dialogs:
-                self._speak_weather(dialog)
+            dialogs = self._build_forecast_dialogs(
+                forecast, intent_data, weather.get_speakable_days(self.lang)
+            )
+            self._speak_dialogs(dialogs)
+            display = self._get_weather_display(weather)
+            self._display_multi_day_forecast(display, forecast, intent_data)
+            self._wait_while_speaking()
 
     def _build_forecast_dialogs(
-        self, forecast: List[DailyWeather], intent_data: WeatherIntent
-    ) -> List[DailyDialog]:
+        self,
+        forecast: List[DailyWeather],
+        intent_data: WeatherIntent,
+        speakable_days: SpeakableDays,
+    ) -> Iterator[DailyDialog]:
         """
         Build the dialogs for each of the forecast days being reported to the user.
 
+        Dialogs are built one at a time as they are consumed, so the first day
+        can be spoken while the others are still being built.
+
         :param forecast: daily forecasts to report
         :param intent_data: information about the intent that was triggered
+        :param speakable_days: the speakable days of the report
         :return: one DailyDialog instance for each day being reported.
         """
-        dialogs = list()
         for forecast_day in forecast:
-            dialog = DailyDialog(intent_data, self.weather_config, forecast_day)
+            dialog = DailyDialog(
+                intent_data, self.weather_config, forecast_day, speakable_days
+            )
             dialog.build_weather_dialog()
-            dialogs.append(dialog)
-
-        return dialogs
+            yield dialog
 
     def _report_week_summary(self, message: Message):
         """Summarize the week's weather rather than giving daily details.
@@ -908,32 +1280,42 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             forecast = weather.get_forecast_for_multiple_days(7)
-            dialogs = self._build_weekly_condition_dialogs(forecast, intent_data)
-            dialogs.append(self._build_weekly_temperature_dialog(forecast, intent_data))
-            self._display_multi_day_forecast(forecast, intent_data)
-            for dialog in dialogs:
-                self._speak_weather(dialog)
+            speakable_days = weather.get_speakable_days(self.lang)
+            dialogs = chain(
+                self._build_weekly_condition_dialogs(
+                    forecast, intent_data, speakable_days
+                ),
+                [self._build_weekly_temperature_dialog(forecast, intent_data)],
+            )
+            self._speak_dialogs(dialogs)
+            display = self._get_weather_display(weather)
+            self._display_multi_day_forecast(display, forecast, intent_data)
+            self._wait_while_speaking()
 
     def _build_weekly_condition_dialogs(
-        self, forecast: List[DailyWeather], intent_data: WeatherIntent
-    ) -> List[WeeklyDialog]:
+        self,
+        forecast: DailyForecastSpan,
+        intent_data: WeatherIntent,
+        speakable_days: SpeakableDays,
+    ) -> Iterator[WeeklyDialog]:
         """Build the dialog communicating a weather condition on days it is forecasted.
 
+        Dialogs are built one at a time as they are consumed.
+
         Args:
             forecast: seven day daily forecast
             intent_data: Parsed intent data
+            speakable_days: the speakable days of the report
 
         Returns:
-            List of dialogs for each condition expected in the coming week.
+            The dialogs for each condition expected in the coming week.
         """
-        dialogs = list()
-        conditions = set([daily.condition.category for daily in forecast])
-        for condition in conditions:
-            dialog = WeeklyDialog(intent_data, self.weather_config, forecast)
+        for condition in forecast.conditions:
+            dialog = WeeklyDialog(
+                intent_data, self.weather_config, forecast, speakable_days
+            )
             dialog.build_condition_dialog(condition=condition)
-            dialogs.append(dialog)
-
-        return dialogs
+            yield dialog
 
     def _build_weekly_temperature_dialog(
         self, forecast: List[DailyWeather], intent_data: WeatherIntent
@@ -952,76 +1334,77 @@ class WeatherSkill(MycroftSkill):
 
         return dialog
 
+    @traced()
     def _display_multi_day_forecast(
-        self, forecast: List[DailyWeather], intent_data: WeatherIntent
+        self,
+        display: WeatherDisplay,
+        forecast: List[DailyWeather],
+        intent_data: WeatherIntent,
     ):
         """Display daily forecast data on devices that support the GUI.
 
         Args:
+            display: the screen values prepared for the report
             forecast: daily forecasts to display
             intent_data: Parsed intent data
         """
         if self.platform == MARK_II:
-            self._display_multi_day_mark_ii(forecast, intent_data)
+            self._display_multi_day_mark_ii(display, forecast, intent_data)
         else:
-            self._display_multi_day_scalable(forecast)
+            self._display_multi_day_scalable(display, forecast)
 
+    @traced()
     def _display_multi_day_mark_ii(
-        self, forecast: List[DailyWeather], intent_data: WeatherIntent
+        self,
+        display: WeatherDisplay,
+        forecast: List[DailyWeather],
+        intent_data: WeatherIntent,
     ):
         """Display daily forecast data on a Mark II.
 
         The Mark II supports displaying four days of a forecast at a time.
 
         Args:
+            display: the screen values prepared for the report
             forecast: daily forecasts to display
             intent_data: Parsed intent data
         """
         page_name = "daily_mark_ii.qml"
-        daily_forecast = []
-        for day in forecast:
-            daily_forecast.append(
-                dict(
-                    weatherCondition=day.condition.image,
-                    day=day.date_time.strftime("%a"),
-                    highTemperature=day.temperature.high,
-                    lowTemperature=day.temperature.low,
-                )
-            )
-        self.gui.clear()
-        self.gui["dailyForecast"] = dict(days=daily_forecast[:4])
-        self.gui["weatherLocation"] = self._build_display_location(intent_data)
-        self.gui.show_page(page_name)
+        daily_forecast = display.get_days_mark_ii(forecast)
+        model = dict(
+            dailyForecast=dict(days=daily_forecast[:4]),
+            weatherLocation=self._build_display_location(intent_data),
+        )
+        self.gui_pages.show(page_name, model)
         if len(forecast) > 4:
-            sleep(15)
-            self.gui.clear()
-            self.gui["dailyForecast"] = dict(days=daily_forecast[4:])
-            self.gui.show_page(page_name)
+            self.slideshow.start(
+                [(15, partial(self._display_more_days_mark_ii, daily_forecast[4:]))]
+            )
 
-    def _display_multi_day_scalable(self, forecast: List[DailyWeather]):
+    @traced()
+    def _display_more_days_mark_ii(self, daily_forecast: List[dict]):
+        """Display the days of a forecast that did not fit on the first page.
+
+        Args:
+            daily_forecast: display data for the remaining days
+        """
+        model = dict(dailyForecast=dict(days=daily_forecast))
+        self.gui_pages.show("daily_mark_ii.qml", model)
+
+    @traced()
+    def _display_multi_day_scalable(
+        self, display: WeatherDisplay, forecast: List[DailyWeather]
+    ):
         """Display daily forecast data on GUI devices other than the Mark II.
 
         The generic layout supports displaying two days of a forecast at a time.
 
         Args:
+            display: the screen values prepared for the report
             forecast: daily forecasts to display
         """
-        page_one_name = "daily_scalable.qml"
-        display_data = []
-        for day_number, day in enumerate(forecast):
-            if day_number == 4:
-                break
-            display_data.append(
-                dict(
-                    weatherCondition=day.condition.image,
-                    highTemperature=day.temperature.high,
-                    lowTemperature=day.temperature.low,
-                    date=day.date_time.strftime("%a"),
-                )
-            )
-        self.gui.clear()
-        self.gui["forecast"] = dict(first=display_data[:4])
-        self.gui.show_page(page_one_name)
+        model = dict(forecast=dict(first=display.get_days_scalable(forecast)))
+        self.gui_pages.show("daily_scalable.qml", model)
 
     def _report_temperature(self, message: Message, temperature_type: str = None):
         """Handles all requests for a temperature.
@@ -1034,7 +1417,12 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             intent_weather = weather.get_weather_for_intent(intent_data)
-            dialog_args = intent_data, self.weather_config, intent_weather
+            dialog_args = (
+                intent_data,
+                self.weather_config,
+                intent_weather,
+                weather.get_speakable_days(self.lang),
+            )
             dialog = get_dialog_for_timeframe(intent_data.timeframe, dialog_args)
             dialog.build_temperature_dialog(temperature_type)
             self._speak_weather(dialog)
@@ -1051,12 +1439,19 @@ class WeatherSkill(MycroftSkill):
         if weather is not None:
             intent_weather = weather.get_weather_for_intent(intent_data)
             dialog = self._build_condition_dialog(
-                intent_weather, intent_data, condition
+                intent_weather,
+                intent_data,
+                condition,
+                weather.get_speakable_days(self.lang),
             )
             self._speak_weather(dialog)
 
     def _build_condition_dialog(
-        self, weather, intent_data: WeatherIntent, condition: str
+        self,
+        weather,
+        intent_data: WeatherIntent,
+        condition: str,
+        speakable_days: SpeakableDays,
     ):
         """Builds a dialog for the requested weather condition.
 
@@ -1064,12 +1459,18 @@ class WeatherSkill(MycroftSkill):
             weather: Current, hourly or daily weather forecast
             intent_data: Parsed intent data
             condition: weather condition requested by the user
+            speakable_days: the speakable days of the report
         """
-        dialog_args = intent_data, self.weather_config, weather
+        dialog_args = intent_data, self.weather_config, weather, speakable_days
         dialog = get_dialog_for_timeframe(intent_data.timeframe, dialog_args)
-        intent_match = self.voc_match(weather.condition.category.lower(), condition)
+        condition_vocabulary = self._match_vocabulary(
+            weather.condition.category.lower()
+        )
+        intent_match = condition in condition_vocabulary
         dialog.build_condition_dialog(intent_match)
-        dialog.data.update(condition=self.translate(weather.condition.description))
+        dialog.data.update(
+            condition=self._translate_word(weather.condition.description)
+        )
 
         return dialog
 
@@ -1083,14 +1484,21 @@ class WeatherSkill(MycroftSkill):
         weather = self._get_weather(intent_data)
         if weather is not None:
             intent_weather = weather.get_weather_for_intent(intent_data)
-            intent_weather.wind_direction = self.translate(
-                intent_weather.wind_direction
+            intent_weather = WeatherOverlay(
+                intent_weather,
+                wind_direction=self._translate_word(intent_weather.wind_direction),
+            )
+            dialog_args = (
+                intent_data,
+                self.weather_config,
+                intent_weather,
+                weather.get_speakable_days(self.lang),
             )
-            dialog_args = intent_data, self.weather_config, intent_weather
             dialog = get_dialog_for_timeframe(intent_data.timeframe, dialog_args)
             dialog.build_wind_dialog()
             self._speak_weather(dialog)
 
+    @traced()
     def _get_intent_data(self, message: Message) -> WeatherIntent:
         """Parse the intent data from the message into data used in the skill.
 
@@ -1106,19 +1514,23 @@ class WeatherSkill(MycroftSkill):
         except ValueError:
             self.speak_dialog("cant-get-forecast")
         else:
-            if self.voc_match(intent_data.utterance, "relative-time"):
+            vocabulary = self._match_vocabulary(intent_data.utterance)
+            if "relative-time" in vocabulary:
                 intent_data.timeframe = HOURLY
-            elif self.voc_match(intent_data.utterance, "later"):
+            elif "later" in vocabulary:
                 intent_data.timeframe = HOURLY
-            elif self.voc_match(intent_data.utterance, "relative-day"):
-                if not self.voc_match(intent_data.utterance, "today"):
+            elif "relative-day" in vocabulary:
+                if "today" not in vocabulary:
                     intent_data.timeframe = DAILY
 
         return intent_data
 
+    @traced()
     def _get_weather(self, intent_data: WeatherIntent) -> WeatherReport:
         """Call the Open Weather Map One Call API to get weather information
 
+        A new request stops any slideshow still showing the previous response.
+
         Args:
             intent_data: Parsed intent data
 
@@ -1126,12 +1538,11 @@ class WeatherSkill(MycroftSkill):
             An object representing the data returned by the API
         """
         weather = None
+        self.slideshow.cancel()
         if intent_data is not None:
             try:
                 latitude, longitude = self._determine_weather_location(intent_data)
-                weather = self.weather_api.get_weather_for_coordinates(
-                    self.config_core.get("system_unit"), latitude, longitude, self.lang
-                )
+                weather = self._fetch_weather(latitude, longitude, intent_data)
             except HTTPError as api_error:
                 self.log.exception("Weather API failure")
                 self._handle_api_error(api_error)
@@ -1146,6 +1557,83 @@ class WeatherSkill(MycroftSkill):
 
         return weather
 
+    @traced()
+    def _fetch_weather(
+        self,
+        latitude: float,
+        longitude: float,
+        intent_data: WeatherIntent = None,
+        push_local_forecast: bool = True,
+    ) -> WeatherReport:
+        """Retrieve the weather for a location and reconcile it with the last report.
+
+        A report retrieved in the last minute, or being retrieved for another
+        request, is used instead of calling the API again.  Unchanged forecast
+        entries are shared with the previous report for the location and an event
+        describing what changed is emitted so consumers only need to redraw what
+        moved.  When the report is new or changed, the dialogs most likely to be
+        requested next are sent to the TTS service from a background thread, so
+        the request does not wait for them to be rendered.
+
+        Args:
+            latitude: the geologic latitude of the weather location
+            longitude: the geologic longitude of the weather location
+            intent_data: the intent requesting the weather, if any
+            push_local_forecast: send a report for the device's location to the
+                local forecast subscribers
+
+        Returns:
+            An object representing the data returned by the API
+        """
+        system_unit = self.config_core.get("system_unit")
+        forecast_key = build_forecast_key(system_unit, latitude, longitude, self.lang)
+        call_api = partial(
+            self.weather_api.get_weather_for_coordinates,
+            system_unit,
+            latitude,
+            longitude,
+            self.lang,
+        )
+        weather, changes = self.forecast_fetcher.fetch(forecast_key, call_api)
+        if changes:
+            event_data = dict(
+                latitude=latitude, longitude=longitude, changes=changes.to_dict()
+            )
+            self.bus.emit(Message("skill.weather.forecast-changed", data=event_data))
+        if intent_data is not None and (changes is None or changes):
+            self.speech_prefetch_executor.submit(
+                self._prefetch_speech, weather, intent_data
+            )
+        if push_local_forecast and forecast_key == self._build_local_forecast_key():
+            self._push_local_forecast(weather)
+
+        return weather
+
+    def _prefetch_speech(self, weather: WeatherReport, intent_data: WeatherIntent):
+        """Render the dialogs likely to be requested next and send them to TTS.
+
+        Runs on the speech prefetch thread.  The rendered text is kept pending
+        until the TTS service confirms it cached the audio.  A failure here must
+        not fail the request.
+
+        Args:
+            weather: the report that was just refreshed
+            intent_data: the intent requesting the weather
+        """
+        try:
+            utterances = []
+            for dialog in build_likely_dialogs(
+                weather, intent_data, self.weather_config
+            ):
+                utterance = self.dialog_renderer.render(dialog.name, dialog.data)
+                self.rendered_dialogs.add_pending(self.lang, dialog, utterance)
+                utterances.append(utterance)
+        except Exception:
+            self.log.exception("Failed to render dialogs for the TTS cache")
+        else:
+            event_data = dict(utterances=utterances, lang=self.lang)
+            self.bus.emit(Message(TTS_PREFETCH_EVENT, data=event_data))
+
     def _handle_api_error(self, exception: HTTPError):
         """Communicate an error condition to the user.
 
@@ -1177,13 +1665,74 @@ class WeatherSkill(MycroftSkill):
 
         return latitude, longitude
 
-    def _speak_weather(self, dialog):
+    @traced()
+    def _speak_weather(self, dialog, wait: bool = True):
         """Instruct device to speak the contents of the specified dialog.
 
+        Dialogs rendered in advance are spoken with the same text that was sent
+        to the TTS cache.
+
         :param dialog: the dialog that will be spoken
+        :param wait: wait for the dialog to be spoken before returning
         """
         self.log.info("Speaking dialog: " + dialog.name)
-        self.speak_dialog(dialog.name, dialog.data, wait=True)
+        meta = dict(dialog=dialog.name, data=dialog.data)
+        self.speak(self._render_dialog(dialog), wait=wait, meta=meta)
+
+    def _speak_dialogs(self, dialogs: Iterable[WeatherDialog]):
+        """Send dialogs to TTS as soon as each one is built.
+
+        The audio service queues utterances and plays them in order, so each
+        utterance is sent without waiting for the previous one to be spoken.  The
+        next dialog is built while the first is synthesized.  Callers wait for
+        the speech to finish with wait_while_speaking() once they have done
+        whatever else the request needs, like updating the screen.
+
+        Depending on the skill settings, several dialogs are merged into each
+        utterance to save TTS round trips and the pauses between utterances.
+
+        :param dialogs: the dialogs to speak, in order
+        """
+        group_size = self.weather_config.sentences_per_utterance
+        for dialog_group in group_dialogs(dialogs, group_size):
+            if len(dialog_group) == 1:
+                self._speak_weather(dialog_group[0], wait=False)
+            else:
+                dialog_names = [dialog.name for dialog in dialog_group]
+                self.log.info("Speaking dialogs: " + ", ".join(dialog_names))
+                utterance = join_sentences(
+                    [self._render_dialog(dialog) for dialog in dialog_group]
+                )
+                self.speak(utterance, wait=False, meta=dict(dialogs=dialog_names))
+
+    def _render_dialog(self, dialog: WeatherDialog) -> str:
+        """Render a dialog to text, reusing the text cached by the TTS service.
+
+        :param dialog: the dialog to render
+        """
+        utterance = self.rendered_dialogs.get(self.lang, dialog)
+        if utterance is None:
+            utterance = self.dialog_renderer.render(dialog.name, dialog.data)
+
+        return utterance
+
+    @traced()
+    def _wait_while_speaking(self):
+        """Wait for the queued dialogs to be spoken."""
+        wait_while_speaking()
+
+    def publish_trace(self, record: dict):
+        """Log the timing of a request, emitting it on the message bus if enabled.
+
+        Requests like the polled local forecast are traced too, so traces are
+        only emitted when the "publish_traces" setting is checked.
+
+        Args:
+            record: the correlation id, duration and spans of the request
+        """
+        self.log.debug("Request trace: " + json.dumps(record))
+        if self.weather_config.publish_traces:
+            self.bus.emit(Message(TRACE_EVENT, data=record))
 
 
 def create_skill():
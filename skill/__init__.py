@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from .api import OpenWeatherMapApi
+from .assets import GuiAssets
+from .cache import build_forecast_key, ForecastCache
 from .config import WeatherConfig
 from .dialog import (
     CurrentDialog,
@@ -21,6 +23,36 @@ from .dialog import (
     WeeklyDialog,
     get_dialog_for_timeframe,
 )
-from .intent import WeatherIntent
-from .weather import CURRENT, DAILY, DailyWeather, HOURLY, WeatherReport
-from .util import LocationNotFoundError
+from .display import TWELVE_HOUR, WeatherDisplay
+from .fetch import ForecastFetcher
+from .gui import GuiPages, IDLE_SCREEN_EVENT
+from .intent import get_city_geolocation, WeatherIntent
+from .profiling import profile_request, RequestProfiler
+from .query import QUERY_EVENT, WeatherQuery, WeatherQueryError
+from .serialization import SerializationError
+from .slideshow import Slideshow
+from .speech import (
+    build_likely_dialogs,
+    group_dialogs,
+    join_sentences,
+    RenderedDialogs,
+    TTS_PREFETCH_EVENT,
+    TTS_PREFETCH_RESPONSE_EVENT,
+)
+from .subscription import LocalForecastSubscriptions
+from .tracing import trace_request, trace_span, TRACE_EVENT, traced
+from .weather import (
+    CONDITION_IMAGES,
+    CURRENT,
+    DAILY,
+    DailyForecastSpan,
+    DailyWeather,
+    HOURLY,
+    ReportChanges,
+    Snapshot,
+    WeatherOverlay,
+    WeatherReport,
+)
+from .translation import TranslationTable
+from .util import get_geolocation, LocationNotFoundError, SpeakableDays
+from .vocabulary import VocabularyMatcher
@@ -23,6 +23,7 @@ provided, precluding us from having to do the conversions.
 
 """
 from mycroft.api import Api
+from .tracing import trace_span
 from .weather import WeatherReport
 
 OPEN_WEATHER_MAP_LANGUAGES = (
@@ -124,7 +125,8 @@ class OpenWeatherMapApi(Api):
             units=measurement_system
         )
         api_request = dict(path="/onecall", query=query_parameters)
-        response = self.request(api_request)
+        with trace_span("OpenWeatherMapApi.onecall"):
+            response = self.request(api_request)
         local_weather = WeatherReport(response)
 
         return local_weather
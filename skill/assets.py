@@ -0,0 +1,122 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Prepare the condition images before they are displayed.
+
+The Mark II shows SVG condition images, which the GUI parses and rasterizes
+every time a page is painted.  Each image is instead rasterized once, at the
+largest size the Mark II pages display it, into a PNG that only needs decoding.
+
+Prepared images are stored in the skill's data directory, under a directory
+named for their height in pixels, and reused until the source file changes.
+Once an image is ready, the condition image paths given to the GUI point to it.
+Rasterizing requires the optional cairosvg package; without it the SVG images
+are used as before.
+"""
+import os
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # cairosvg raises OSError when the cairo library itself is not installed.
+    cairosvg = None
+
+MARK_II_GRID_UNIT = 16
+MARK_II_IMAGE_HEIGHT = MARK_II_GRID_UNIT * 7
+
+_prepared_assets = dict()
+
+
+def count_prepared_assets() -> int:
+    """Return the number of assets the GUI is given the prepared version of.
+
+    The count only grows, so screen values built when it was lower may still
+    hold the path of a source asset.
+    """
+    return len(_prepared_assets)
+
+
+def resolve_asset(relative_path: str) -> str:
+    """Return the path the GUI should load for an image.
+
+    Args:
+        relative_path: the path of the asset relative to the ui directory,
+            e.g. "images/sun.svg"
+
+    Returns:
+        the URL of the prepared asset, or the relative path if there is none
+    """
+    return _prepared_assets.get(relative_path, relative_path)
+
+
+def _is_up_to_date(asset_path: Path, source_path: Path) -> bool:
+    """Determine if a prepared asset was written after its source last changed."""
+    try:
+        return asset_path.stat().st_mtime_ns >= source_path.stat().st_mtime_ns
+    except OSError:
+        return False
+
+
+def _write_atomically(asset_path: Path, contents: bytes):
+    """Write an asset so that a partially written file is never loaded."""
+    asset_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = asset_path.with_name(asset_path.name + ".tmp")
+    temporary_path.write_bytes(contents)
+    os.replace(str(temporary_path), str(asset_path))
+
+
+class GuiAssets:
+    """The prepared versions of the condition images of the skill's GUI."""
+
+    def __init__(self, ui_directory: Path, asset_directory: Path):
+        """Constructor
+
+        :param ui_directory: the skill's ui directory
+        :param asset_directory: where prepared assets are stored between runs
+        """
+        self.ui_directory = ui_directory
+        self.asset_directory = asset_directory
+
+    def prepare_images(
+        self, image_names: Iterable[str], height: int = MARK_II_IMAGE_HEIGHT
+    ) -> int:
+        """Rasterize the SVG images that are not already prepared at a height.
+
+        Args:
+            image_names: the file names of the images in the ui/images directory
+            height: the height of the images in pixels
+
+        Returns:
+            the number of images ready to be displayed as PNG files
+        """
+        if cairosvg is None:
+            return 0
+        image_directory = self.asset_directory.joinpath("images", str(height))
+        image_count = 0
+        for image_name in image_names:
+            svg_path = self.ui_directory.joinpath("images", image_name)
+            png_path = image_directory.joinpath(svg_path.stem + ".png")
+            if not _is_up_to_date(png_path, svg_path):
+                png = cairosvg.svg2png(url=str(svg_path), output_height=height)
+                _write_atomically(png_path, png)
+            self._publish("images/" + svg_path.name, png_path)
+            image_count += 1
+
+        return image_count
+
+    @staticmethod
+    def _publish(relative_path: str, asset_path: Path):
+        """Point the GUI to a prepared asset instead of its source."""
+        _prepared_assets[relative_path] = "file://" + str(asset_path)
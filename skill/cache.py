@@ -0,0 +1,137 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Keep the most recent weather report for each location the skill reports on.
+
+Reports are read-only snapshots (see weather.py), so a cached report can be handed
+to any number of intent handlers at the same time.
+
+Each report remembers when it was stored, so callers that can accept data a few
+minutes old can be answered without calling the API.
+
+The cache can be given a memory budget.  The size of each report is estimated when
+it is stored and the least recently used locations are evicted when the total
+exceeds the budget.  The most recently stored report is never evicted.
+"""
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Optional, Tuple
+
+from .util import estimate_size
+from .weather import ReportChanges, WeatherReport
+
+
+def build_forecast_key(
+    measurement_system: str, latitude: float, longitude: float, lang: str
+) -> tuple:
+    """Build the key identifying the reports for a location in the forecast cache.
+
+    The API returns different values for different measurement systems and
+    languages, so they are part of the key.
+
+    Args:
+        measurement_system: Metric or Imperial measurement units
+        latitude: the geologic latitude of the weather location
+        longitude: the geologic longitude of the weather location
+        lang: the language the report was requested in
+    """
+    return measurement_system, round(latitude, 4), round(longitude, 4), lang
+
+
+class ForecastCache:
+    """The most recent weather report for each requested location.
+
+    Attributes:
+        memory_budget: the maximum estimated size, in bytes, of the cached
+            reports or None for no limit
+        memory_used: the estimated size, in bytes, of the cached reports
+    """
+
+    def __init__(self, memory_budget: int = None):
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self._reports = OrderedDict()
+        self._report_sizes = dict()
+        self._update_times = dict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._reports)
+
+    def get(self, key: tuple, max_age: float = None) -> Optional[WeatherReport]:
+        """Return the last report stored for a location, if there is one.
+
+        Args:
+            key: a key built by build_forecast_key()
+            max_age: the age, in seconds, beyond which a stored report is ignored
+        """
+        with self._lock:
+            report = self._reports.get(key)
+            if report is not None:
+                age = monotonic() - self._update_times[key]
+                if max_age is not None and age > max_age:
+                    report = None
+                else:
+                    self._reports.move_to_end(key)
+
+        return report
+
+    def set_memory_budget(self, memory_budget: Optional[int]):
+        """Change the memory budget, evicting reports if the cache no longer fits.
+
+        Args:
+            memory_budget: the new budget in bytes or None for no limit
+        """
+        with self._lock:
+            self.memory_budget = memory_budget
+            self._enforce_memory_budget()
+
+    def update(
+        self, key: tuple, report: WeatherReport
+    ) -> Tuple[WeatherReport, Optional[ReportChanges]]:
+        """Store a newly retrieved report, reconciling it with the previous one.
+
+        Args:
+            key: a key built by build_forecast_key()
+            report: the report just returned by the API
+
+        Returns:
+            The report to use, which shares unchanged entries with the previous
+            report for the location, and the changes since the previous report.
+            The changes are None when there was no previous report.
+        """
+        with self._lock:
+            previous = self._reports.get(key)
+            if previous is None:
+                changes = None
+            else:
+                report = report.merge(previous)
+                changes = ReportChanges(previous, report)
+            self._reports[key] = report
+            self._reports.move_to_end(key)
+            report_size = estimate_size(report)
+            self.memory_used += report_size - self._report_sizes.get(key, 0)
+            self._report_sizes[key] = report_size
+            self._update_times[key] = monotonic()
+            self._enforce_memory_budget()
+
+        return report, changes
+
+    def _enforce_memory_budget(self):
+        """Evict the least recently used reports until the cache fits its budget."""
+        if self.memory_budget is not None:
+            while len(self._reports) > 1 and self.memory_used > self.memory_budget:
+                key, _ = self._reports.popitem(last=False)
+                self.memory_used -= self._report_sizes.pop(key)
+                del self._update_times[key]
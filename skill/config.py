@@ -17,6 +17,9 @@ CELSIUS = "celsius"
 METRIC = "metric"
 METERS_PER_SECOND = "meters per second"
 MILES_PER_HOUR = "miles per hour"
+DEFAULT_CACHE_MEMORY_BUDGET = 1024
+DEFAULT_SENTENCES_PER_UTTERANCE = 1
+DEFAULT_PROFILE_EVERY = 0
 
 
 class WeatherConfig:
@@ -26,6 +29,18 @@ class WeatherConfig:
         self.core_config = core_config
         self.settings = settings
 
+    @property
+    def cache_memory_budget(self) -> int:
+        """The memory the forecast cache may use, from the skill settings.
+
+        Returns: the budget in bytes; the setting is in kilobytes
+        """
+        budget = self._get_non_negative_int(
+            "cache_memory_budget", DEFAULT_CACHE_MEMORY_BUDGET
+        )
+
+        return budget * 1024
+
     @property
     def city(self):
         """The current value of the city name in the device configuration."""
@@ -51,6 +66,36 @@ class WeatherConfig:
         """The current value of the state name in the device configuration."""
         return self.core_config["location"]["city"]["state"]["name"]
 
+    @property
+    def profile_every(self) -> int:
+        """The number of intent requests per profiled request, from the skill settings.
+
+        Returns: a positive number, or zero when profiling is disabled
+        """
+        return self._get_non_negative_int("profile_every", DEFAULT_PROFILE_EVERY)
+
+    @property
+    def publish_traces(self) -> bool:
+        """Whether request traces are emitted on the message bus, from the settings.
+
+        Returns: True when the setting is checked; the website may send a string
+        """
+        value = self.settings.get("publish_traces", False)
+        if isinstance(value, str):
+            value = value.lower() == "true"
+
+        return bool(value)
+
+    @property
+    def sentences_per_utterance(self) -> int:
+        """The number of dialogs merged into each utterance, from the skill settings.
+
+        Returns: a positive number, or zero to speak a whole forecast at once
+        """
+        return self._get_non_negative_int(
+            "sentences_per_utterance", DEFAULT_SENTENCES_PER_UTTERANCE
+        )
+
     @property
     def speed_unit(self) -> str:
         """Use the core configuration to determine the unit of speed.
@@ -84,3 +129,24 @@ class WeatherConfig:
                 temperature_unit = CELSIUS
 
         return temperature_unit
+
+    def _get_non_negative_int(self, name: str, default: int) -> int:
+        """Read a whole number from the skill settings.
+
+        Settings edited on the website may arrive as strings like "2.0" or
+        "inf".
+
+        Args:
+            name: the name of the setting
+            default: the value used when the setting is missing or not a number
+
+        Returns:
+            the setting, with negative values raised to zero
+        """
+        value = self.settings.get(name, default)
+        try:
+            value = int(float(value))
+        except (OverflowError, TypeError, ValueError):
+            value = default
+
+        return max(value, 0)
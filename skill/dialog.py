@@ -31,23 +31,106 @@ convention was applied to the dialog files:
         location.
 
 The skill class will use the "name" and "data" attributes to pass to the TTS process.
+
+Reports are cached and their entries are shared between refreshes, so the same
+question is often asked of the same forecast entry many times.  The result of
+each deterministic build method is kept in a dialog cache, keyed by the entry the
+dialog describes and its date and time, the build method and its arguments, and
+everything else that shapes the dialog: request specific values laid over the
+entry, language, units, location and the current date.  A repeated
+question copies the cached name and data instead of building them again.
 """
+from collections import OrderedDict
+from datetime import datetime
+from functools import wraps
+from threading import Lock
 from typing import List, Tuple
 
 from mycroft.util.format import join_list, nice_number, nice_time
 from mycroft.util.time import now_local
 from .config import WeatherConfig
 from .intent import WeatherIntent
-from .util import get_speakable_day_of_week, get_time_period
+from .tracing import trace_span, traced
+from .util import get_speakable_day_of_week, get_time_period, SpeakableDays
 from .weather import (
     CURRENT,
     CurrentWeather,
     DAILY,
+    DailyForecastSpan,
     DailyWeather,
     HOURLY,
     HourlyWeather,
+    WeatherOverlay,
 )
 
+DIALOG_CACHE_SIZE = 128
+
+
+class DialogCache:
+    """The names and data of recently built dialogs.
+
+    Entries hold a reference to the weather they describe.  The identity of that
+    object is part of the key and is checked on every hit, so a report that has
+    been garbage collected can never be confused with a new one at the same
+    address.
+    """
+
+    def __init__(self, max_size: int = DIALOG_CACHE_SIZE):
+        self.max_size = max_size
+        self._dialogs = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: tuple, source) -> Tuple[str, dict]:
+        """Return the name and data of a dialog built before, if any.
+
+        Args:
+            key: the key built by the dialog builder
+            source: the weather the dialog describes
+        """
+        with self._lock:
+            entry = self._dialogs.get(key)
+            if entry is None or entry[0] is not source:
+                return None, None
+            self._dialogs.move_to_end(key)
+
+        _, name, data = entry
+
+        return name, dict(data)
+
+    def set(self, key: tuple, source, name: str, data: dict):
+        """Remember a built dialog, dropping the least recently used."""
+        with self._lock:
+            self._dialogs[key] = (source, name, dict(data))
+            self._dialogs.move_to_end(key)
+            while len(self._dialogs) > self.max_size:
+                self._dialogs.popitem(last=False)
+
+
+_dialog_cache = DialogCache()
+
+
+def cached_dialog(build_method):
+    """Reuse the result of a build method called before with the same inputs.
+
+    Only apply this to build methods whose result does not depend on the time
+    of day, as the key only includes the current date.
+    """
+
+    @wraps(build_method)
+    def build_cached_dialog(dialog, *args, **kwargs):
+        with trace_span(build_method.__qualname__):
+            key = dialog.build_cache_key(build_method.__name__, args, kwargs)
+            name, data = _dialog_cache.get(key, dialog.source)
+            if name is None:
+                build_method(dialog, *args, **kwargs)
+                _dialog_cache.set(key, dialog.source, dialog.name, dialog.data)
+            else:
+                dialog.name = name
+                dialog.data = data
+
+    return build_cached_dialog
+
+
 # TODO: MISSING DIALOGS
 #   - current.clear.alternative.local
 #   - current.clouds.alternative.local
@@ -57,12 +140,82 @@ from .weather import (
 class WeatherDialog:
     """Abstract base class for the weather dialog builders."""
 
-    def __init__(self, intent_data: WeatherIntent, config: WeatherConfig):
+    def __init__(
+        self,
+        intent_data: WeatherIntent,
+        config: WeatherConfig,
+        speakable_days: SpeakableDays = None,
+    ):
         self.intent_data = intent_data
         self.config = config
+        self.speakable_days = speakable_days
         self.name = None
         self.data = None
 
+    @property
+    def source(self):
+        """The report entry described by the dialog.
+
+        A request specific overlay is new on every request, so the entry
+        underneath it is used and its overrides become part of the cache key.
+        """
+        if isinstance(self.weather, WeatherOverlay):
+            source = self.weather.snapshot
+        else:
+            source = self.weather
+
+        return source
+
+    @property
+    def overrides(self) -> tuple:
+        """The request specific values laid over the entry, as sorted pairs."""
+        if isinstance(self.weather, WeatherOverlay):
+            overrides = tuple(sorted(self.weather.overrides.items()))
+        else:
+            overrides = ()
+
+        return overrides
+
+    def build_cache_key(self, method_name: str, args: tuple, kwargs: dict) -> tuple:
+        """Build the dialog cache key for a call to a build method."""
+        return (
+            type(self).__name__,
+            method_name,
+            args,
+            tuple(sorted(kwargs.items())),
+            id(self.source),
+            getattr(self.source, "date_time", None),
+            self.overrides,
+            self.intent_data.language,
+            self.intent_data.unit,
+            self.intent_data.location,
+            self.config.country,
+            self.config.temperature_unit,
+            self.config.speed_unit,
+            now_local().date(),
+        )
+
+    def _get_speakable_day(self, date_time: datetime) -> str:
+        """Return the speakable day of week of a forecast date.
+
+        Reads the speakable days table of the report when one was provided.
+        """
+        if self.speakable_days is None:
+            day = get_speakable_day_of_week(date_time)
+        else:
+            day = self.speakable_days.day_of_week(date_time)
+
+        return day
+
+    def _get_time_period(self, date_time: datetime) -> str:
+        """Return the period of the day, like "morning", of a forecast time."""
+        if self.speakable_days is None:
+            time_period = get_time_period(date_time)
+        else:
+            time_period = self.speakable_days.time_period(date_time)
+
+        return time_period
+
     def _add_location(self):
         """Add location information to the dialog."""
         if self.intent_data.location is None:
@@ -90,12 +243,17 @@ class CurrentDialog(WeatherDialog):
     """Weather dialog builder for current weather."""
 
     def __init__(
-        self, intent_data: WeatherIntent, config: WeatherConfig, weather: CurrentWeather
+        self,
+        intent_data: WeatherIntent,
+        config: WeatherConfig,
+        weather: CurrentWeather,
+        speakable_days: SpeakableDays = None,
     ):
-        super().__init__(intent_data, config)
+        super().__init__(intent_data, config, speakable_days)
         self.weather = weather
         self.name = CURRENT
 
+    @cached_dialog
     def build_weather_dialog(self):
         """Build the components necessary to speak current weather."""
         self.name += "-weather"
@@ -106,6 +264,7 @@ class CurrentDialog(WeatherDialog):
         )
         self._add_location()
 
+    @cached_dialog
     def build_high_low_temperature_dialog(self):
         """Build the components necessary to speak high and low temperature."""
         self.name += "-temperature-high-low"
@@ -114,6 +273,7 @@ class CurrentDialog(WeatherDialog):
             low_temperature=self.weather.low_temperature,
         )
 
+    @cached_dialog
     def build_temperature_dialog(self, temperature_type: str):
         """Build the components necessary to speak the current temperature.
 
@@ -133,6 +293,7 @@ class CurrentDialog(WeatherDialog):
         )
         self._add_location()
 
+    @cached_dialog
     def build_condition_dialog(self, intent_match: bool):
         """Select the relevant dialog file for condition based reports.
 
@@ -149,6 +310,7 @@ class CurrentDialog(WeatherDialog):
             )
         self._add_location()
 
+    @traced()
     def build_sunrise_dialog(self):
         """Build the components necessary to speak the sunrise time."""
         if self.intent_data.location is None:
@@ -162,6 +324,7 @@ class CurrentDialog(WeatherDialog):
         self.data = dict(time=nice_time(self.weather.sunrise))
         self._add_location()
 
+    @traced()
     def build_sunset_dialog(self):
         """Build the components necessary to speak the sunset time."""
         if self.intent_data.location is None:
@@ -175,6 +338,7 @@ class CurrentDialog(WeatherDialog):
         self.data = dict(time=nice_time(self.weather.sunset))
         self._add_location()
 
+    @cached_dialog
     def build_wind_dialog(self):
         """Build the components necessary to speak the wind conditions."""
         wind_strength = self.weather.determine_wind_strength(self.config.speed_unit)
@@ -186,6 +350,7 @@ class CurrentDialog(WeatherDialog):
         self.name += "-wind-" + wind_strength
         self._add_location()
 
+    @cached_dialog
     def build_humidity_dialog(self):
         """Build the components necessary to speak the percentage humidity."""
         self.data = dict(percent=self.weather.humidity)
@@ -197,12 +362,17 @@ class HourlyDialog(WeatherDialog):
     """Weather dialog builder for hourly weather."""
 
     def __init__(
-        self, intent_data: WeatherIntent, config: WeatherConfig, weather: HourlyWeather
+        self,
+        intent_data: WeatherIntent,
+        config: WeatherConfig,
+        weather: HourlyWeather,
+        speakable_days: SpeakableDays = None,
     ):
-        super().__init__(intent_data, config)
+        super().__init__(intent_data, config, speakable_days)
         self.weather = weather
         self.name = HOURLY
 
+    @cached_dialog
     def build_weather_dialog(self):
         """Build the components necessary to speak the forecast for a hour."""
         self.name += "-weather"
@@ -213,16 +383,18 @@ class HourlyDialog(WeatherDialog):
         )
         self._add_location()
 
+    @cached_dialog
     def build_temperature_dialog(self, _):
         """Build the components necessary to speak the hourly temperature."""
         self.name += "-temperature"
         self.data = dict(
             temperature=self.weather.temperature,
-            time=get_time_period(self.weather.date_time),
+            time=self._get_time_period(self.weather.date_time),
             temperature_unit=self.intent_data.unit or self.config.temperature_unit,
         )
         self._add_location()
 
+    @cached_dialog
     def build_condition_dialog(self, intent_match: bool):
         """Select the relevant dialog file for condition based reports.
 
@@ -242,6 +414,7 @@ class HourlyDialog(WeatherDialog):
             )
         self._add_location()
 
+    @cached_dialog
     def build_wind_dialog(self):
         """Build the components necessary to speak the wind conditions."""
         wind_strength = self.weather.determine_wind_strength(self.config.speed_unit)
@@ -254,6 +427,7 @@ class HourlyDialog(WeatherDialog):
         self.name += "-wind-" + wind_strength
         self._add_location()
 
+    @cached_dialog
     def build_next_precipitation_dialog(self):
         """Build the components necessary to speak the next chance of rain."""
         if self.weather is None:
@@ -264,8 +438,8 @@ class HourlyDialog(WeatherDialog):
             self.data = dict(
                 percent=self.weather.chance_of_precipitation,
                 precipitation="rain",
-                day=get_speakable_day_of_week(self.weather.date_time),
-                time=get_time_period(self.weather.date_time),
+                day=self._get_speakable_day(self.weather.date_time),
+                time=self._get_time_period(self.weather.date_time),
             )
         self._add_location()
 
@@ -274,23 +448,29 @@ class DailyDialog(WeatherDialog):
     """Weather dialog builder for daily weather."""
 
     def __init__(
-        self, intent_data: WeatherIntent, config: WeatherConfig, weather: DailyWeather
+        self,
+        intent_data: WeatherIntent,
+        config: WeatherConfig,
+        weather: DailyWeather,
+        speakable_days: SpeakableDays = None,
     ):
-        super().__init__(intent_data, config)
+        super().__init__(intent_data, config, speakable_days)
         self.weather = weather
         self.name = DAILY
 
+    @cached_dialog
     def build_weather_dialog(self):
         """Build the components necessary to speak the forecast for a day."""
         self.name += "-weather"
         self.data = dict(
             condition=self.weather.condition.description,
-            day=get_speakable_day_of_week(self.weather.date_time),
+            day=self._get_speakable_day(self.weather.date_time),
             high_temperature=self.weather.temperature.high,
             low_temperature=self.weather.temperature.low,
         )
         self._add_location()
 
+    @cached_dialog
     def build_temperature_dialog(self, temperature_type: str):
         """Build the components necessary to speak the daily temperature.
 
@@ -306,11 +486,12 @@ class DailyDialog(WeatherDialog):
         else:
             self.data = dict(temperature=self.weather.temperature.day)
         self.data.update(
-            day=get_speakable_day_of_week(self.weather.date_time),
+            day=self._get_speakable_day(self.weather.date_time),
             temperature_unit=self.intent_data.unit or self.config.temperature_unit,
         )
         self._add_location()
 
+    @cached_dialog
     def build_condition_dialog(self, intent_match: bool):
         """Select the relevant dialog file for condition based reports.
 
@@ -320,7 +501,7 @@ class DailyDialog(WeatherDialog):
         """
         self.data = dict(
             condition=self.weather.condition.description.lower(),
-            day=get_speakable_day_of_week(self.weather.date_time),
+            day=self._get_speakable_day(self.weather.date_time),
         )
         if intent_match:
             self.name += "-condition-expected"
@@ -330,25 +511,28 @@ class DailyDialog(WeatherDialog):
             )
         self._add_location()
 
+    @cached_dialog
     def build_sunrise_dialog(self):
         """Build the components necessary to speak the sunrise time."""
         self.name += "-sunrise"
         self.data = dict(time=nice_time(self.weather.sunrise))
-        self.data.update(day=get_speakable_day_of_week(self.weather.date_time))
+        self.data.update(day=self._get_speakable_day(self.weather.date_time))
         self._add_location()
 
+    @cached_dialog
     def build_sunset_dialog(self):
         """Build the components necessary to speak the sunset time."""
         self.name += "-sunset"
         self.data = dict(time=nice_time(self.weather.sunset))
-        self.data.update(day=get_speakable_day_of_week(self.weather.date_time))
+        self.data.update(day=self._get_speakable_day(self.weather.date_time))
         self._add_location()
 
+    @cached_dialog
     def build_wind_dialog(self):
         """Build the components necessary to speak the wind conditions."""
         wind_strength = self.weather.determine_wind_strength(self.config.speed_unit)
         self.data = dict(
-            day=get_speakable_day_of_week(self.weather.date_time),
+            day=self._get_speakable_day(self.weather.date_time),
             speed=nice_number(self.weather.wind_speed),
             speed_unit=self.config.speed_unit,
             direction=self.weather.wind_direction,
@@ -356,14 +540,17 @@ class DailyDialog(WeatherDialog):
         self.name += "-wind-" + wind_strength
         self._add_location()
 
+    @cached_dialog
     def build_humidity_dialog(self):
         """Build the components necessary to speak the percentage humidity."""
         self.data = dict(
-            percent=self.weather.humidity, day=get_speakable_day_of_week(self.weather.date_time)
+            percent=self.weather.humidity,
+            day=self._get_speakable_day(self.weather.date_time),
         )
         self.name += "-humidity"
         self._add_location()
 
+    @cached_dialog
     def build_next_precipitation_dialog(self):
         """Build the components necessary to speak the next chance of rain."""
         if self.weather is None:
@@ -374,7 +561,7 @@ class DailyDialog(WeatherDialog):
             self.data = dict(
                 percent=self.weather.chance_of_precipitation,
                 precipitation="rain",
-                day=get_speakable_day_of_week(self.weather.date_time),
+                day=self._get_speakable_day(self.weather.date_time),
             )
         self._add_location()
 
@@ -387,32 +574,39 @@ class WeeklyDialog(WeatherDialog):
         intent_data: WeatherIntent,
         config: WeatherConfig,
         forecast: List[DailyWeather],
+        speakable_days: SpeakableDays = None,
     ):
-        super().__init__(intent_data, config)
+        super().__init__(intent_data, config, speakable_days)
+        if not isinstance(forecast, DailyForecastSpan):
+            forecast = DailyForecastSpan(forecast)
         self.forecast = forecast
         self.name = "weekly"
 
+    @property
+    def source(self):
+        """The forecast described by the dialog."""
+        return self.forecast
+
+    @property
+    def overrides(self) -> tuple:
+        """A span of forecasts is never overlaid."""
+        return ()
+
+    @cached_dialog
     def build_temperature_dialog(self):
         """Build the components necessary to temperature ranges for a week."""
-        low_temperatures = [daily.temperature.low for daily in self.forecast]
-        high_temperatures = [daily.temperature.high for daily in self.forecast]
         self.name += "-temperature"
-        self.data = dict(
-            low_min=min(low_temperatures),
-            low_max=max(low_temperatures),
-            high_min=min(high_temperatures),
-            high_max=max(high_temperatures),
-        )
+        self.data = dict(self.forecast.temperature_range)
 
+    @cached_dialog
     def build_condition_dialog(self, condition: str):
         """Build the components necessary to speak the days of week for a condition."""
         self.name += "-condition"
         self.data = dict(condition=condition)
-        days_with_condition = []
-        for daily in self.forecast:
-            if daily.condition.category == condition:
-                day = get_speakable_day_of_week(daily.date_time)
-                days_with_condition.append(day)
+        days_with_condition = [
+            self._get_speakable_day(daily.date_time)
+            for daily in self.forecast.conditions.get(condition, ())
+        ]
         self.data.update(days=join_list(days_with_condition, "and"))
 
 
@@ -0,0 +1,236 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Prepare the values shown on the weather screens once per report.
+
+Every value on a weather screen comes from the report and the device's time
+format: dates and times formatted with strftime, condition images and Mark I
+condition codes looked up from the icon maps.  Building them on every request
+repeats that work for data that only changes when the report does.  Instead,
+the values of each screen are built the first time it is displayed for a report
+in a time format and kept with the report.
+
+The values are shared by every request using the report, so the dictionaries
+and lists returned here must not be modified.  Screens add the display location
+by copying them into a new model.
+"""
+from typing import Dict, List, Tuple
+
+from .util import memoized_property
+
+TWELVE_HOUR = "half"
+HOURLY_DISPLAY_HOURS = 4
+SCALABLE_DISPLAY_DAYS = 4
+
+
+def format_hour(date_time, twelve_hour: bool) -> str:
+    """Format the hour of an hourly forecast, e.g. "3 PM" or "15:00".
+
+    Args:
+        date_time: the time of the forecast
+        twelve_hour: True when the device uses a twelve hour clock
+
+    Returns:
+        the hour without a leading zero in twelve hour format
+    """
+    if twelve_hour:
+        formatted_hour = date_time.strftime("%I %p").lstrip("0")
+    else:
+        formatted_hour = date_time.strftime("%H:00")
+
+    return formatted_hour
+
+
+def format_time(date_time, twelve_hour: bool) -> str:
+    """Format a time of day, like the sunrise, e.g. "6:32" or "18:32".
+
+    Args:
+        date_time: the time to display
+        twelve_hour: True when the device uses a twelve hour clock
+
+    Returns:
+        the time without a leading zero in twelve hour format
+    """
+    if twelve_hour:
+        formatted_time = date_time.strftime("%I:%M").lstrip("0")
+    else:
+        formatted_time = date_time.strftime("%H:%M")
+
+    return formatted_time
+
+
+class WeatherDisplay:
+    """The values of every weather screen for a report in one time format.
+
+    Each screen is prepared the first time it is requested, so a report only
+    pays for the screens that are actually shown.
+    """
+
+    def __init__(self, weather, time_format: str):
+        """Constructor
+
+        :param weather: the WeatherReport to display
+        :param time_format: the device's time format, "half" or "full"
+        """
+        self.weather = weather
+        self.time_format = time_format
+        self._twelve_hour = time_format == TWELVE_HOUR
+        self._days_mark_ii = dict()
+        self._days_scalable = dict()
+        self._single_days = dict()
+        self._sunrise_sunsets = dict()
+
+    @memoized_property
+    def _current_temperatures(self) -> dict:
+        """The temperatures shown on every current conditions screen."""
+        current = self.weather.current
+        return dict(
+            currentTemperature=current.temperature,
+            highTemperature=current.high_temperature,
+            lowTemperature=current.low_temperature,
+        )
+
+    @memoized_property
+    def current_mark_ii(self) -> dict:
+        """The values of the Mark II current conditions screen."""
+        return dict(
+            self._current_temperatures,
+            weatherCondition=self.weather.current.condition.image,
+        )
+
+    @memoized_property
+    def current_scalable(self) -> dict:
+        """The values of the current conditions screen of other GUI devices."""
+        return dict(
+            self._current_temperatures,
+            weatherCode=self.weather.current.condition.code,
+        )
+
+    @memoized_property
+    def current_details(self) -> dict:
+        """The values of the wind and humidity screen."""
+        current = self.weather.current
+        return dict(windSpeed=current.wind_speed, humidity=current.humidity)
+
+    @memoized_property
+    def mark_i_current(self) -> Tuple[str, int]:
+        """The condition code and temperature shown on a Mark I."""
+        current = self.weather.current
+        return current.condition.code, current.temperature
+
+    @memoized_property
+    def hourly_mark_ii(self) -> List[dict]:
+        """The values of the next four hours on the Mark II hourly screen."""
+        return [
+            self._build_hour_mark_ii(hourly)
+            for hourly in self.weather.hourly[1 : HOURLY_DISPLAY_HOURS + 1]
+        ]
+
+    def get_days_mark_ii(self, forecast) -> List[dict]:
+        """Return the Mark II daily screen values of each day of a forecast.
+
+        Args:
+            forecast: daily forecasts from the report
+        """
+        return [
+            self._get_view(self._days_mark_ii, day, self._build_day_mark_ii)
+            for day in forecast
+        ]
+
+    def get_days_scalable(self, forecast) -> List[dict]:
+        """Return the scalable daily screen values of the first days of a forecast.
+
+        Args:
+            forecast: daily forecasts from the report
+        """
+        return [
+            self._get_view(self._days_scalable, day, self._build_day_scalable)
+            for day in forecast[:SCALABLE_DISPLAY_DAYS]
+        ]
+
+    def get_single_day(self, forecast) -> dict:
+        """Return the values of the Mark II single day screen for a day.
+
+        Args:
+            forecast: a daily forecast from the report
+        """
+        return self._get_view(self._single_days, forecast, self._build_single_day)
+
+    def get_sunrise_sunset(self, forecast) -> dict:
+        """Return the values of the Mark II sunrise and sunset screen for a day.
+
+        Args:
+            forecast: the current weather or a daily forecast from the report
+        """
+        return self._get_view(
+            self._sunrise_sunsets, forecast, self._build_sunrise_sunset
+        )
+
+    @staticmethod
+    def _get_view(views: Dict, forecast, build_view) -> dict:
+        """Return the prepared values of a forecast, building them if missing."""
+        view = views.get(forecast.date_time)
+        if view is None:
+            view = build_view(forecast)
+            views[forecast.date_time] = view
+
+        return view
+
+    def _build_hour_mark_ii(self, hourly) -> dict:
+        """Build the values of one hour on the Mark II hourly screen."""
+        return dict(
+            time=format_hour(hourly.date_time, self._twelve_hour),
+            precipitation=hourly.chance_of_precipitation,
+            temperature=hourly.temperature,
+            weatherCondition=hourly.condition.image,
+        )
+
+    @staticmethod
+    def _build_day_mark_ii(daily) -> dict:
+        """Build the values of one day on the Mark II daily screen."""
+        return dict(
+            weatherCondition=daily.condition.image,
+            day=daily.date_time.strftime("%a"),
+            highTemperature=daily.temperature.high,
+            lowTemperature=daily.temperature.low,
+        )
+
+    @staticmethod
+    def _build_day_scalable(daily) -> dict:
+        """Build the values of one day on the scalable daily screen."""
+        return dict(
+            weatherCondition=daily.condition.image,
+            highTemperature=daily.temperature.high,
+            lowTemperature=daily.temperature.low,
+            date=daily.date_time.strftime("%a"),
+        )
+
+    @staticmethod
+    def _build_single_day(daily) -> dict:
+        """Build the values of the Mark II single day screen."""
+        return dict(
+            weatherCondition=daily.condition.image,
+            weatherDate=daily.date_time.strftime("%A %b %d"),
+            highTemperature=daily.temperature.high,
+            lowTemperature=daily.temperature.low,
+            chanceOfPrecipitation=str(daily.chance_of_precipitation),
+        )
+
+    def _build_sunrise_sunset(self, forecast) -> dict:
+        """Build the values of the Mark II sunrise and sunset screen."""
+        return dict(
+            weatherDate=forecast.date_time.strftime("%A %b %d"),
+            sunrise=format_time(forecast.sunrise, self._twelve_hour),
+            sunset=format_time(forecast.sunset, self._twelve_hour),
+            ampm=self._twelve_hour,
+        )
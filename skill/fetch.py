@@ -0,0 +1,119 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Retrieve weather reports through the forecast cache, sharing API calls.
+
+Intents, the local forecast service and the weather query service all need
+reports, often for the same location at about the same time.  They all get
+them here, so that:
+
+* a report retrieved less than a minute ago is reused instead of requested again
+* requests for a location that is already being retrieved wait for that call
+  instead of making their own
+* the API is called at most a set number of times per minute; beyond that, the
+  last report for the location is used if there is one
+"""
+from collections import deque
+from concurrent.futures import Future
+from threading import Lock
+from time import monotonic
+from typing import Callable, Optional, Tuple
+
+from .cache import ForecastCache
+from .weather import ReportChanges, WeatherReport
+
+MIN_REFRESH_INTERVAL = 60
+API_CALLS_PER_MINUTE = 20
+
+
+class ForecastFetcher:
+    """Retrieve reports, coalescing and rate limiting the calls to the API."""
+
+    def __init__(
+        self,
+        forecast_cache: ForecastCache,
+        min_refresh_interval: float = MIN_REFRESH_INTERVAL,
+        calls_per_minute: int = API_CALLS_PER_MINUTE,
+    ):
+        """Constructor
+
+        :param forecast_cache: the cache the reports are stored in
+        :param min_refresh_interval: seconds during which a report is reused
+        :param calls_per_minute: the most API calls made in any minute
+        """
+        self.forecast_cache = forecast_cache
+        self.min_refresh_interval = min_refresh_interval
+        self.calls_per_minute = calls_per_minute
+        self._call_times = deque()
+        self._pending_calls = dict()
+        self._lock = Lock()
+
+    def fetch(
+        self, key: tuple, call_api: Callable[[], WeatherReport]
+    ) -> Tuple[WeatherReport, Optional[ReportChanges]]:
+        """Return a recent report for a location, calling the API if needed.
+
+        Args:
+            key: a key built by build_forecast_key()
+            call_api: retrieves a new report for the location from the API
+
+        Returns:
+            The report and the changes since the previous report, which are
+            None when there was no previous report.  A report that did not
+            come from a new API call made for this request has no changes.
+        """
+        with self._lock:
+            report = self.forecast_cache.get(key, max_age=self.min_refresh_interval)
+            if report is None and self._is_rate_limited():
+                report = self.forecast_cache.get(key)
+            if report is not None:
+                return report, ReportChanges.unchanged()
+            pending_call = self._pending_calls.get(key)
+            if pending_call is None:
+                pending_call = Future()
+                self._pending_calls[key] = pending_call
+                self._call_times.append(monotonic())
+                calling_thread = True
+            else:
+                calling_thread = False
+
+        if calling_thread:
+            return self._call_api(key, call_api, pending_call)
+        report, _ = pending_call.result()
+
+        return report, ReportChanges.unchanged()
+
+    def _call_api(
+        self, key: tuple, call_api: Callable[[], WeatherReport], pending_call: Future
+    ) -> Tuple[WeatherReport, Optional[ReportChanges]]:
+        """Call the API and hand the result to the requests waiting for it."""
+        try:
+            result = self.forecast_cache.update(key, call_api())
+        except Exception as exception:
+            pending_call.set_exception(exception)
+            raise
+        else:
+            pending_call.set_result(result)
+        finally:
+            with self._lock:
+                del self._pending_calls[key]
+
+        return result
+
+    def _is_rate_limited(self) -> bool:
+        """Determine if the API was called as often as allowed in the last minute."""
+        minute_ago = monotonic() - 60
+        while self._call_times and self._call_times[0] < minute_ago:
+            self._call_times.popleft()
+
+        return len(self._call_times) >= self.calls_per_minute
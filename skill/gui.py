@@ -0,0 +1,107 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Push weather screens to the GUI with as few bus messages as possible.
+
+While a page is showing, every assignment to a SkillGUI key sends all of the
+skill's GUI values over the message bus, and the screen lays itself out again.
+Setting the eight values of a screen one at a time costs eight messages before
+the page even changes.  When no page is showing, assignments are only stored and
+the next page shown sends them all in one message.
+
+Each screen is therefore described by a complete model, a dictionary of GUI
+values, and shown by clearing the GUI, storing the values and showing the page.
+That is one value update and one page change however many values the screen has.
+
+Asking the same question twice shows the same screen again, often with the same
+values.  The model last pushed for the page showing is kept, so when that page is
+requested again the page is neither cleared nor shown again.  Only the values
+that changed are sent, in one message, and nothing is sent when none changed.
+SkillGUI has no way to set values without sending all of them, so the changed
+values are also written to its session data, which it sends with the next page
+shown.  The model is forgotten when the idle screen replaces the skill's page.
+"""
+from threading import Lock
+from typing import Any, Dict
+
+from mycroft.messagebus.message import Message
+
+IDLE_SCREEN_EVENT = "mycroft.device.show.idle"
+
+
+class GuiPages:
+    """Show the skill's pages, each with its complete model."""
+
+    def __init__(self, gui, bus, skill_id: str):
+        """Constructor
+
+        :param gui: the SkillGUI of the skill
+        :param bus: the message bus the skill is connected to
+        :param skill_id: the skill's identifier, which namespaces its GUI values
+        """
+        self.gui = gui
+        self.bus = bus
+        self.skill_id = skill_id
+        self.active_page = None
+        self.active_model = None
+        self._lock = Lock()
+
+    def show(self, page_name: str, model: Dict[str, Any], replace: bool = False):
+        """Show a page with all of its values in a single update.
+
+        If the page is already showing, only the values that changed are sent.
+
+        Args:
+            page_name: the QML file of the page
+            model: every value displayed by the page
+            replace: replace the page showing instead of adding a page
+        """
+        with self._lock:
+            if page_name == self.active_page and self.gui.page == page_name:
+                self._update_values(model)
+            else:
+                self.gui.clear()
+                for key, value in model.items():
+                    self.gui[key] = value
+                if replace:
+                    self.gui.replace_page(page_name)
+                else:
+                    self.gui.show_page(page_name)
+            self.active_page = page_name
+            self.active_model = dict(model)
+
+    def forget(self):
+        """Forget the page showing, so the next page is shown in full."""
+        with self._lock:
+            self.active_page = None
+            self.active_model = None
+
+    def _update_values(self, model: Dict[str, Any]):
+        """Send the values that differ from the model of the page showing.
+
+        Values the new model no longer has are reset, like clearing would do.
+        """
+        changes = {
+            key: value
+            for key, value in model.items()
+            if key not in self.active_model or self.active_model[key] != value
+        }
+        changes.update((key, None) for key in self.active_model if key not in model)
+        if changes:
+            self._get_session_data().update(changes)
+            changes.update(__from=self.skill_id)
+            self.bus.emit(Message("gui.value.set", changes))
+
+    def _get_session_data(self) -> Dict[str, Any]:
+        """Return the values the SkillGUI sends with every page it shows."""
+        return getattr(self.gui, "_SkillGUI__session_data")
@@ -11,11 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Parse the intent into data used by the weather skill."""
+"""Parse the intent into data used by the weather skill.
+
+When the user names a location, looking it up with the Selene geolocation API
+is a network round trip, while extracting a datetime from the utterance is CPU
+bound.  Both are started on a shared thread pool as soon as the intent is
+built.  The datetime is extracted relative to the device's time and moved to
+the timezone of the location once the lookup returns.
+"""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 from mycroft.util.time import now_local
+from .tracing import trace_span
 from .util import (
+    get_relative_utterance_datetime,
     get_utterance_datetime,
     get_geolocation,
     get_tz_info,
@@ -23,11 +33,43 @@ from .util import (
 )
 from .weather import CURRENT
 
+INTENT_RESOLUTION_WORKERS = 4
+
+_resolution_executor = ThreadPoolExecutor(
+    max_workers=INTENT_RESOLUTION_WORKERS, thread_name_prefix="WeatherIntent"
+)
+
+
+def get_city_geolocation(location: str) -> dict:
+    """Look up the city a user or another skill named.
+
+    The Selene geolocation API assumes the location of a city is being
+    requested.  If the user asks "What is the weather in Russia"
+    an error will be raised.
+
+    Args:
+        location: the name of the location
+
+    Returns:
+        the geolocation information of the city
+
+    Raises:
+        LocationNotFoundError if the location is unknown or not a city
+    """
+    geolocation = get_geolocation(location)
+    if geolocation["city"].lower() not in location.lower():
+        raise LocationNotFoundError(location + " is not a city")
+
+    return geolocation
+
 
 class WeatherIntent:
     _geolocation = None
     _intent_datetime = None
     _location_datetime = None
+    _geolocation_future = None
+    _extraction_future = None
+    _extraction_anchor = None
 
     def __init__(self, message, language):
         """Constructor
@@ -40,22 +82,30 @@ class WeatherIntent:
         self.language = language
         self.unit = message.data.get("unit")
         self.timeframe = CURRENT
+        if self.location is not None:
+            self._geolocation_future = _resolution_executor.submit(
+                get_city_geolocation, self.location
+            )
+            self._extraction_anchor = now_local()
+            self._extraction_future = _resolution_executor.submit(
+                get_relative_utterance_datetime,
+                self.utterance,
+                self._extraction_anchor,
+                self.language,
+            )
 
     @property
     def geolocation(self):
         """Lookup the intent location using the Selene API.
 
-        The Selene geolocation API assumes the location of a city is being
-        requested.  If the user asks "What is the weather in Russia"
-        an error will be raised.
+        See get_city_geolocation() for the errors raised.
         """
         if self._geolocation is None:
             if self.location is None:
                 self._geolocation = dict()
             else:
-                self._geolocation = get_geolocation(self.location)
-                if self._geolocation["city"].lower() not in self.location.lower():
-                    raise LocationNotFoundError(self.location + " is not a city")
+                with trace_span("WeatherIntent.geolocation"):
+                    self._geolocation = self._geolocation_future.result()
 
         return self._geolocation
 
@@ -68,11 +118,12 @@ class WeatherIntent:
         configured by the device.
         """
         if self._intent_datetime is None:
-            utterance_datetime = get_utterance_datetime(
-                self.utterance,
-                timezone=self.geolocation.get("timezone"),
-                language=self.language,
-            )
+            if self.location is None:
+                utterance_datetime = get_utterance_datetime(
+                    self.utterance, language=self.language
+                )
+            else:
+                utterance_datetime = self._get_location_utterance_datetime()
             if utterance_datetime is not None:
                 delta = utterance_datetime - self.location_datetime
                 if int(delta / timedelta(days=1)) > 7:
@@ -100,3 +151,27 @@ class WeatherIntent:
                 self._location_datetime = now_local(tz_info)
 
         return self._location_datetime
+
+    def _get_location_utterance_datetime(self):
+        """Join the location lookup and the datetime extraction started earlier.
+
+        The datetime was extracted relative to the device's time.  Its relative
+        form is applied to the current time at the requested location when that
+        gives the same answer: for offsets like "in three hours", or when it is
+        the same date on the device and at the location.  Otherwise, like for
+        "Sunday" asked on a Saturday evening about a place where it is already
+        Sunday, the utterance is parsed again relative to the location's time.
+        """
+        device_datetime, relative_datetime = self._extraction_future.result()
+        utterance_datetime = None
+        if relative_datetime is not None and (
+            relative_datetime.is_time_offset
+            or self._extraction_anchor.date() == self.location_datetime.date()
+        ):
+            utterance_datetime = relative_datetime.anchor_to(self.location_datetime)
+        if device_datetime is not None and utterance_datetime is None:
+            utterance_datetime, _ = get_relative_utterance_datetime(
+                self.utterance, self.location_datetime, self.language
+            )
+
+        return utterance_datetime
@@ -0,0 +1,137 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Profile a sample of the weather requests handled on a live device.
+
+Setting "profile_every" to N in the skill settings runs one intent handler in
+every N under cProfile.  Each profile is written in pstats format to the
+"profiles" directory of the skill's data directory, named after the time and
+the handler, for example:
+
+    python -m pstats 20211019T101502-000010-handle_current_weather.prof
+
+The oldest profiles are deleted when the directory grows beyond its size
+budget.  With the setting at zero, the default, no profiler exists and a
+request only pays for checking that.
+"""
+import cProfile
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+
+PROFILE_DIRECTORY_BUDGET = 5 * 1024 * 1024
+
+
+class RequestProfiler:
+    """Run every Nth request under cProfile and keep the latest profiles."""
+
+    def __init__(
+        self,
+        directory: Path,
+        sample_every: int,
+        directory_budget: int = PROFILE_DIRECTORY_BUDGET,
+    ):
+        """Constructor
+
+        :param directory: where the profiles are written
+        :param sample_every: the number of requests per profiled request
+        :param directory_budget: the bytes the profiles may use on disk
+        """
+        self.directory = directory
+        self.sample_every = sample_every
+        self.directory_budget = directory_budget
+        self._request_count = 0
+        self._count_lock = Lock()
+        self._profile_lock = Lock()
+
+    def run(self, handler, *args, **kwargs):
+        """Call a request handler, profiling it if the request is sampled.
+
+        Only one request is profiled at a time; a sampled request arriving while
+        another is profiled runs without the profiler.
+
+        Args:
+            handler: the function handling the request
+            args: the positional arguments of the handler
+            kwargs: the keyword arguments of the handler
+
+        Returns:
+            the return value of the handler
+        """
+        with self._count_lock:
+            self._request_count += 1
+            request_number = self._request_count
+        if request_number % self.sample_every or not self._profile_lock.acquire(
+            blocking=False
+        ):
+            return handler(*args, **kwargs)
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(handler, *args, **kwargs)
+        finally:
+            self._profile_lock.release()
+            try:
+                self._save_profile(profiler, request_number, handler.__name__)
+            except OSError:
+                # A profile that cannot be written must not fail the request.
+                pass
+
+    def _save_profile(
+        self, profiler: cProfile.Profile, request_number: int, handler_name: str
+    ):
+        """Write a profile to the profile directory, then enforce its budget."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_name = "{:%Y%m%dT%H%M%S}-{:06d}-{}.prof".format(
+            datetime.now(), request_number, handler_name
+        )
+        profiler.dump_stats(str(self.directory.joinpath(file_name)))
+        self._delete_oldest_profiles()
+
+    def _delete_oldest_profiles(self):
+        """Delete the oldest profiles until the directory is within its budget."""
+        profiles = []
+        for path in self.directory.glob("*.prof"):
+            try:
+                status = path.stat()
+            except FileNotFoundError:
+                continue
+            profiles.append((status.st_mtime, status.st_size, path))
+        profiles.sort()
+        directory_size = sum(size for _, size, _ in profiles)
+        for _, size, path in profiles[:-1]:
+            if directory_size <= self.directory_budget:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            directory_size -= size
+
+
+def profile_request(handler):
+    """Pass each request received by a skill's handler to its request profiler.
+
+    The skill's request_profiler attribute is None when profiling is disabled.
+    """
+
+    @wraps(handler)
+    def profiled_handler(skill, *args, **kwargs):
+        profiler = skill.request_profiler
+        if profiler is None:
+            return handler(skill, *args, **kwargs)
+
+        return profiler.run(handler, skill, *args, **kwargs)
+
+    return profiled_handler
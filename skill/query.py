@@ -0,0 +1,141 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Answer weather queries sent by other skills over the message bus.
+
+A skill that needs weather data, like a daily briefing, emits a
+skill.weather.query message rather than calling the weather API itself:
+
+    {
+        "location": "Paris",        # optional, the device's location by default
+        "timeframe": "daily",       # "current" (default), "hourly" or "daily"
+        "count": 3,                 # optional, the number of hours or days
+        "fields": ["temperature"]   # optional, every field by default
+    }
+
+The answer is the skill.weather.query.response message, containing the
+requested fields of each forecast in JSON friendly types, or an "error"
+describing why the query could not be answered.  Queries are answered from the
+same reports as the intents, so they share their cache and API calls.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from .weather import CURRENT, DAILY, HOURLY, Snapshot, WeatherReport
+
+QUERY_EVENT = "skill.weather.query"
+QUERY_TIMEFRAMES = (CURRENT, HOURLY, DAILY)
+
+
+class WeatherQueryError(Exception):
+    """Raised when a weather query is malformed."""
+
+
+def _to_json_value(value):
+    """Convert a forecast attribute to a value that can be sent on the bus."""
+    if isinstance(value, Snapshot):
+        value = _to_json_value(value.fields)
+    elif isinstance(value, dict):
+        value = {name: _to_json_value(item) for name, item in value.items()}
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, (list, tuple)):
+        value = [_to_json_value(item) for item in value]
+
+    return value
+
+
+class WeatherQuery:
+    """A request for weather data received on the message bus.
+
+    Attributes:
+        location: the location of the weather or None for the device's location
+        timeframe: one of "current", "hourly" or "daily"
+        count: the number of hourly or daily forecasts or None for all
+        fields: the forecast fields to return or None for all
+    """
+
+    def __init__(self, data: dict):
+        """Constructor
+
+        :param data: the data of the query message
+
+        :raises WeatherQueryError: if the query is malformed
+        """
+        self.location = data.get("location") or None
+        self.timeframe = data.get("timeframe", CURRENT)
+        if self.timeframe not in QUERY_TIMEFRAMES:
+            raise WeatherQueryError("Unknown timeframe " + str(self.timeframe))
+        self.count = self._parse_count(data.get("count"))
+        self.fields = self._parse_fields(data.get("fields"))
+
+    @staticmethod
+    def _parse_count(count) -> Optional[int]:
+        """Validate the number of forecasts requested."""
+        if count is not None:
+            try:
+                count = int(count)
+            except (TypeError, ValueError):
+                raise WeatherQueryError("count must be a number")
+            if count < 1:
+                raise WeatherQueryError("count must be positive")
+
+        return count
+
+    @staticmethod
+    def _parse_fields(fields) -> Optional[List[str]]:
+        """Validate the names of the fields requested."""
+        if fields is not None:
+            if isinstance(fields, str):
+                fields = [fields]
+            if not isinstance(fields, (list, tuple)) or not all(
+                isinstance(field, str) for field in fields
+            ):
+                raise WeatherQueryError("fields must be a list of names")
+            fields = list(fields)
+
+        return fields
+
+    def answer(self, weather: WeatherReport) -> dict:
+        """Build the response to the query from a report.
+
+        Args:
+            weather: the report for the location of the query
+
+        Returns:
+            the data of the response message
+        """
+        if self.timeframe == CURRENT:
+            forecasts = self._select_fields(weather.current)
+        else:
+            if self.timeframe == HOURLY:
+                entries = weather.hourly
+            else:
+                entries = weather.daily
+            forecasts = [self._select_fields(entry) for entry in entries[: self.count]]
+
+        return dict(
+            timeframe=self.timeframe, timezone=weather.timezone, forecast=forecasts
+        )
+
+    def _select_fields(self, forecast: Snapshot) -> dict:
+        """Return the requested fields of a forecast, always including its time."""
+        fields = forecast.fields
+        if self.fields is not None:
+            fields = {
+                name: value
+                for name, value in fields.items()
+                if name in self.fields or name == "date_time"
+            }
+
+        return _to_json_value(fields)
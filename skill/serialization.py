@@ -0,0 +1,141 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Primitives for the compact binary encoding of weather reports.
+
+An encoded report is laid out as:
+    header: magic bytes and format version
+    string table: every distinct string in the report, stored once
+    body: fixed size records packed with the struct module
+
+Records refer to strings by their position in the string table.  The layout of
+each record is owned by the class it represents (see weather.py).  Bump the
+format version whenever a record layout changes so stale data is rejected rather
+than misread.
+"""
+from struct import Struct, error as StructError
+
+MAGIC = b"OWMR"
+FORMAT_VERSION = 1
+NO_STRING = 0xFFFF
+
+HEADER_LAYOUT = Struct("<4sB")
+COUNT_LAYOUT = Struct("<H")
+STRING_LENGTH_LAYOUT = Struct("<I")
+
+
+class SerializationError(ValueError):
+    """Raise when encoded report data cannot be decoded."""
+
+    pass
+
+
+class BinaryWriter:
+    """Accumulates packed records and the string table for an encoded report."""
+
+    def __init__(self):
+        self.body = bytearray()
+        self.strings = dict()
+
+    def pack(self, layout: Struct, *values):
+        """Append a record to the body of the encoding.
+
+        Args:
+            layout: the struct describing the record
+            values: the values of the record fields, in layout order
+        """
+        self.body += layout.pack(*values)
+
+    def string(self, value: str) -> int:
+        """Add a string to the string table.
+
+        Args:
+            value: the string to add, None is allowed
+
+        Returns:
+            the string table index to store in a record
+        """
+        if value is None:
+            index = NO_STRING
+        else:
+            index = self.strings.setdefault(value, len(self.strings))
+            if index >= NO_STRING:
+                raise SerializationError("Too many distinct strings to encode")
+
+        return index
+
+    def getvalue(self) -> bytes:
+        """Assemble the header, string table and body into the final encoding."""
+        encoded = bytearray(HEADER_LAYOUT.pack(MAGIC, FORMAT_VERSION))
+        encoded += COUNT_LAYOUT.pack(len(self.strings))
+        for value in self.strings:
+            encoded_value = value.encode("utf-8")
+            encoded += STRING_LENGTH_LAYOUT.pack(len(encoded_value))
+            encoded += encoded_value
+        encoded += self.body
+
+        return bytes(encoded)
+
+
+class BinaryReader:
+    """Reads records from a report encoded by a BinaryWriter."""
+
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.offset = 0
+        magic, version = self.unpack(HEADER_LAYOUT)
+        if magic != MAGIC:
+            raise SerializationError("Data is not an encoded weather report")
+        if version != FORMAT_VERSION:
+            raise SerializationError(
+                "Unsupported weather report format version {}".format(version)
+            )
+        self.strings = self._read_string_table()
+
+    def _read_string_table(self) -> list:
+        """Decode the string table that follows the header."""
+        strings = []
+        (string_count,) = self.unpack(COUNT_LAYOUT)
+        for _ in range(string_count):
+            (length,) = self.unpack(STRING_LENGTH_LAYOUT)
+            end = self.offset + length
+            strings.append(str(self.data[self.offset : end], "utf-8"))
+            self.offset = end
+
+        return strings
+
+    def unpack(self, layout: Struct) -> tuple:
+        """Read the next record from the encoding.
+
+        Args:
+            layout: the struct describing the record
+
+        Returns:
+            the values of the record fields, in layout order
+        """
+        try:
+            values = layout.unpack_from(self.data, self.offset)
+        except StructError:
+            raise SerializationError("Encoded weather report is truncated")
+        self.offset += layout.size
+
+        return values
+
+    def string(self, index: int) -> str:
+        """Look up a string table entry referenced by a record."""
+        if index == NO_STRING:
+            return None
+        try:
+            return self.strings[index]
+        except IndexError:
+            raise SerializationError("Invalid string reference in weather report")
@@ -0,0 +1,100 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Show a sequence of GUI pages without holding the intent handler thread.
+
+Some responses show more than one screen, like the hourly forecast after the
+current conditions on a Mark II.  Rather than sleeping between screens, each
+screen is shown by an event scheduled with the skill's event scheduler, so the
+intent handler returns as soon as the speech is done.  Starting a new slideshow
+replaces the one in progress.
+"""
+from collections import deque
+from threading import Lock
+from typing import Callable, Iterable, Tuple
+
+SLIDESHOW_EVENT_NAME = "WeatherSlideshow"
+
+
+class Slideshow:
+    """Show GUI pages one after another at timed intervals."""
+
+    def __init__(
+        self,
+        schedule_event: Callable,
+        cancel_scheduled_event: Callable,
+        event_name: str = SLIDESHOW_EVENT_NAME,
+    ):
+        """Constructor
+
+        :param schedule_event: MycroftSkill.schedule_event of the skill
+        :param cancel_scheduled_event: MycroftSkill.cancel_scheduled_event
+        :param event_name: prefix of the names of the scheduled events
+        """
+        self.schedule_event = schedule_event
+        self.cancel_scheduled_event = cancel_scheduled_event
+        self.event_name = event_name
+        self._slides = deque()
+        self._event_count = 0
+        self._scheduled_event = None
+        self._lock = Lock()
+
+    def start(self, slides: Iterable[Tuple[float, Callable]]):
+        """Show a sequence of pages, replacing any slideshow in progress.
+
+        Args:
+            slides: for each page, the seconds to wait after the previous page
+                and a function that shows the page
+        """
+        with self._lock:
+            self._cancel_scheduled_event()
+            self._slides = deque(slides)
+            self._schedule_next_slide()
+
+    def cancel(self):
+        """Stop the slideshow in progress, if any, leaving the current page up."""
+        with self._lock:
+            self._cancel_scheduled_event()
+            self._slides.clear()
+
+    def _schedule_next_slide(self):
+        """Schedule the event that will show the next page."""
+        if self._slides:
+            self._event_count += 1
+            self._scheduled_event = "{}-{}".format(self.event_name, self._event_count)
+            delay, _ = self._slides[0]
+            self.schedule_event(
+                self._show_next_slide,
+                delay,
+                data=dict(slide=self._event_count),
+                name=self._scheduled_event,
+            )
+
+    def _cancel_scheduled_event(self):
+        """Cancel the event scheduled to show the next page."""
+        if self._scheduled_event is not None:
+            self.cancel_scheduled_event(self._scheduled_event)
+            self._scheduled_event = None
+
+    def _show_next_slide(self, message):
+        """Show the next page and schedule the one after it.
+
+        Events fired for a slideshow that has since been replaced are ignored.
+        """
+        with self._lock:
+            if message.data.get("slide") != self._event_count or not self._slides:
+                return
+            self._scheduled_event = None
+            _, show_slide = self._slides.popleft()
+            show_slide()
+            self._schedule_next_slide()
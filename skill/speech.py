@@ -0,0 +1,187 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Render the dialogs the user is most likely to hear before they are requested.
+
+Synthesizing speech is the slowest step between a question and its answer.  After
+a report is refreshed, the next sentences are very likely to be the current
+weather, today's high and low and tomorrow's forecast.  Those dialogs are
+rendered to text right away and the text is sent to the TTS service in a
+prefetch event so it can synthesize and cache the audio ahead of time.
+
+Dialog files contain several phrasings and rendering picks one at random.  A TTS
+service that cached the audio replies with the utterances it cached, and only
+then is the same text spoken when the dialog is requested.  Without a reply,
+nothing is kept and every dialog is rendered again with a random phrasing.  A
+confirmed dialog whose name and data do not change is spoken with the same
+phrasing until its text is dropped from the cache.
+
+Forecasts spanning several days produce one dialog per day.  Each utterance is a
+separate TTS request followed by a pause, so dialogs can also be merged into
+utterances of a few sentences each.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Iterable, Iterator, List, Optional
+
+from .config import WeatherConfig
+from .dialog import CurrentDialog, DailyDialog, WeatherDialog
+from .intent import WeatherIntent
+from .weather import WeatherReport
+
+RENDERED_DIALOG_CACHE_SIZE = 64
+SENTENCE_TERMINATORS = (".", "!", "?", "。")
+TTS_PREFETCH_EVENT = "skill.weather.tts-prefetch"
+TTS_PREFETCH_RESPONSE_EVENT = TTS_PREFETCH_EVENT + ".response"
+
+
+def build_likely_dialogs(
+    weather: WeatherReport, intent_data: WeatherIntent, config: WeatherConfig
+) -> List[WeatherDialog]:
+    """Build the dialogs most likely to be spoken next for a report.
+
+    Args:
+        weather: the report that was just refreshed
+        intent_data: the intent that triggered the refresh
+        config: the weather configuration of the device
+
+    Returns:
+        the current weather, high and low temperature and tomorrow's forecast
+    """
+    speakable_days = weather.get_speakable_days(intent_data.language)
+    current_weather = CurrentDialog(intent_data, config, weather.current)
+    current_weather.build_weather_dialog()
+    high_low = CurrentDialog(intent_data, config, weather.current)
+    high_low.build_high_low_temperature_dialog()
+    tomorrow = DailyDialog(intent_data, config, weather.tomorrow, speakable_days)
+    tomorrow.build_weather_dialog()
+
+    return [current_weather, high_low, tomorrow]
+
+
+def group_dialogs(
+    dialogs: Iterable[WeatherDialog], group_size: int
+) -> Iterator[List[WeatherDialog]]:
+    """Group dialogs to be spoken together, keeping them in order.
+
+    Groups are yielded as soon as they are complete, so the first group can be
+    spoken while the remaining dialogs are built.
+
+    Args:
+        dialogs: the dialogs to speak
+        group_size: the number of dialogs in each group; zero for a single group
+
+    Returns:
+        lists of consecutive dialogs; the last one may be shorter
+    """
+    group = []
+    for dialog in dialogs:
+        group.append(dialog)
+        if len(group) == group_size:
+            yield group
+            group = []
+    if group:
+        yield group
+
+
+def join_sentences(sentences: List[str]) -> str:
+    """Join rendered dialogs into one utterance, ending each with a full stop.
+
+    Args:
+        sentences: the rendered text of each dialog
+
+    Returns:
+        a single utterance containing every sentence
+    """
+    terminated_sentences = []
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if sentence and not sentence.endswith(SENTENCE_TERMINATORS):
+            sentence += "."
+        terminated_sentences.append(sentence)
+
+    return " ".join(terminated_sentences)
+
+
+class RenderedDialogs:
+    """The text rendered for recent dialogs whose audio was cached by TTS.
+
+    Rendered text is pending until the TTS service confirms it cached the audio.
+    Only confirmed text is reused when the dialog is spoken.
+    """
+
+    def __init__(self, max_size: int = RENDERED_DIALOG_CACHE_SIZE):
+        self.max_size = max_size
+        self._pending = OrderedDict()
+        self._utterances = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _build_key(language: str, dialog: WeatherDialog) -> tuple:
+        """Build the key identifying the rendered text of a dialog."""
+        return language, dialog.name, tuple(sorted(dialog.data.items()))
+
+    def _add(self, utterances: OrderedDict, key: tuple, utterance: str):
+        """Add text to a cache, dropping the least recently used."""
+        utterances[key] = utterance
+        utterances.move_to_end(key)
+        while len(utterances) > self.max_size:
+            utterances.popitem(last=False)
+
+    def get(self, language: str, dialog: WeatherDialog) -> Optional[str]:
+        """Return the text rendered for a dialog, if TTS cached its audio.
+
+        Args:
+            language: the language the dialog was rendered in
+            dialog: a dialog with its name and data built
+        """
+        key = self._build_key(language, dialog)
+        with self._lock:
+            utterance = self._utterances.get(key)
+            if utterance is not None:
+                self._utterances.move_to_end(key)
+
+        return utterance
+
+    def add_pending(self, language: str, dialog: WeatherDialog, utterance: str):
+        """Remember the text rendered for a dialog until TTS confirms it.
+
+        Args:
+            language: the language the dialog was rendered in
+            dialog: a dialog with its name and data built
+            utterance: the rendered text
+        """
+        key = self._build_key(language, dialog)
+        with self._lock:
+            self._add(self._pending, key, utterance)
+
+    def confirm(self, language: str, utterances: Iterable[str]) -> int:
+        """Keep the pending text of the utterances TTS cached the audio for.
+
+        Args:
+            language: the language the utterances were rendered in
+            utterances: the utterances the TTS service cached
+
+        Returns:
+            the number of dialogs whose text is now reused when spoken
+        """
+        cached_utterances = set(utterances)
+        confirmed_count = 0
+        with self._lock:
+            for key, utterance in list(self._pending.items()):
+                if key[0] == language and utterance in cached_utterances:
+                    del self._pending[key]
+                    self._add(self._utterances, key, utterance)
+                    confirmed_count += 1
+
+        return confirmed_count
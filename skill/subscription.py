@@ -0,0 +1,116 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Keep track of the consumers subscribed to local forecast updates.
+
+Idle screens and other skills that show the local weather used to poll for it.
+Instead, a consumer subscribes once and the skill sends the local forecast
+whenever it changes.  A subscription is a lease: it ends when it is not renewed
+in time, so a consumer that goes away without unsubscribing does not keep the
+skill refreshing the forecast forever.
+"""
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+SUBSCRIPTION_LEASE = 3600
+
+
+class LocalForecastSubscriptions:
+    """The consumers of local forecast updates and the last update sent to them."""
+
+    def __init__(self, lease: float = SUBSCRIPTION_LEASE):
+        """Constructor
+
+        :param lease: the seconds a subscription lasts unless renewed
+        """
+        self.lease = lease
+        self._expiry_times = dict()
+        self._last_update = None
+        self._lock = Lock()
+
+    def __bool__(self):
+        with self._lock:
+            self._end_expired_leases()
+            return bool(self._expiry_times)
+
+    def subscribe(self, subscriber: str) -> bool:
+        """Start or renew the subscription of a consumer.
+
+        Args:
+            subscriber: a name identifying the consumer, e.g. its skill id
+
+        Returns:
+            True if there were no subscriptions before this one
+        """
+        with self._lock:
+            self._end_expired_leases()
+            first_subscription = not self._expiry_times
+            self._expiry_times[subscriber] = monotonic() + self.lease
+            self._last_update = None
+
+        return first_subscription
+
+    def unsubscribe(self, subscriber: str) -> bool:
+        """End the subscription of a consumer.
+
+        Args:
+            subscriber: the name the consumer subscribed with
+
+        Returns:
+            True if no subscriptions remain
+        """
+        with self._lock:
+            self._expiry_times.pop(subscriber, None)
+            self._end_expired_leases()
+            if not self._expiry_times:
+                self._last_update = None
+
+            return not self._expiry_times
+
+    def filter_update(self, update: dict) -> Optional[dict]:
+        """Decide if a local forecast update should be sent to the subscribers.
+
+        Args:
+            update: the data of the local forecast event
+
+        Returns:
+            the update if there are subscribers and it differs from the last
+            update sent to them, otherwise None
+        """
+        with self._lock:
+            self._end_expired_leases()
+            if not self._expiry_times or update == self._last_update:
+                update = None
+            else:
+                self._last_update = update
+
+        return update
+
+    def record_update(self, update: dict):
+        """Remember an update the subscribers received in a response to a request.
+
+        Args:
+            update: the data of the local forecast event
+        """
+        with self._lock:
+            self._end_expired_leases()
+            if self._expiry_times:
+                self._last_update = update
+
+    def _end_expired_leases(self):
+        """Forget the subscriptions that were not renewed in time."""
+        now = monotonic()
+        for subscriber, expiry_time in list(self._expiry_times.items()):
+            if expiry_time < now:
+                del self._expiry_times[subscriber]
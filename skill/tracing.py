@@ -0,0 +1,143 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure where the time goes while the skill answers a request.
+
+Each intent or bus request handled by the skill is traced under a correlation
+id.  The stages of the answer, like retrieving the weather, building dialogs,
+updating the screen and speaking, are recorded as spans: a name, the time the
+stage started relative to the start of the request and how long it took.  When
+the handler returns, the whole trace is published as a single record.
+
+Traces are kept per thread, so requests handled at the same time do not mix.
+Work done on other threads, like the geolocation lookup, is measured by the
+time the request thread spends waiting for it.  Outside of a traced request,
+spans cost a thread local lookup and record nothing.
+"""
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from uuid import uuid4
+
+TRACE_EVENT = "skill.weather.trace"
+
+_active_traces = threading.local()
+
+
+class RequestTrace:
+    """The spans recorded while handling one request.
+
+    Attributes:
+        correlation_id: a unique identifier of the request
+        request: the name of the handler that received the request
+        spans: the name, start and duration in seconds of each recorded stage
+    """
+
+    def __init__(self, request: str):
+        self.correlation_id = uuid4().hex
+        self.request = request
+        self.spans = []
+        self.start = perf_counter()
+        self.end = None
+
+    def add_span(self, name: str, start: float, end: float):
+        """Record a stage of the request.
+
+        Args:
+            name: the name of the stage
+            start: the perf_counter() value when the stage started
+            end: the perf_counter() value when the stage ended
+        """
+        self.spans.append((name, start - self.start, end - start))
+
+    def to_dict(self) -> dict:
+        """Build the record of the trace, with times in milliseconds."""
+        return dict(
+            correlation_id=self.correlation_id,
+            request=self.request,
+            duration=round(((self.end or perf_counter()) - self.start) * 1000, 3),
+            spans=[
+                dict(
+                    name=name,
+                    start=round(start * 1000, 3),
+                    duration=round(duration * 1000, 3),
+                )
+                for name, start, duration in self.spans
+            ],
+        )
+
+
+def get_active_trace():
+    """Return the trace of the request handled by the current thread, if any."""
+    return getattr(_active_traces, "trace", None)
+
+
+@contextmanager
+def trace_span(name: str):
+    """Record the code run inside the context as a stage of the current request.
+
+    Args:
+        name: the name of the stage
+    """
+    trace = get_active_trace()
+    if trace is None:
+        yield
+    else:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            trace.add_span(name, start, perf_counter())
+
+
+def traced(name: str = None):
+    """Record each call of the decorated function as a stage of the request.
+
+    Args:
+        name: the name of the stage, the qualified function name by default
+    """
+
+    def decorator(function):
+        span_name = name or function.__qualname__
+
+        @wraps(function)
+        def traced_function(*args, **kwargs):
+            with trace_span(span_name):
+                return function(*args, **kwargs)
+
+        return traced_function
+
+    return decorator
+
+
+def trace_request(handler):
+    """Trace each request received by a skill's handler.
+
+    When the handler returns, the trace record is passed to the skill's
+    publish_trace() method.
+    """
+
+    @wraps(handler)
+    def traced_handler(skill, *args, **kwargs):
+        enclosing_trace = get_active_trace()
+        trace = RequestTrace(handler.__name__)
+        _active_traces.trace = trace
+        try:
+            return handler(skill, *args, **kwargs)
+        finally:
+            trace.end = perf_counter()
+            _active_traces.trace = enclosing_trace
+            skill.publish_trace(trace.to_dict())
+
+    return traced_handler
@@ -0,0 +1,102 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Translate the words the skill localizes on every request with a dict lookup.
+
+Weather conditions, compass directions and percentages are translated in nearly
+every response.  MycroftSkill.translate() renders a dialog file for each of them.
+Instead, the condition, direction and percentage dialogs of a language are read
+from its locale directory once and kept in a table.
+
+Lookups follow the rules of the mycroft dialog renderer: a dialog with several
+phrasings picks one at random and a word without a dialog file is returned with
+dots replaced by spaces.
+"""
+import random
+from pathlib import Path
+from typing import Dict, List
+
+TRANSLATED_DIALOG_DIRECTORIES = ("dialog/condition", "dialog/direction")
+TRANSLATED_DIALOG_FILES = ("dialog/percentage-number.dialog",)
+
+
+def _parse_dialog(text: str) -> List[str]:
+    """Return the phrasings in the contents of a dialog file."""
+    return [
+        line.strip()
+        for line in text.splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+
+
+class TranslationTable:
+    """The translations of conditions, directions and percentages in a language."""
+
+    def __init__(self, templates: Dict[str, List[str]]):
+        """Constructor
+
+        :param templates: the phrasings of each dialog, keyed by dialog name
+        """
+        self.templates = {
+            name: phrasings[0] if len(phrasings) == 1 else tuple(phrasings)
+            for name, phrasings in templates.items()
+            if phrasings
+        }
+
+    @classmethod
+    def from_locale_directory(cls, locale_directory: Path):
+        """Build the table from the dialog files of a language.
+
+        A language without locale files gets an empty table, which returns every
+        word untranslated.
+
+        Args:
+            locale_directory: the locale directory of the language, e.g. locale/en-us
+        """
+        dialog_paths = []
+        for directory in TRANSLATED_DIALOG_DIRECTORIES:
+            dialog_paths.extend(
+                sorted(locale_directory.joinpath(directory).glob("*.dialog"))
+            )
+        for relative_path in TRANSLATED_DIALOG_FILES:
+            dialog_paths.append(locale_directory.joinpath(relative_path))
+        templates = dict()
+        for dialog_path in dialog_paths:
+            if dialog_path.is_file():
+                text = dialog_path.read_text(encoding="utf-8")
+                templates[dialog_path.stem] = _parse_dialog(text)
+
+        return cls(templates)
+
+    def translate(self, text: str, data: dict = None) -> str:
+        """Translate a word or render a dialog with a single value.
+
+        Args:
+            text: the name of the dialog, like a condition description
+            data: values to substitute in the dialog
+
+        Returns:
+            the translated text
+        """
+        template = self.templates.get(text)
+        if template is None:
+            translation = text.replace(".", " ")
+        else:
+            if isinstance(template, tuple):
+                template = random.choice(template)
+            if data:
+                translation = template.format_map(data)
+            else:
+                translation = template
+
+        return translation
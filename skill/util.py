@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Utility functions for the weather skill."""
+from collections import OrderedDict
 from datetime import datetime, timedelta, tzinfo
+from sys import getsizeof
+from threading import Lock, RLock
 from time import time
+from typing import List, Optional, Tuple
 
 import pytz
 
@@ -23,12 +27,198 @@ from mycroft.util.parse import extract_datetime
 from mycroft.util.time import now_local
 
 
+UTTERANCE_DATETIME_CACHE_SIZE = 256
+_NOT_CACHED = object()
+
+
 class LocationNotFoundError(ValueError):
     """Raise when the API cannot find the requested location."""
 
     pass
 
 
+class RelativeDatetime:
+    """A datetime extracted from an utterance, expressed relative to when it was said.
+
+    The extraction is re-applied to a different anchor, like the current time,
+    without parsing the utterance again.  Extracted datetimes come in two forms:
+        * an offset from the anchor (e.g. "in two hours"), which keeps the
+          seconds of the anchor
+        * a time of day on a date some number of days from the anchor date
+          (e.g. "tomorrow morning"), which has no seconds
+
+    Attributes:
+        offset: time between the anchor and the extracted datetime, for offsets
+        day_delta: days between the anchor date and the extracted date
+        clock: the extracted time of day, for times of day
+        future: True if the extracted datetime was not before the anchor
+    """
+
+    def __init__(self, offset: timedelta, day_delta: int, clock, future: bool):
+        self.offset = offset
+        self.day_delta = day_delta
+        self.clock = clock
+        self.future = future
+
+    @classmethod
+    def from_extraction(cls, extracted: datetime, anchor: datetime):
+        """Determine the relative form of an extracted datetime.
+
+        Args:
+            extracted: the datetime extracted from an utterance
+            anchor: the datetime the extraction was relative to
+
+        Returns:
+            The relative form, or None when the form cannot be determined.  This
+            happens when the anchor falls on a whole minute.
+        """
+        anchor = anchor.replace(microsecond=0)
+        future = extracted >= anchor
+        if not anchor.second:
+            relative_datetime = None
+        elif extracted.second == anchor.second:
+            relative_datetime = cls(extracted - anchor, None, None, future)
+        elif not extracted.second:
+            day_delta = (extracted.date() - anchor.date()).days
+            relative_datetime = cls(None, day_delta, extracted.time(), future)
+        else:
+            relative_datetime = None
+
+        return relative_datetime
+
+    @property
+    def is_time_offset(self) -> bool:
+        """True if the form is an offset that is not a whole number of days.
+
+        Only such offsets, like "in three hours", mean the same thing at every
+        anchor.  A whole number of days may come from a weekday or a date.
+        """
+        return self.offset is not None and bool(self.offset % timedelta(days=1))
+
+    def anchor_to(self, anchor: datetime) -> Optional[datetime]:
+        """Apply the relative form to a new anchor.
+
+        Args:
+            anchor: the datetime to apply the relative form to
+
+        Returns:
+            The extracted datetime relative to the new anchor or None if an
+            extraction from the new anchor could give a different result.  That
+            is the case when a time of day that was in the future has passed.
+        """
+        anchor = anchor.replace(microsecond=0)
+        if self.offset is not None:
+            anchored = anchor + self.offset
+        else:
+            anchored_date = anchor.date() + timedelta(days=self.day_delta)
+            anchored = anchor.replace(
+                year=anchored_date.year,
+                month=anchored_date.month,
+                day=anchored_date.day,
+                hour=self.clock.hour,
+                minute=self.clock.minute,
+                second=self.clock.second,
+            )
+        if (anchored >= anchor) != self.future:
+            anchored = None
+
+        return anchored
+
+
+class UtteranceDatetimeCache:
+    """Remember the datetimes extracted from recent utterances.
+
+    Extracting a datetime from an utterance is one of the most expensive steps in
+    handling a weather request, and the same few expressions ("tomorrow", "this
+    weekend") are used over and over.  The relative form of each extraction is
+    kept, keyed by the normalized utterance, language, timezone and the date and
+    hour of the anchor.  Because the date is part of the key, nothing is reused
+    across midnight or between timezones.
+    """
+
+    def __init__(self, max_size: int = UTTERANCE_DATETIME_CACHE_SIZE):
+        self.max_size = max_size
+        self._extractions = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _build_key(utterance: str, anchor: datetime, language: str) -> tuple:
+        """Build the cache key for an utterance extracted relative to an anchor."""
+        normalized_utterance = " ".join(utterance.lower().split())
+        timezone = getattr(anchor.tzinfo, "zone", str(anchor.tzinfo))
+
+        return normalized_utterance, language, timezone, anchor.date(), anchor.hour
+
+    def extract(
+        self, utterance: str, anchor: datetime, language: str = None
+    ) -> Optional[datetime]:
+        """Extract the datetime from an utterance, reusing a previous extraction.
+
+        Args:
+            utterance: the words spoken by the user
+            anchor: the current date and time in the requested timezone
+            language: the language configured on the device
+
+        Returns:
+            The date and time represented in the utterance, if any.
+        """
+        utterance_datetime, _ = self.extract_relative(utterance, anchor, language)
+
+        return utterance_datetime
+
+    def extract_relative(
+        self, utterance: str, anchor: datetime, language: str = None
+    ) -> Tuple[Optional[datetime], Optional[RelativeDatetime]]:
+        """Extract the datetime from an utterance along with its relative form.
+
+        Args:
+            utterance: the words spoken by the user
+            anchor: the current date and time in the requested timezone
+            language: the language configured on the device
+
+        Returns:
+            The date and time represented in the utterance, if any, and its
+            relative form, if it could be determined.
+        """
+        key = self._build_key(utterance, anchor, language)
+        with self._lock:
+            cached = self._extractions.get(key, _NOT_CACHED)
+            if cached is not _NOT_CACHED:
+                self._extractions.move_to_end(key)
+        if cached is None:
+            return None, None
+        if cached is not _NOT_CACHED:
+            utterance_datetime = cached.anchor_to(anchor)
+            if utterance_datetime is not None:
+                return utterance_datetime, cached
+
+        extract = extract_datetime(utterance, anchor, language)
+        if extract is None:
+            utterance_datetime = None
+            relative_datetime = None
+            self._store(key, None)
+        else:
+            utterance_datetime, _ = extract
+            relative_datetime = RelativeDatetime.from_extraction(
+                utterance_datetime, anchor
+            )
+            if relative_datetime is not None:
+                self._store(key, relative_datetime)
+
+        return utterance_datetime, relative_datetime
+
+    def _store(self, key: tuple, relative_datetime: Optional[RelativeDatetime]):
+        """Add an extraction to the cache, dropping the least recently used."""
+        with self._lock:
+            self._extractions[key] = relative_datetime
+            self._extractions.move_to_end(key)
+            while len(self._extractions) > self.max_size:
+                self._extractions.popitem(last=False)
+
+
+_utterance_datetimes = UtteranceDatetimeCache()
+
+
 def convert_to_local_datetime(timestamp: time, timezone: str) -> datetime:
     """Convert a timestamp to a datetime object in the requested timezone.
 
@@ -60,17 +250,32 @@ def get_utterance_datetime(
     Returns:
         The date and time represented in the utterance in the specified timezone.
     """
-    utterance_datetime = None
     if timezone is None:
-        anchor_date = None
+        anchor_date = now_local()
     else:
         intent_timezone = get_tz_info(timezone)
         anchor_date = datetime.now(intent_timezone)
-    extract = extract_datetime(utterance, anchor_date, language)
-    if extract is not None:
-        utterance_datetime, _ = extract
 
-    return utterance_datetime
+    return _utterance_datetimes.extract(utterance, anchor_date, language)
+
+
+def get_relative_utterance_datetime(
+    utterance: str, anchor: datetime, language: str = None
+) -> Tuple[Optional[datetime], Optional[RelativeDatetime]]:
+    """Get a datetime in an utterance in a form that can be applied to other anchors.
+
+    Used to parse the utterance before the timezone of the request is known.
+
+    Args:
+        utterance: the words spoken by the user
+        anchor: the date and time the utterance is relative to
+        language: the language configured on the device
+
+    Returns:
+        The date and time represented in the utterance relative to the anchor, if
+        any, and its relative form, if it could be determined.
+    """
+    return _utterance_datetimes.extract_relative(utterance, anchor, language)
 
 
 def get_tz_info(timezone: str) -> tzinfo:
@@ -140,7 +345,11 @@ def get_speakable_day_of_week(date_to_speak: datetime):
     Returns:
         The day of the week in the device's configured language
     """
-    now = now_local()
+    return _speak_day_of_week(date_to_speak, now_local())
+
+
+def _speak_day_of_week(date_to_speak: datetime, now: datetime, language: str = None):
+    """Convert a date to a speakable day of week, relative to the current time."""
     tomorrow = now.date() + timedelta(days=1)
 
     # A little hack to prevent nice_date() from returning "tomorrow"
@@ -149,7 +358,120 @@ def get_speakable_day_of_week(date_to_speak: datetime):
     else:
         now_arg = now
 
-    speakable_date = nice_date(date_to_speak, now=now_arg)
+    speakable_date = nice_date(date_to_speak, lang=language, now=now_arg)
     day_of_week = speakable_date.split(",")[0]
 
     return day_of_week
+
+
+class SpeakableDays:
+    """The speakable day of week and time period of the dates in a weather report.
+
+    Dialogs for a week summary name the same few days over and over.  The table
+    is built once per report and language, from the dates of the daily
+    forecasts.  What nice_date() says for a date depends on the current date, so
+    the table is only valid until local midnight.
+
+    Attributes:
+        language: the language the days are spoken in
+        valid_on: the local date the table was built on
+    """
+
+    def __init__(self, date_times: List[datetime], language: str = None):
+        now = now_local()
+        self.language = language
+        self.valid_on = now.date()
+        self._days = dict()
+        self._periods = dict()
+        for date_time in date_times:
+            self._days[date_time.date()] = _speak_day_of_week(date_time, now, language)
+            self._periods[date_time] = get_time_period(date_time)
+
+    def is_valid(self) -> bool:
+        """Return False once local midnight has passed since the table was built."""
+        return now_local().date() == self.valid_on
+
+    def day_of_week(self, date_time: datetime) -> str:
+        """Return the speakable day of week of a date in the report."""
+        day_of_week = self._days.get(date_time.date())
+        if day_of_week is None:
+            day_of_week = _speak_day_of_week(date_time, now_local(), self.language)
+            self._days[date_time.date()] = day_of_week
+
+        return day_of_week
+
+    def time_period(self, date_time: datetime) -> str:
+        """Return the period of the day, like "morning", of a time in the report."""
+        time_period = self._periods.get(date_time)
+        if time_period is None:
+            time_period = get_time_period(date_time)
+            self._periods[date_time] = time_period
+
+        return time_period
+
+
+def estimate_size(value, seen: set = None) -> int:
+    """Estimate the memory used by an object and everything it references.
+
+    Objects referenced more than once are only counted the first time.  Attribute
+    names and the small integers cached by the interpreter are shared by every
+    object and are not counted.  Other objects shared with unrelated structures
+    are counted in full, so the result errs on the high side.
+
+    Args:
+        value: the object to measure
+        seen: ids of objects already counted, used when recursing
+
+    Returns:
+        the estimated size in bytes
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen or isinstance(value, int) and -5 <= value <= 256:
+        return 0
+    seen.add(id(value))
+    size = getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(key, seen) + estimate_size(item, seen)
+            for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in value)
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        attributes = value.__dict__
+        seen.add(id(attributes))
+        size += getsizeof(attributes)
+        size += sum(estimate_size(item, seen) for item in attributes.values())
+
+    return size
+
+
+class memoized_property:
+    """Compute a property value on first access and reuse it afterwards.
+
+    The computed value is stored in the instance dictionary under the name of the
+    decorated method.  Because this is a non-data descriptor, later lookups find the
+    stored value directly without calling back into the descriptor.  Writing to the
+    instance dictionary also bypasses any __setattr__ guard, so read-only objects
+    can still memoize.  The first computation is serialized so concurrent readers
+    of a shared object all get the same value.
+    """
+
+    def __init__(self, method):
+        self.method = method
+        self.name = method.__name__
+        self.__doc__ = method.__doc__
+        self.lock = RLock()
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        with self.lock:
+            try:
+                value = instance.__dict__[self.name]
+            except KeyError:
+                value = self.method(instance)
+                instance.__dict__[self.name] = value
+
+        return value
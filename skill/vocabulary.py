@@ -0,0 +1,153 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Match utterances against all the vocabulary of a language in a single pass.
+
+Calling MycroftSkill.voc_match() once per vocabulary file re-scans the utterance
+for each phrase of each file.  Instead, every .voc and .rx file of a language is
+compiled into one regular expression.  Each file becomes an optional lookahead
+with its own named group, so a single match call reports every vocabulary
+present in the utterance.
+
+Vocabulary phrases are regular expression fragments, matched on whole words like
+voc_match() does.  Regex files are matched from the start of the utterance,
+ignoring case.  Their named groups are made anonymous so files can be combined.
+"""
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List
+
+from mycroft.util.format import expand_options
+
+MATCH_CACHE_SIZE = 64
+NAMED_GROUP_PATTERN = re.compile(r"\(\?P<\w+>")
+
+
+def parse_vocabulary(text: str) -> List[str]:
+    """Expand the contents of a vocabulary file into its phrases.
+
+    Follows the rules of mycroft.skills.skill_data.read_vocab_file().
+
+    Args:
+        text: the contents of a .voc file
+
+    Returns:
+        every phrase in the file, with the optional parts expanded
+    """
+    phrases = []
+    for line in text.splitlines():
+        if line.startswith("#") or not line.strip():
+            continue
+        phrases.extend(phrase.strip() for phrase in expand_options(line.lower()))
+
+    return [phrase for phrase in phrases if phrase]
+
+
+def load_vocabularies(locale_directory: Path) -> Dict[str, List[str]]:
+    """Read the vocabulary files for a language.
+
+    Args:
+        locale_directory: the locale directory of the language, e.g. locale/en-us
+
+    Returns:
+        the phrases of each .voc file, keyed by the file name without extension
+    """
+    vocabularies = dict()
+    for voc_path in sorted(locale_directory.joinpath("vocabulary").glob("**/*.voc")):
+        vocabularies[voc_path.stem] = parse_vocabulary(
+            voc_path.read_text(encoding="utf-8")
+        )
+
+    return vocabularies
+
+
+def load_regexes(locale_directory: Path) -> Dict[str, List[str]]:
+    """Read the regular expression files for a language.
+
+    Args:
+        locale_directory: the locale directory of the language, e.g. locale/en-us
+
+    Returns:
+        the expressions in each .rx file, keyed by the file name without extension
+    """
+    regexes = dict()
+    for rx_path in sorted(locale_directory.joinpath("regex").glob("**/*.rx")):
+        with open(rx_path, encoding="utf-8") as rx_file:
+            expressions = [
+                line.strip()
+                for line in rx_file
+                if line.strip() and not line.startswith("#")
+            ]
+        regexes[rx_path.stem] = expressions
+
+    return regexes
+
+
+class VocabularyMatcher:
+    """Finds every vocabulary and regex file of a language matching an utterance."""
+
+    def __init__(
+        self, vocabularies: Dict[str, List[str]], regexes: Dict[str, List[str]] = None
+    ):
+        self.names = []
+        lookaheads = []
+        for name, phrases in vocabularies.items():
+            if phrases:
+                alternatives = "|".join("(?:" + phrase + ")" for phrase in phrases)
+                lookaheads.append(r".*\b(?:" + alternatives + r")\b")
+                self.names.append(name)
+        for name, expressions in (regexes or {}).items():
+            if expressions:
+                alternatives = "|".join(
+                    "(?:" + NAMED_GROUP_PATTERN.sub("(?:", expression) + ")"
+                    for expression in expressions
+                )
+                lookaheads.append("(?i:" + alternatives + ")")
+                self.names.append(name)
+        self.pattern = re.compile(
+            "".join(
+                "(?=(?P<v{}>{})?)".format(index, lookahead)
+                for index, lookahead in enumerate(lookaheads)
+            )
+        )
+        self.match = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match)
+
+    @classmethod
+    def from_locale_directory(cls, locale_directory: Path):
+        """Build a matcher from the vocabulary and regex files of a language.
+
+        Args:
+            locale_directory: the locale directory of the language
+        """
+        return cls(load_vocabularies(locale_directory), load_regexes(locale_directory))
+
+    def _match(self, utterance: str) -> FrozenSet[str]:
+        """Find the vocabulary present in an utterance.
+
+        Results for recent utterances are remembered, so calling match() again
+        with the same utterance is a dictionary lookup.
+
+        Args:
+            utterance: the words spoken by the user
+
+        Returns:
+            the names of the vocabulary and regex files matching the utterance
+        """
+        groups = self.pattern.match(utterance).groupdict()
+
+        return frozenset(
+            name
+            for index, name in enumerate(self.names)
+            if groups["v{}".format(index)] is not None
+        )
@@ -12,12 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Representations and conversions of the data returned by the weather API."""
-from datetime import timedelta
+from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
-from typing import List
+from struct import Struct
+from typing import Dict, List, Tuple
 
+from .assets import count_prepared_assets, resolve_asset
 from .config import MILES_PER_HOUR
-from .util import convert_to_local_datetime
+from .display import WeatherDisplay
+from .serialization import BinaryReader, BinaryWriter
+from .tracing import traced
+from .util import (
+    convert_to_local_datetime,
+    get_tz_info,
+    memoized_property,
+    SpeakableDays,
+)
 
 # Forecast timeframes
 CURRENT = "current"
@@ -48,6 +58,7 @@ ICON_IMAGE_MAP = (
     (("13d",), "snow.svg"),
     (("11d",), "storm.svg"),
 )
+CONDITION_IMAGES = tuple(image_file_name for _, image_file_name in ICON_IMAGE_MAP)
 ICON_ANIMATION_MAP = (
     (("01d", "01n"), "sun.json"),
     (("04d", "04n"), "clouds.json"),
@@ -78,9 +89,126 @@ WIND_DIRECTION_CONVERSION = (
     (292.5, "west"),
     (337.5, "northwest"),
 )
+COMPASS_DIRECTIONS = tuple(direction for _, direction in WIND_DIRECTION_CONVERSION)
+
+# Binary record layouts used by WeatherReport.to_bytes() (see serialization.py).
+#   Strings are stored as indexes into the string table and datetimes as seconds
+#   since epoch.  Any change to these requires a new serialization.FORMAT_VERSION.
+CONDITION_LAYOUT = Struct("<HHHH")
+WEATHER_LAYOUT = Struct("<qiidiiB")
+CURRENT_LAYOUT = Struct("<dqqiiii")
+HOURLY_LAYOUT = Struct("<diB")
+DAILY_LAYOUT = Struct("<qq10iB")
+ALERT_LAYOUT = Struct("<HHqqH")
+REPORT_LAYOUT = Struct("<HHHh")
+
+
+class _SnapshotType(type):
+    """Metaclass that locks an instance once its constructor has finished."""
+
+    def __call__(cls, *args, **kwargs):
+        instance = super().__call__(*args, **kwargs)
+        object.__setattr__(instance, "_frozen", True)
+
+        return instance
+
+
+class Snapshot(metaclass=_SnapshotType):
+    """Base class for read-only representations of weather API data.
+
+    Attributes can only be assigned while the object is being constructed.  This
+    allows a single parsed report to be shared between intent handlers running on
+    different threads without one handler seeing another's changes.  Values that
+    differ per request, like translations, belong in a WeatherOverlay.
+    """
+
+    _frozen = False
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(
+                "Cannot set {} on read-only {}".format(name, type(self).__name__)
+            )
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if self._frozen:
+            raise AttributeError(
+                "Cannot delete {} from read-only {}".format(name, type(self).__name__)
+            )
+        super().__delattr__(name)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.fields == other.fields
+
+    @property
+    def fields(self) -> dict:
+        """The attribute values parsed from the API, excluding memoized values."""
+        snapshot_type = type(self)
+
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name != "_frozen"
+            and not isinstance(getattr(snapshot_type, name, None), memoized_property)
+        }
+
+    @classmethod
+    def _restore(cls, attributes: dict):
+        """Build a read-only instance from already parsed attribute values.
+
+        Used when decoding a serialized report, which skips the parsing done by
+        the constructor.
+
+        Args:
+            attributes: the instance attributes, keyed by name
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__.update(attributes)
+        instance.__dict__["_frozen"] = True
+
+        return instance
 
 
-class WeatherCondition:
+class WeatherOverlay:
+    """Read-only view of a weather snapshot with request specific values on top.
+
+    Attribute lookups return the overridden value when one was supplied and fall
+    through to the underlying snapshot otherwise.
+
+    Example:
+        WeatherOverlay(weather, wind_direction="nord")
+    """
+
+    def __init__(self, weather, **overrides):
+        object.__setattr__(self, "_weather", weather)
+        object.__setattr__(self, "_overrides", overrides)
+
+    def __getattr__(self, name):
+        overrides = self.__dict__["_overrides"]
+        if name in overrides:
+            return overrides[name]
+
+        return getattr(self.__dict__["_weather"], name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Cannot set {} on a WeatherOverlay".format(name))
+
+    @property
+    def snapshot(self):
+        """The weather snapshot underneath the overridden values."""
+        return self.__dict__["_weather"]
+
+    @property
+    def overrides(self) -> dict:
+        """The request specific values on top of the snapshot."""
+        return dict(self.__dict__["_overrides"])
+
+
+class WeatherCondition(Snapshot):
     """Data representation of a weather conditions JSON object from the API"""
 
     def __init__(self, conditions: dict):
@@ -89,15 +217,42 @@ class WeatherCondition:
         self.description = conditions["description"]
         self.icon = conditions["icon"]
 
+    def _pack(self, writer: BinaryWriter):
+        """Append the binary record for this condition to an encoded report."""
+        writer.pack(
+            CONDITION_LAYOUT,
+            self.id,
+            writer.string(self.category),
+            writer.string(self.description),
+            writer.string(self.icon),
+        )
+
+    @classmethod
+    def _unpack(cls, reader: BinaryReader):
+        """Rebuild a condition from the next record of an encoded report."""
+        condition_id, category, description, icon = reader.unpack(CONDITION_LAYOUT)
+
+        return cls._restore(
+            dict(
+                id=condition_id,
+                category=reader.string(category),
+                description=reader.string(description),
+                icon=reader.string(icon),
+            )
+        )
+
     @property
     def image(self) -> str:
-        """Use the icon to image mapping to determine which image to display."""
+        """Use the icon to image mapping to determine which image to display.
+
+        The path is the one of the rasterized image when it has been prepared.
+        """
         image_path = Path("images")
         for icons, image_file_name in ICON_IMAGE_MAP:
             if self.icon in icons:
                 image_path = image_path.joinpath(image_file_name)
 
-        return str(image_path)
+        return resolve_asset(image_path.as_posix())
 
     @property
     def animation(self) -> str:
@@ -120,7 +275,7 @@ class WeatherCondition:
         return condition_code
 
 
-class Weather:
+class Weather(Snapshot):
     """Abstract data representation of commonalities in forecast types."""
 
     def __init__(self, weather: dict, timezone: str):
@@ -134,6 +289,44 @@ class Weather:
         self.wind_direction = self._determine_wind_direction(weather["windDeg"])
         self.condition = WeatherCondition(weather["weather"][0])
 
+    def _pack_common(self, writer: BinaryWriter):
+        """Append the fields shared by all forecast types to an encoded report."""
+        writer.pack(
+            WEATHER_LAYOUT,
+            int(self.date_time.timestamp()),
+            self.pressure,
+            self.humidity,
+            self.dew_point,
+            self.clouds,
+            self.wind_speed,
+            COMPASS_DIRECTIONS.index(self.wind_direction),
+        )
+        self.condition._pack(writer)
+
+    @staticmethod
+    def _unpack_common(reader: BinaryReader, tz_info: tzinfo) -> dict:
+        """Read the fields shared by all forecast types from an encoded report."""
+        (
+            timestamp,
+            pressure,
+            humidity,
+            dew_point,
+            clouds,
+            wind_speed,
+            wind_direction,
+        ) = reader.unpack(WEATHER_LAYOUT)
+
+        return dict(
+            date_time=datetime.fromtimestamp(timestamp, tz_info),
+            pressure=pressure,
+            humidity=humidity,
+            dew_point=dew_point,
+            clouds=clouds,
+            wind_speed=wind_speed,
+            wind_direction=COMPASS_DIRECTIONS[wind_direction],
+            condition=WeatherCondition._unpack(reader),
+        )
+
     @staticmethod
     def _determine_wind_direction(degree_direction: int):
         """Convert wind direction from compass degrees to compass direction.
@@ -179,17 +372,62 @@ class Weather:
 class CurrentWeather(Weather):
     """Data representation of the current weather returned by the API"""
 
-    def __init__(self, weather: dict, timezone: str):
+    def __init__(
+        self,
+        weather: dict,
+        timezone: str,
+        high_temperature: int = None,
+        low_temperature: int = None,
+    ):
         super().__init__(weather, timezone)
         self.sunrise = convert_to_local_datetime(weather["sunrise"], timezone)
         self.sunset = convert_to_local_datetime(weather["sunset"], timezone)
         self.temperature = round(weather["temp"])
         self.visibility = weather["visibility"]
-        self.low_temperature = None
-        self.high_temperature = None
-
-
-class DailyFeelsLike:
+        self.low_temperature = low_temperature
+        self.high_temperature = high_temperature
+
+    def _pack(self, writer: BinaryWriter):
+        """Append the binary record for the current weather to an encoded report."""
+        self._pack_common(writer)
+        writer.pack(
+            CURRENT_LAYOUT,
+            self.feels_like,
+            int(self.sunrise.timestamp()),
+            int(self.sunset.timestamp()),
+            self.temperature,
+            self.visibility,
+            self.low_temperature,
+            self.high_temperature,
+        )
+
+    @classmethod
+    def _unpack(cls, reader: BinaryReader, tz_info: tzinfo):
+        """Rebuild the current weather from the next record of an encoded report."""
+        attributes = cls._unpack_common(reader, tz_info)
+        (
+            feels_like,
+            sunrise,
+            sunset,
+            temperature,
+            visibility,
+            low_temperature,
+            high_temperature,
+        ) = reader.unpack(CURRENT_LAYOUT)
+        attributes.update(
+            feels_like=feels_like,
+            sunrise=datetime.fromtimestamp(sunrise, tz_info),
+            sunset=datetime.fromtimestamp(sunset, tz_info),
+            temperature=temperature,
+            visibility=visibility,
+            low_temperature=low_temperature,
+            high_temperature=high_temperature,
+        )
+
+        return cls._restore(attributes)
+
+
+class DailyFeelsLike(Snapshot):
     """Data representation of a "feels like" JSON object from the API"""
 
     def __init__(self, temperatures: dict):
@@ -219,6 +457,71 @@ class DailyWeather(Weather):
         self.feels_like = DailyFeelsLike(weather["feelsLike"])
         self.chance_of_precipitation = int(weather["pop"] * 100)
 
+    def _pack(self, writer: BinaryWriter):
+        """Append the binary record for this daily forecast to an encoded report."""
+        self._pack_common(writer)
+        writer.pack(
+            DAILY_LAYOUT,
+            int(self.sunrise.timestamp()),
+            int(self.sunset.timestamp()),
+            self.temperature.day,
+            self.temperature.night,
+            self.temperature.evening,
+            self.temperature.morning,
+            self.temperature.low,
+            self.temperature.high,
+            self.feels_like.day,
+            self.feels_like.night,
+            self.feels_like.evening,
+            self.feels_like.morning,
+            self.chance_of_precipitation,
+        )
+
+    @classmethod
+    def _unpack(cls, reader: BinaryReader, tz_info: tzinfo):
+        """Rebuild a daily forecast from the next record of an encoded report."""
+        attributes = cls._unpack_common(reader, tz_info)
+        (
+            sunrise,
+            sunset,
+            day,
+            night,
+            evening,
+            morning,
+            low,
+            high,
+            feels_like_day,
+            feels_like_night,
+            feels_like_evening,
+            feels_like_morning,
+            chance_of_precipitation,
+        ) = reader.unpack(DAILY_LAYOUT)
+        attributes.update(
+            sunrise=datetime.fromtimestamp(sunrise, tz_info),
+            sunset=datetime.fromtimestamp(sunset, tz_info),
+            temperature=DailyTemperature._restore(
+                dict(
+                    day=day,
+                    night=night,
+                    evening=evening,
+                    morning=morning,
+                    low=low,
+                    high=high,
+                )
+            ),
+            feels_like=DailyFeelsLike._restore(
+                dict(
+                    day=feels_like_day,
+                    night=feels_like_night,
+                    evening=feels_like_evening,
+                    morning=feels_like_morning,
+                )
+            ),
+            chance_of_precipitation=chance_of_precipitation,
+        )
+
+        return cls._restore(attributes)
+
 
 class HourlyWeather(Weather):
     """Data representation of a hourly forecast JSON object from the API"""
@@ -228,8 +531,69 @@ class HourlyWeather(Weather):
         self.temperature = round(weather["temp"])
         self.chance_of_precipitation = int(weather["pop"] * 100)
 
+    def _pack(self, writer: BinaryWriter):
+        """Append the binary record for this hourly forecast to an encoded report."""
+        self._pack_common(writer)
+        writer.pack(
+            HOURLY_LAYOUT,
+            self.feels_like,
+            self.temperature,
+            self.chance_of_precipitation,
+        )
+
+    @classmethod
+    def _unpack(cls, reader: BinaryReader, tz_info: tzinfo):
+        """Rebuild an hourly forecast from the next record of an encoded report."""
+        attributes = cls._unpack_common(reader, tz_info)
+        feels_like, temperature, chance_of_precipitation = reader.unpack(
+            HOURLY_LAYOUT
+        )
+        attributes.update(
+            feels_like=feels_like,
+            temperature=temperature,
+            chance_of_precipitation=chance_of_precipitation,
+        )
+
+        return cls._restore(attributes)
+
+
+class DailyForecastSpan(tuple):
+    """A contiguous run of daily forecasts with statistics derived from them.
+
+    The statistics are computed on first use and kept with the span, so every
+    handler reading the same report shares a single computation.
+    """
+
+    @memoized_property
+    def temperature_range(self) -> Dict[str, int]:
+        """The minimum and maximum of the low and high temperatures in the span."""
+        low_temperatures = [daily.temperature.low for daily in self]
+        high_temperatures = [daily.temperature.high for daily in self]
+
+        return dict(
+            low_min=min(low_temperatures),
+            low_max=max(low_temperatures),
+            high_min=min(high_temperatures),
+            high_max=max(high_temperatures),
+        )
+
+    @memoized_property
+    def conditions(self) -> Dict[str, Tuple[DailyWeather, ...]]:
+        """The forecasts in the span grouped by weather condition category.
+
+        Categories are ordered by the first day they appear in the span.
+        """
+        days_by_condition = dict()
+        for daily in self:
+            category = daily.condition.category
+            days_by_condition.setdefault(category, []).append(daily)
+
+        return {
+            category: tuple(days) for category, days in days_by_condition.items()
+        }
 
-class WeatherAlert:
+
+class WeatherAlert(Snapshot):
     """Data representation of a weather conditions JSON object from the API"""
 
     def __init__(self, alert: dict, timezone: str):
@@ -239,23 +603,245 @@ class WeatherAlert:
         self.end = convert_to_local_datetime(alert["end"], timezone)
         self.description = alert["description"]
 
-
-class WeatherReport:
+    def _pack(self, writer: BinaryWriter):
+        """Append the binary record for this alert to an encoded report."""
+        writer.pack(
+            ALERT_LAYOUT,
+            writer.string(self.sender),
+            writer.string(self.event),
+            int(self.start.timestamp()),
+            int(self.end.timestamp()),
+            writer.string(self.description),
+        )
+
+    @classmethod
+    def _unpack(cls, reader: BinaryReader, tz_info: tzinfo):
+        """Rebuild an alert from the next record of an encoded report."""
+        sender, event, start, end, description = reader.unpack(ALERT_LAYOUT)
+
+        return cls._restore(
+            dict(
+                sender=reader.string(sender),
+                event=reader.string(event),
+                start=datetime.fromtimestamp(start, tz_info),
+                end=datetime.fromtimestamp(end, tz_info),
+                description=reader.string(description),
+            )
+        )
+
+
+class WeatherReport(Snapshot):
     """Full representation of the data returned by the Open Weather Maps One Call API"""
 
+    @traced()
     def __init__(self, report):
         timezone = report["timezone"]
-        self.current = CurrentWeather(report["current"], timezone)
-        self.hourly = [HourlyWeather(hour, timezone) for hour in report["hourly"]]
-        self.daily = [DailyWeather(day, timezone) for day in report["daily"]]
+        self.timezone = timezone
+        self.hourly = tuple(HourlyWeather(hour, timezone) for hour in report["hourly"])
+        self.daily = tuple(DailyWeather(day, timezone) for day in report["daily"])
         today = self.daily[0]
-        self.current.high_temperature = today.temperature.high
-        self.current.low_temperature = today.temperature.low
+        self.current = CurrentWeather(
+            report["current"],
+            timezone,
+            high_temperature=today.temperature.high,
+            low_temperature=today.temperature.low,
+        )
         if "alerts" in report:
-            self.alerts = [WeatherAlert(alert, timezone) for alert in report["alerts"]]
+            self.alerts = tuple(
+                WeatherAlert(alert, timezone) for alert in report["alerts"]
+            )
         else:
             self.alerts = None
 
+    def merge(self, previous):
+        """Share entries that did not change with the previous report for a location.
+
+        Consumers holding on to entries of the previous report can use an identity
+        check to know which entries need to be redrawn.
+
+        Args:
+            previous: the last report retrieved for the same location
+
+        Returns:
+            the previous report if nothing changed, otherwise a copy of this report
+            that reuses every unchanged entry of the previous one
+        """
+        if self == previous:
+            return previous
+        hourly = _reuse_entries(self.hourly, previous.hourly)
+        daily = _reuse_entries(self.daily, previous.daily)
+        current = previous.current if self.current == previous.current else self.current
+        alerts = self.alerts
+        if alerts is not None and previous.alerts is not None:
+            alerts = tuple(
+                next((old for old in previous.alerts if old == alert), alert)
+                for alert in alerts
+            )
+
+        return WeatherReport._restore(
+            dict(
+                timezone=self.timezone,
+                current=current,
+                hourly=hourly,
+                daily=daily,
+                alerts=alerts,
+            )
+        )
+
+    def to_bytes(self) -> bytes:
+        """Encode the report in the compact binary format defined in serialization.py.
+
+        The encoding is much smaller than the One Call JSON and decoding it skips
+        the parsing done when building a report from the API response.
+
+        Returns:
+            the encoded report
+        """
+        writer = BinaryWriter()
+        alert_count = -1 if self.alerts is None else len(self.alerts)
+        writer.pack(
+            REPORT_LAYOUT,
+            writer.string(self.timezone),
+            len(self.hourly),
+            len(self.daily),
+            alert_count,
+        )
+        self.current._pack(writer)
+        for hourly in self.hourly:
+            hourly._pack(writer)
+        for daily in self.daily:
+            daily._pack(writer)
+        for alert in self.alerts or ():
+            alert._pack(writer)
+
+        return writer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """Rebuild a report previously encoded by to_bytes().
+
+        Args:
+            data: the encoded report
+
+        Returns:
+            a report equivalent to the one that was encoded
+
+        Raises:
+            SerializationError when the data is not a report in a supported format
+        """
+        reader = BinaryReader(data)
+        timezone, hourly_count, daily_count, alert_count = reader.unpack(
+            REPORT_LAYOUT
+        )
+        timezone = reader.string(timezone)
+        tz_info = get_tz_info(timezone)
+        current = CurrentWeather._unpack(reader, tz_info)
+        hourly = tuple(
+            HourlyWeather._unpack(reader, tz_info) for _ in range(hourly_count)
+        )
+        daily = tuple(DailyWeather._unpack(reader, tz_info) for _ in range(daily_count))
+        if alert_count < 0:
+            alerts = None
+        else:
+            alerts = tuple(
+                WeatherAlert._unpack(reader, tz_info) for _ in range(alert_count)
+            )
+
+        return cls._restore(
+            dict(
+                timezone=timezone,
+                current=current,
+                hourly=hourly,
+                daily=daily,
+                alerts=alerts,
+            )
+        )
+
+    @memoized_property
+    def today(self) -> DailyWeather:
+        """The daily forecast for the current date in the report's timezone."""
+        return self.daily[0]
+
+    @memoized_property
+    def tomorrow(self) -> DailyWeather:
+        """The daily forecast for the day after the current date."""
+        return self.daily[1]
+
+    @memoized_property
+    def weekly_forecast(self) -> DailyForecastSpan:
+        """The seven daily forecasts following the current date."""
+        return DailyForecastSpan(self.daily[1:8])
+
+    @memoized_property
+    def weekend_forecast(self) -> DailyForecastSpan:
+        """The Saturday and Sunday forecasts from the list of daily forecasts."""
+        return DailyForecastSpan(
+            forecast_day
+            for forecast_day in self.daily
+            if forecast_day.date_time.date().weekday() in (SATURDAY, SUNDAY)
+        )
+
+    @memoized_property
+    def daylight(self) -> timedelta:
+        """The length of time between today's sunrise and sunset."""
+        return self.current.sunset - self.current.sunrise
+
+    @memoized_property
+    def _speakable_days(self) -> Dict[str, SpeakableDays]:
+        """The speakable days tables built for the report, keyed by language.
+
+        Reports are shared between threads, so the table is read and filled
+        while holding the lock of this property.
+        """
+        return dict()
+
+    def get_speakable_days(self, language: str) -> SpeakableDays:
+        """Return the speakable day of each date in the report in a language.
+
+        The table is built on first use and rebuilt after local midnight.
+
+        Args:
+            language: the language the days are spoken in
+        """
+        with WeatherReport._speakable_days.lock:
+            speakable_days = self._speakable_days.get(language)
+            if speakable_days is None or not speakable_days.is_valid():
+                speakable_days = SpeakableDays(
+                    [daily.date_time for daily in self.daily], language
+                )
+                self._speakable_days[language] = speakable_days
+
+        return speakable_days
+
+    @memoized_property
+    def _displays(self) -> Dict[str, Tuple[int, WeatherDisplay]]:
+        """The screen values prepared for the report, keyed by time format.
+
+        Each entry also holds the number of prepared GUI assets when it was
+        built.  Filled while holding the lock of this property, like
+        _speakable_days.
+        """
+        return dict()
+
+    def get_display(self, time_format: str) -> WeatherDisplay:
+        """Return the values of every weather screen for the report.
+
+        The values are prepared on first use for each time format, and again
+        once more condition images have been prepared, so screens shown while
+        the images were being prepared do not keep the SVG paths.
+
+        Args:
+            time_format: the device's time format, "half" or "full"
+        """
+        with WeatherReport._displays.lock:
+            asset_count = count_prepared_assets()
+            built_asset_count, display = self._displays.get(time_format, (0, None))
+            if display is None or built_asset_count != asset_count:
+                display = WeatherDisplay(self, time_format)
+                self._displays[time_format] = (asset_count, display)
+
+        return display
+
     def get_weather_for_intent(self, intent_data):
         """Use the intent to determine which forecast satisfies the request.
 
@@ -302,7 +888,10 @@ class WeatherReport:
         if days > 7:
             raise IndexError("Only seven days of forecasted weather available.")
 
-        forecast = self.daily[1 : days + 1]
+        if days == 7:
+            forecast = self.weekly_forecast
+        else:
+            forecast = DailyForecastSpan(self.daily[1 : days + 1])
 
         return forecast
 
@@ -328,13 +917,7 @@ class WeatherReport:
         Returns:
             The Saturday and Sunday forecast from the list of daily forecasts
         """
-        forecast = list()
-        for forecast_day in self.daily:
-            report_date = forecast_day.date_time.date()
-            if report_date.weekday() in (SATURDAY, SUNDAY):
-                forecast.append(forecast_day)
-
-        return forecast
+        return self.weekend_forecast
 
     def get_next_precipitation(self, intent_data):
         """Determine when the next chance of precipitation is in the forecast.
@@ -369,3 +952,69 @@ class WeatherReport:
                     break
 
         return report, timeframe
+
+
+class ReportChanges:
+    """The differences between two consecutive reports for the same location.
+
+    Only the things a consumer would redraw or announce are tracked.  The time of
+    the current conditions observation changes on every refresh, so it is not
+    considered a change by itself.
+    """
+
+    def __init__(self, previous: WeatherReport, latest: WeatherReport):
+        previous_current = previous.current.fields
+        self.current = [
+            name
+            for name, value in latest.current.fields.items()
+            if name != "date_time" and previous_current.get(name) != value
+        ]
+        self.hourly = _changed_entries(latest.hourly, previous.hourly)
+        self.daily = _changed_entries(latest.daily, previous.daily)
+        previous_alerts = previous.alerts or ()
+        self.new_alerts = [
+            alert for alert in latest.alerts or () if alert not in previous_alerts
+        ]
+
+    @classmethod
+    def unchanged(cls):
+        """Build the changes of a report that was reused rather than refreshed."""
+        changes = cls.__new__(cls)
+        changes.current = []
+        changes.hourly = []
+        changes.daily = []
+        changes.new_alerts = []
+
+        return changes
+
+    def __bool__(self):
+        return bool(self.current or self.hourly or self.daily or self.new_alerts)
+
+    def to_dict(self) -> dict:
+        """Build a compact representation of the changes for a message bus event."""
+        return dict(
+            current=self.current,
+            hourly=[hourly.date_time.isoformat() for hourly in self.hourly],
+            daily=[daily.date_time.date().isoformat() for daily in self.daily],
+            alerts=[alert.event for alert in self.new_alerts],
+        )
+
+
+def _reuse_entries(latest: tuple, previous: tuple) -> tuple:
+    """Replace forecast entries with their equal counterpart from a previous report."""
+    previous_entries = {entry.date_time: entry for entry in previous}
+    merged_entries = []
+    for entry in latest:
+        previous_entry = previous_entries.get(entry.date_time)
+        merged_entries.append(entry if previous_entry != entry else previous_entry)
+
+    return tuple(merged_entries)
+
+
+def _changed_entries(latest: tuple, previous: tuple) -> list:
+    """Find the forecast entries that are new or differ from a previous report."""
+    previous_entries = {entry.date_time: entry for entry in previous}
+
+    return [
+        entry for entry in latest if previous_entries.get(entry.date_time) != entry
+    ]
@@ -0,0 +1,139 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Estimate the first paint of each Mark II page with and without prepared assets.
+
+The first paint of a page is estimated as the time to load its images: reading
+and rasterizing each SVG, or reading and inflating each prepared PNG.  The GUI
+renders with Qt rather than cairo, so the numbers compare the two kinds of
+image rather than predict the time on a device.  Images the QML loads from a
+fixed path are always SVG.  Rasterizing needs the optional cairosvg package and
+the cairo library; without them only the SVG side is measured.
+
+Usage:
+    python test/benchmark/bench_assets.py [fixture name]
+"""
+import struct
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+from xml.dom import minidom
+
+from harness import install_stubs, load_fixture, SKILL_DIRECTORY, time_call
+
+install_stubs()
+
+from skill import assets  # noqa: E402
+from skill.assets import GuiAssets, MARK_II_IMAGE_HEIGHT  # noqa: E402
+from skill.weather import CONDITION_IMAGES, WeatherReport  # noqa: E402
+
+UI_DIRECTORY = SKILL_DIRECTORY.joinpath("ui")
+REPEAT = 20
+
+
+def list_page_images(weather: WeatherReport) -> dict:
+    """List the images loaded by each Mark II page for a report."""
+    return {
+        "current_1_mark_ii.qml": [
+            weather.current.condition.image,
+            "images/high_temperature.svg",
+            "images/low_temperature.svg",
+        ],
+        "current_2_mark_ii.qml": ["images/wind.svg", "images/humidity.svg"],
+        "hourly_mark_ii.qml": [
+            hourly.condition.image for hourly in weather.hourly[1:5]
+        ],
+        "daily_mark_ii.qml": [daily.condition.image for daily in weather.daily[1:5]],
+        "single_day_mark_ii.qml": [
+            weather.tomorrow.condition.image,
+            "images/high_temperature.svg",
+            "images/low_temperature.svg",
+        ],
+        "sunrise_sunset_mark_ii.qml": ["images/sunrise.svg", "images/sunset.svg"],
+    }
+
+
+def load_svg(path: Path):
+    """Read, parse and, when possible, rasterize an SVG image."""
+    if assets.cairosvg is None:
+        minidom.parseString(path.read_bytes())
+    else:
+        assets.cairosvg.svg2png(
+            bytestring=path.read_bytes(), output_height=MARK_II_IMAGE_HEIGHT
+        )
+
+
+def load_png(path: Path):
+    """Read a PNG image and inflate its pixel data."""
+    png = path.read_bytes()
+    offset = 8
+    compressed = bytearray()
+    while offset < len(png):
+        (length,) = struct.unpack(">I", png[offset : offset + 4])
+        if png[offset + 4 : offset + 8] == b"IDAT":
+            compressed += png[offset + 8 : offset + 8 + length]
+        offset += length + 12
+    zlib.decompress(bytes(compressed))
+
+
+def load_image(image: str):
+    """Load an image the way the page would, from its source or prepared file."""
+    if image.startswith("file://"):
+        path = Path(image[len("file://") :])
+    else:
+        path = UI_DIRECTORY.joinpath(image)
+    if path.suffix == ".png":
+        load_png(path)
+    else:
+        load_svg(path)
+
+
+def load_page(images: list):
+    """Load every image of a page."""
+    for image in images:
+        load_image(image)
+
+
+def measure_pages(weather: WeatherReport) -> dict:
+    """Estimate the first paint of each page in milliseconds."""
+    return {
+        page_name: time_call(load_page, images, repeat=REPEAT) / 1000
+        for page_name, images in list_page_images(weather).items()
+    }
+
+
+def main(fixture_name: str = "onecall_clear"):
+    report = load_fixture(fixture_name)
+    print("fixture: " + fixture_name)
+    if assets.cairosvg is None:
+        print("cairosvg is not available: SVG images are only parsed, not drawn")
+    svg_first_paint = measure_pages(WeatherReport(report))
+    with tempfile.TemporaryDirectory() as asset_directory:
+        gui_assets = GuiAssets(UI_DIRECTORY, Path(asset_directory))
+        image_count = gui_assets.prepare_images(CONDITION_IMAGES)
+        png_first_paint = measure_pages(WeatherReport(report))
+    assets._prepared_assets.clear()
+
+    print("{} images rasterized".format(image_count))
+    print("{:<28}{:>22}{:>22}".format("page", "SVG first paint (ms)", "prepared (ms)"))
+    for page_name, svg_milliseconds in svg_first_paint.items():
+        print(
+            "{:<28}{:>22.2f}{:>22.2f}".format(
+                page_name, svg_milliseconds, png_first_paint[page_name]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,165 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the time spent preparing the values of the weather screens.
+
+Each screen is prepared the way the display methods built it on every request,
+then from the values prepared once per report.  The first request showing a
+screen of a report prepares its values; later requests only copy them.
+
+Usage:
+    python test/benchmark/bench_display.py [fixture name]
+"""
+import sys
+
+from harness import install_stubs, load_fixture, time_call
+
+install_stubs()
+
+from skill.display import TWELVE_HOUR, WeatherDisplay  # noqa: E402
+from skill.weather import WeatherReport  # noqa: E402
+
+LOCATION = "Kansas City, Missouri"
+REPEAT = 2000
+
+
+def build_hourly_per_request(weather: WeatherReport, time_format: str) -> dict:
+    """Build the Mark II hourly screen like the display method used to."""
+    hourly_forecast = []
+    for hour_count, hourly in enumerate(weather.hourly):
+        if not hour_count:
+            continue
+        if hour_count > 4:
+            break
+        if time_format == TWELVE_HOUR:
+            hour = int(hourly.date_time.strftime("%I"))
+            am_pm = hourly.date_time.strftime(" %p")
+            formatted_time = str(hour) + am_pm
+        else:
+            formatted_time = hourly.date_time.strftime("%H:00")
+        hourly_forecast.append(
+            dict(
+                time=hourly.date_time.strftime(formatted_time),
+                precipitation=hourly.chance_of_precipitation,
+                temperature=hourly.temperature,
+                weatherCondition=hourly.condition.image,
+            )
+        )
+
+    return dict(weatherLocation=LOCATION, hourlyForecast=dict(hours=hourly_forecast))
+
+
+def build_daily_mark_ii_per_request(weather: WeatherReport, time_format: str) -> dict:
+    """Build the Mark II daily screen like the display method used to."""
+    daily_forecast = []
+    for day in weather.daily[1:8]:
+        daily_forecast.append(
+            dict(
+                weatherCondition=day.condition.image,
+                day=day.date_time.strftime("%a"),
+                highTemperature=day.temperature.high,
+                lowTemperature=day.temperature.low,
+            )
+        )
+
+    return dict(
+        dailyForecast=dict(days=daily_forecast[:4]), weatherLocation=LOCATION
+    )
+
+
+def build_daily_scalable_per_request(weather: WeatherReport, time_format: str) -> dict:
+    """Build the scalable daily screen like the display method used to."""
+    display_data = []
+    for day_number, day in enumerate(weather.daily[1:8]):
+        if day_number == 4:
+            break
+        display_data.append(
+            dict(
+                weatherCondition=day.condition.image,
+                highTemperature=day.temperature.high,
+                lowTemperature=day.temperature.low,
+                date=day.date_time.strftime("%a"),
+            )
+        )
+
+    return dict(forecast=dict(first=display_data[:4]))
+
+
+def build_hourly_prepared(display: WeatherDisplay) -> dict:
+    """Build the Mark II hourly screen from the prepared values."""
+    return dict(
+        weatherLocation=LOCATION, hourlyForecast=dict(hours=display.hourly_mark_ii)
+    )
+
+
+def build_daily_mark_ii_prepared(display: WeatherDisplay) -> dict:
+    """Build the Mark II daily screen from the prepared values."""
+    daily_forecast = display.get_days_mark_ii(display.weather.daily[1:8])
+
+    return dict(
+        dailyForecast=dict(days=daily_forecast[:4]), weatherLocation=LOCATION
+    )
+
+
+def build_daily_scalable_prepared(display: WeatherDisplay) -> dict:
+    """Build the scalable daily screen from the prepared values."""
+    forecast = display.weather.daily[1:8]
+
+    return dict(forecast=dict(first=display.get_days_scalable(forecast)))
+
+
+def build_prepared_first_time(weather: WeatherReport, build_prepared) -> dict:
+    """Build a screen for a report that has not been displayed yet."""
+    return build_prepared(WeatherDisplay(weather, TWELVE_HOUR))
+
+
+SCREENS = (
+    ("hourly_mark_ii", build_hourly_per_request, build_hourly_prepared),
+    (
+        "daily_mark_ii",
+        build_daily_mark_ii_per_request,
+        build_daily_mark_ii_prepared,
+    ),
+    (
+        "daily_scalable",
+        build_daily_scalable_per_request,
+        build_daily_scalable_prepared,
+    ),
+)
+
+
+def main(fixture_name: str = "onecall_clear"):
+    weather = WeatherReport(load_fixture(fixture_name))
+    display = weather.get_display(TWELVE_HOUR)
+    print("fixture: " + fixture_name)
+    print(
+        "{:<18}{:>18}{:>18}{:>18}".format(
+            "screen", "per request (us)", "first time (us)", "prepared (us)"
+        )
+    )
+    for screen_name, per_request, prepared in SCREENS:
+        assert per_request(weather, TWELVE_HOUR) == prepared(display)
+        print(
+            "{:<18}{:>18.1f}{:>18.1f}{:>18.1f}".format(
+                screen_name,
+                time_call(per_request, weather, TWELVE_HOUR, repeat=REPEAT),
+                time_call(
+                    build_prepared_first_time, weather, prepared, repeat=REPEAT
+                ),
+                time_call(prepared, display, repeat=REPEAT),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,174 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the bus traffic and time to first frame of the weather screens.
+
+Each screen is pushed to the stand-in SkillGUI while another page is showing,
+once by assigning its values one at a time and once with GuiPages.  Then the
+same screen is pushed again, as when a question is repeated, once unchanged and
+once with one value changed.  The time to first frame is simulated from the
+recorded messages: every message costs a bus round trip plus serialization, a
+value update received while a page is showing makes the screen lay itself out
+again and showing a page loads it.
+
+Usage:
+    python test/benchmark/bench_gui.py [fixture name]
+"""
+import sys
+
+from harness import install_stubs, load_fixture, StubGui
+
+install_stubs()
+
+from skill.gui import GuiPages  # noqa: E402
+from skill.weather import WeatherReport  # noqa: E402
+
+BUS_ROUND_TRIP = 0.002
+SERIALIZATION_PER_BYTE = 0.000001
+LAYOUT_TIME = 0.008
+PAGE_LOAD_TIME = 0.030
+LOCATION = "Kansas City, Missouri"
+
+
+def build_screens(weather: WeatherReport) -> dict:
+    """Build the model of each weather screen the way the skill does."""
+    current = weather.current
+    today = weather.daily[0]
+    return {
+        "current_1_mark_ii.qml": dict(
+            currentTemperature=current.temperature,
+            weatherLocation=LOCATION,
+            highTemperature=current.high_temperature,
+            lowTemperature=current.low_temperature,
+            weatherCondition=current.condition.image,
+        ),
+        "hourly_mark_ii.qml": dict(
+            weatherLocation=LOCATION,
+            hourlyForecast=dict(
+                hours=[
+                    dict(
+                        time=hourly.date_time.strftime("%H:00"),
+                        precipitation=hourly.chance_of_precipitation,
+                        temperature=hourly.temperature,
+                        weatherCondition=hourly.condition.image,
+                    )
+                    for hourly in weather.hourly[1:5]
+                ]
+            ),
+        ),
+        "single_day_mark_ii.qml": dict(
+            weatherLocation=LOCATION,
+            weatherCondition=today.condition.image,
+            weatherDate=today.date_time.strftime("%A %b %d"),
+            highTemperature=today.temperature.high,
+            lowTemperature=today.temperature.low,
+            chanceOfPrecipitation=str(today.chance_of_precipitation),
+        ),
+        "sunrise_sunset_mark_ii.qml": dict(
+            weatherDate=today.date_time.strftime("%A %b %d"),
+            weatherLocation=LOCATION,
+            sunrise=today.sunrise.strftime("%H:%M"),
+            sunset=today.sunset.strftime("%H:%M"),
+            ampm=False,
+        ),
+    }
+
+
+def simulate_first_frame(messages) -> float:
+    """Simulate the time until the last page shown is on screen."""
+    elapsed = 0.0
+    page_showing = True
+    first_frame = 0.0
+    for msg_type, payload in messages:
+        elapsed += BUS_ROUND_TRIP + len(payload) * SERIALIZATION_PER_BYTE
+        if msg_type == "gui.clear.namespace":
+            page_showing = False
+        elif msg_type == "gui.value.set" and page_showing:
+            elapsed += LAYOUT_TIME
+            first_frame = elapsed
+        elif msg_type == "gui.page.show":
+            elapsed += PAGE_LOAD_TIME
+            page_showing = True
+            first_frame = elapsed
+
+    return first_frame
+
+
+def push_one_at_a_time(gui: StubGui, page_name: str, model: dict):
+    """Push a screen by assigning each value while the previous page shows."""
+    for key, value in model.items():
+        gui[key] = value
+    gui.replace_page(page_name)
+
+
+def push_batched(gui: StubGui, page_name: str, model: dict):
+    """Push a screen with its complete model."""
+    GuiPages(gui, gui, gui.skill_id).show(page_name, model, replace=True)
+
+
+def repeat_batched(gui_pages: GuiPages, page_name: str, model: dict):
+    """Push a screen again with GuiPages after it was first shown."""
+    gui_pages.show(page_name, model, replace=True)
+
+
+def change_one_value(model: dict) -> dict:
+    """Return a copy of a model with its first value changed."""
+    key = next(iter(model))
+    return dict(model, **{key: str(model[key]) + "!"})
+
+
+def print_row(page_name: str, mode: str, messages: list):
+    """Print the bus traffic and simulated time to first frame of a push."""
+    print(
+        "{:<28}{:>18}{:>12}{:>12}{:>18.1f}".format(
+            page_name,
+            mode,
+            len(messages),
+            sum(len(payload) for _, payload in messages),
+            simulate_first_frame(messages) * 1000,
+        )
+    )
+
+
+def main(fixture_name: str = "onecall_clear"):
+    weather = WeatherReport(load_fixture(fixture_name))
+    print("fixture: " + fixture_name)
+    print(
+        "{:<28}{:>18}{:>12}{:>12}{:>18}".format(
+            "screen", "mode", "messages", "bytes", "first frame (ms)"
+        )
+    )
+    for page_name, model in build_screens(weather).items():
+        for mode, push in (
+            ("one at a time", push_one_at_a_time),
+            ("batched", push_batched),
+        ):
+            gui = StubGui()
+            gui.show_page("previous.qml")
+            gui.messages.clear()
+            push(gui, page_name, model)
+            print_row(page_name, mode, gui.messages)
+        for mode, repeated_model in (
+            ("repeat unchanged", model),
+            ("repeat 1 changed", change_one_value(model)),
+        ):
+            gui = StubGui()
+            gui_pages = GuiPages(gui, gui, gui.skill_id)
+            gui_pages.show(page_name, model)
+            gui.messages.clear()
+            repeat_batched(gui_pages, page_name, repeated_model)
+            print_row(page_name, mode, gui.messages)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,126 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the memory retained by weather reports and the forecast cache.
+
+Memory is measured with tracemalloc.  Reports are built from freshly decoded JSON
+that is discarded afterwards, like a report built from an API response, so the
+numbers include the strings and floats the report keeps from the response.
+
+Usage:
+    python test/benchmark/bench_memory.py [fixture name]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+
+from harness import install_stubs, load_fixture
+
+install_stubs()
+
+from skill.cache import build_forecast_key, ForecastCache  # noqa: E402
+from skill.util import estimate_size  # noqa: E402
+from skill.weather import (  # noqa: E402
+    CurrentWeather,
+    DailyWeather,
+    HourlyWeather,
+    WeatherCondition,
+    WeatherReport,
+)
+
+SAMPLE_COUNT = 50
+CACHED_LOCATIONS = (1, 10, 50, 100)
+
+
+def measure_retained(build) -> int:
+    """Measure the memory still allocated after calling a builder function."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    retained = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del retained
+
+    return after - before
+
+
+def measure_entry(json_text: str, entry_builder) -> float:
+    """Measure the bytes retained per entry built from a list of JSON objects."""
+    entries_per_sample = len(json.loads(json_text))
+
+    def build():
+        return [
+            [entry_builder(entry) for entry in json.loads(json_text)]
+            for _ in range(SAMPLE_COUNT)
+        ]
+
+    return measure_retained(build) / (SAMPLE_COUNT * entries_per_sample)
+
+
+def main(fixture_name: str = "onecall_clear"):
+    raw_report = load_fixture(fixture_name)
+    json_text = json.dumps(raw_report)
+    timezone = raw_report["timezone"]
+    weather = WeatherReport(raw_report)
+
+    print("fixture: " + fixture_name)
+    report_size = measure_retained(
+        lambda: [WeatherReport(json.loads(json_text)) for _ in range(SAMPLE_COUNT)]
+    )
+    print("{:<28}{:>10.0f} bytes".format("report", report_size / SAMPLE_COUNT))
+    print("{:<28}{:>10} bytes".format("report (estimate)", estimate_size(weather)))
+
+    entry_types = (
+        ("current", [raw_report["current"]], lambda e: CurrentWeather(e, timezone)),
+        ("hourly", raw_report["hourly"], lambda e: HourlyWeather(e, timezone)),
+        ("daily", raw_report["daily"], lambda e: DailyWeather(e, timezone)),
+        (
+            "condition",
+            [entry["weather"][0] for entry in raw_report["hourly"]],
+            WeatherCondition,
+        ),
+    )
+    for label, entries, builder in entry_types:
+        entry_size = measure_entry(json.dumps(entries), builder)
+        print("{:<28}{:>10.0f} bytes".format(label + " entry", entry_size))
+
+    print()
+    print(
+        "{:<12}{:>14}{:>14}{:>10}".format("locations", "retained", "estimate", "cached")
+    )
+    for location_count in CACHED_LOCATIONS:
+        for budget in (None, 1024 * 1024):
+
+            def build():
+                cache = ForecastCache(budget)
+                for location in range(location_count):
+                    key = build_forecast_key("metric", location, location, "en-us")
+                    cache.update(key, WeatherReport(json.loads(json_text)))
+                return cache
+
+            cache = build()
+            label = str(location_count)
+            if budget is not None:
+                label += " (1 MB)"
+            print(
+                "{:<12}{:>14}{:>14}{:>10}".format(
+                    label, measure_retained(build), cache.memory_used, len(cache)
+                )
+            )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
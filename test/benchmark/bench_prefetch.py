@@ -0,0 +1,94 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the effect of sending likely dialogs to the TTS cache after a refresh.
+
+Follows what the skill does: after a refresh the likely dialogs are rendered and
+sent to the stand-in TTS service in a prefetch event, the service confirms the
+utterances it cached, then the current weather, high and low and tomorrow's
+forecast are requested.  Reports the warmed phrases
+and the simulated time until audio starts for each request, with and without
+prefetching.
+
+Usage:
+    python test/benchmark/bench_prefetch.py [fixture name]
+"""
+import sys
+
+from harness import (
+    build_config,
+    build_intent,
+    DialogRenderer,
+    install_stubs,
+    load_fixture,
+    StubMessage,
+)
+from stub_tts import StubTTS
+
+install_stubs()
+
+from skill.speech import (  # noqa: E402
+    build_likely_dialogs,
+    RenderedDialogs,
+    TTS_PREFETCH_EVENT,
+)
+from skill.weather import WeatherReport  # noqa: E402
+
+LANGUAGE = "en-us"
+
+
+def speak_likely_dialogs(weather: WeatherReport, prefetch: bool):
+    """Refresh, optionally prefetch, then speak the likely dialogs."""
+    renderer = DialogRenderer(LANGUAGE)
+    rendered_dialogs = RenderedDialogs()
+    tts = StubTTS()
+    intent_data = build_intent("what's the weather")
+    config = build_config()
+    if prefetch:
+        utterances = []
+        for dialog in build_likely_dialogs(weather, intent_data, config):
+            utterance = renderer.render(dialog.name, dialog.data)
+            rendered_dialogs.add_pending(LANGUAGE, dialog, utterance)
+            utterances.append(utterance)
+        cached_utterances = tts.handle_prefetch(
+            StubMessage(TTS_PREFETCH_EVENT, dict(utterances=utterances))
+        )
+        rendered_dialogs.confirm(LANGUAGE, cached_utterances)
+
+    latencies = []
+    for dialog in build_likely_dialogs(weather, intent_data, config):
+        utterance = rendered_dialogs.get(LANGUAGE, dialog)
+        if utterance is None:
+            utterance = renderer.render(dialog.name, dialog.data)
+        latencies.append((dialog.name, tts.speak(utterance)))
+
+    return tts, latencies
+
+
+def main(fixture_name: str = "onecall_clear"):
+    weather = WeatherReport(load_fixture(fixture_name))
+    cold_tts, cold_latencies = speak_likely_dialogs(weather, prefetch=False)
+    warm_tts, warm_latencies = speak_likely_dialogs(weather, prefetch=True)
+
+    print("fixture: " + fixture_name)
+    print("warmed phrases:")
+    for utterance in warm_tts.prefetched:
+        print("    " + utterance)
+    print()
+    print("{:<36}{:>12}{:>12}".format("time to audio (s)", "cold", "prefetched"))
+    for (name, cold), (_, warm) in zip(cold_latencies, warm_latencies):
+        print("{:<36}{:>12.2f}{:>12.2f}".format(name, cold, warm))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,55 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the binary report encoding with the raw One Call JSON.
+
+Usage:
+    python test/benchmark/bench_serialization.py [fixture name] [repeat]
+"""
+import json
+import sys
+
+from harness import install_stubs, load_fixture, time_call
+
+install_stubs()
+
+from skill.weather import WeatherReport  # noqa: E402
+
+
+def main(fixture_name: str = "onecall_clear", repeat: int = 1000):
+    raw_report = load_fixture(fixture_name)
+    json_text = json.dumps(raw_report, separators=(",", ":"))
+    weather = WeatherReport(raw_report)
+    encoded = weather.to_bytes()
+
+    results = (
+        ("size (bytes)", len(json_text.encode("utf-8")), len(encoded)),
+        (
+            "encode (us)",
+            time_call(json.dumps, raw_report, repeat=repeat),
+            time_call(weather.to_bytes, repeat=repeat),
+        ),
+        (
+            "decode to report (us)",
+            time_call(lambda: WeatherReport(json.loads(json_text)), repeat=repeat),
+            time_call(WeatherReport.from_bytes, encoded, repeat=repeat),
+        ),
+    )
+    print("fixture: " + fixture_name)
+    print("{:<24}{:>14}{:>14}".format("", "One Call JSON", "binary"))
+    for label, json_result, binary_result in results:
+        print("{:<24}{:>14.1f}{:>14.1f}".format(label, json_result, binary_result))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,368 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Time the work done on every request and compare it with a stored baseline.
+
+Each case runs against every recorded One Call response in the fixtures
+directory.  The fixtures cover a clear day, rain, weather alerts, the night
+clocks spring forward and a location in the southern hemisphere.  The mycroft
+utilities are always replaced by the harness stand-ins.  The clock is frozen at
+the time each fixture was recorded, so requests like "tomorrow" pick the same
+forecast entries on every run.
+
+The cases are parsing the report, resolving an intent, the report lookups, each
+dialog builder and preparing each GUI screen.  The dialog cache is disabled so
+the builders do their full work, as they do for the first request of a report.
+GUI screens are prepared from a new WeatherDisplay for the same reason.
+
+Each round also times a fixed reference workload.  The baseline is scaled by
+how much faster or slower the reference ran than when the baseline was saved,
+which absorbs a machine that is busy or throttled for the whole run.  A case is
+reported as slower when its best time is more than 25% above the scaled
+baseline, and the script then exits with status 1.
+
+Timings still depend on the machine, so no baseline is kept in the repository.
+Save one with --save on the machine that runs the comparisons, before making
+the changes to compare.  It is written to baseline.json next to this script,
+which git ignores.  README.md in this directory describes the workflow.
+
+Usage:
+    python test/benchmark/bench_suite.py [--save] [--fixture NAME]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from harness import (
+    build_config,
+    build_intent,
+    freeze_clock,
+    install_stubs,
+    load_fixture,
+    time_call,
+)
+
+install_stubs(always=True)
+
+from skill import dialog  # noqa: E402
+from skill.dialog import (  # noqa: E402
+    CurrentDialog,
+    DailyDialog,
+    HourlyDialog,
+    WeeklyDialog,
+)
+from skill.display import TWELVE_HOUR, WeatherDisplay  # noqa: E402
+from skill.weather import DAILY, HOURLY, WeatherReport  # noqa: E402
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+FIXTURES = (
+    "onecall_clear",
+    "onecall_rain",
+    "onecall_alerts",
+    "onecall_dst",
+    "onecall_southern",
+)
+REGRESSION_THRESHOLD = 1.25
+REFERENCE_CASE = "reference"
+ROUNDS = 9
+
+
+class FixtureCases:
+    """The inputs of the benchmark cases for one fixture."""
+
+    def __init__(self, fixture_name: str):
+        """Constructor
+
+        :param fixture_name: the recorded One Call response to use
+        """
+        self.report = load_fixture(fixture_name)
+        freeze_clock(self.report["current"]["dt"])
+        self.weather = WeatherReport(self.report)
+        self.config = build_config()
+        self.current_intent = build_intent("what's the weather")
+        self.daily_intent = build_intent("what's the weather tomorrow")
+        self.daily_intent.timeframe = DAILY
+        self.hourly_intent = build_intent("what's the weather tonight")
+        self.hourly_intent.timeframe = HOURLY
+        self.speakable_days = self.weather.get_speakable_days("en-us")
+        self.tomorrow = self.weather.get_forecast_for_date(self.daily_intent)
+        self.tonight = self.weather.get_forecast_for_hour(self.hourly_intent)
+        self.next_precipitation, _ = self.weather.get_next_precipitation(
+            self.current_intent
+        )
+
+    def list_cases(self) -> list:
+        """List the name, function and arguments of each case."""
+        weather = self.weather
+        cases = [
+            ("WeatherReport", WeatherReport, self.report),
+            ("WeatherIntent", resolve_intent, "what's the weather tomorrow"),
+            (
+                "get_forecast_for_date",
+                weather.get_forecast_for_date,
+                self.daily_intent,
+            ),
+            (
+                "get_forecast_for_hour",
+                weather.get_forecast_for_hour,
+                self.hourly_intent,
+            ),
+            (
+                "get_forecast_for_multiple_days",
+                weather.get_forecast_for_multiple_days,
+                3,
+            ),
+            (
+                "get_next_precipitation",
+                weather.get_next_precipitation,
+                self.current_intent,
+            ),
+        ]
+        cases.extend(self._list_dialog_cases())
+        cases.extend(
+            ("display." + screen_name, prepare_screen, weather, prepare)
+            for screen_name, prepare in SCREENS
+        )
+
+        return cases
+
+    def _list_dialog_cases(self) -> list:
+        """List a case for each build method of each dialog class."""
+        current = (CurrentDialog, self.current_intent, self.weather.current)
+        hourly = (HourlyDialog, self.hourly_intent, self.tonight)
+        daily = (DailyDialog, self.daily_intent, self.tomorrow)
+        builders = [
+            (current, "build_weather_dialog"),
+            (current, "build_high_low_temperature_dialog"),
+            (current, "build_temperature_dialog", "high"),
+            (current, "build_condition_dialog", True),
+            (current, "build_sunrise_dialog"),
+            (current, "build_sunset_dialog"),
+            (current, "build_wind_dialog"),
+            (current, "build_humidity_dialog"),
+            (hourly, "build_weather_dialog"),
+            (hourly, "build_temperature_dialog", None),
+            (hourly, "build_condition_dialog", True),
+            (hourly, "build_wind_dialog"),
+            (
+                (HourlyDialog, self.current_intent, self.next_precipitation),
+                "build_next_precipitation_dialog",
+            ),
+            (daily, "build_weather_dialog"),
+            (daily, "build_temperature_dialog", "low"),
+            (daily, "build_condition_dialog", True),
+            (daily, "build_sunrise_dialog"),
+            (daily, "build_sunset_dialog"),
+            (daily, "build_wind_dialog"),
+            (daily, "build_humidity_dialog"),
+            (
+                (DailyDialog, self.current_intent, self.next_precipitation),
+                "build_next_precipitation_dialog",
+            ),
+        ]
+        weekly_forecast = self.weather.weekly_forecast
+        weekly = (WeeklyDialog, self.current_intent, weekly_forecast)
+        builders.append((weekly, "build_temperature_dialog"))
+        builders.extend(
+            (weekly, "build_condition_dialog", condition)
+            for condition in weekly_forecast.conditions
+        )
+        cases = []
+        for (dialog_class, intent_data, forecast), method_name, *args in builders:
+            case_name = dialog_class.__name__ + "." + method_name
+            if dialog_class is WeeklyDialog and args:
+                case_name += "." + args[0].lower()
+            dialog_args = (intent_data, self.config, forecast, self.speakable_days)
+            cases.append(
+                (case_name, build_dialog, dialog_class, dialog_args, method_name, *args)
+            )
+
+        return cases
+
+
+def run_reference_workload():
+    """Do a fixed amount of the kind of work the skill does: dicts and strings."""
+    values = {str(number): number * 1.5 for number in range(100)}
+
+    return sorted("{}={:.1f}".format(key, value) for key, value in values.items())
+
+
+def resolve_intent(utterance: str):
+    """Parse an utterance into intent data and resolve its datetime."""
+    return build_intent(utterance).intent_datetime
+
+
+def build_dialog(dialog_class, dialog_args: tuple, method_name: str, *args):
+    """Create a dialog builder and call one of its build methods."""
+    dialog_builder = dialog_class(*dialog_args)
+    getattr(dialog_builder, method_name)(*args)
+
+    return dialog_builder
+
+
+def prepare_screen(weather: WeatherReport, prepare):
+    """Prepare the values of a screen for a report that was not displayed yet."""
+    return prepare(WeatherDisplay(weather, TWELVE_HOUR))
+
+
+SCREENS = (
+    ("current_mark_ii", lambda display: display.current_mark_ii),
+    ("current_scalable", lambda display: display.current_scalable),
+    ("current_details", lambda display: display.current_details),
+    ("mark_i_current", lambda display: display.mark_i_current),
+    ("hourly_mark_ii", lambda display: display.hourly_mark_ii),
+    (
+        "daily_mark_ii",
+        lambda display: display.get_days_mark_ii(display.weather.daily[1:8]),
+    ),
+    (
+        "daily_scalable",
+        lambda display: display.get_days_scalable(display.weather.daily[1:8]),
+    ),
+    (
+        "single_day",
+        lambda display: display.get_single_day(display.weather.tomorrow),
+    ),
+    (
+        "sunrise_sunset",
+        lambda display: display.get_sunrise_sunset(display.weather.today),
+    ),
+)
+
+
+def calibrate_repeat(function, *args) -> int:
+    """Find how many calls of a function take at least 5 milliseconds."""
+    repeat = 100
+    while time_call(function, *args, repeat=repeat) * repeat < 5000:
+        repeat *= 4
+
+    return repeat
+
+
+def run_fixture(fixture_name: str) -> dict:
+    """Time every case for a fixture, keeping the best round of each.
+
+    The rounds go through all the cases in turn, so a burst of activity on the
+    machine slows one round of many cases rather than every round of one case.
+    """
+    fixture_cases = FixtureCases(fixture_name)
+    cases = [
+        (case_name, calibrate_repeat(function, *args), function, args)
+        for case_name, function, *args in [
+            (REFERENCE_CASE, run_reference_workload),
+            *fixture_cases.list_cases(),
+        ]
+    ]
+    timings = {case_name: float("inf") for case_name, *_ in cases}
+    for _ in range(ROUNDS):
+        for case_name, repeat, function, args in cases:
+            microseconds = time_call(function, *args, repeat=repeat)
+            timings[case_name] = min(timings[case_name], microseconds)
+    freeze_clock(None)
+
+    return timings
+
+
+def load_baseline() -> dict:
+    """Load the stored timings, if any."""
+    if BASELINE_PATH.exists():
+        with open(BASELINE_PATH) as baseline_file:
+            baseline = json.load(baseline_file)
+    else:
+        baseline = dict()
+
+    return baseline
+
+
+def save_baseline(baseline: dict):
+    """Store the timings of this run as the new baseline."""
+    with open(BASELINE_PATH, "w") as baseline_file:
+        rounded_baseline = {
+            fixture_name: {
+                case_name: round(microseconds, 3)
+                for case_name, microseconds in timings.items()
+            }
+            for fixture_name, timings in baseline.items()
+        }
+        json.dump(rounded_baseline, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def print_comparison(fixture_name: str, timings: dict, baseline: dict) -> int:
+    """Print the timings of a fixture next to the baseline.
+
+    Returns:
+        the number of cases slower than the baseline allows
+    """
+    regressions = 0
+    if REFERENCE_CASE in baseline:
+        scale = timings[REFERENCE_CASE] / baseline[REFERENCE_CASE]
+    else:
+        scale = 1
+    print("fixture: {} (baseline scaled by {:.2f})".format(fixture_name, scale))
+    print("{:<52}{:>12}{:>14}{:>10}".format("case", "time (us)", "baseline (us)", ""))
+    for case_name, microseconds in timings.items():
+        baseline_microseconds = baseline.get(case_name)
+        if case_name == REFERENCE_CASE or baseline_microseconds is None:
+            print("{:<52}{:>12.2f}{:>14}".format(case_name, microseconds, "-"))
+            continue
+        baseline_microseconds *= scale
+        ratio = microseconds / baseline_microseconds
+        if ratio > REGRESSION_THRESHOLD:
+            verdict = "SLOWER"
+            regressions += 1
+        else:
+            verdict = ""
+        print(
+            "{:<52}{:>12.2f}{:>14.2f}{:>+9.0%} {}".format(
+                case_name, microseconds, baseline_microseconds, ratio - 1, verdict
+            )
+        )
+    print()
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--save", action="store_true", help="store the timings as the baseline"
+    )
+    parser.add_argument(
+        "--fixture", choices=FIXTURES, help="only time the cases of one fixture"
+    )
+    arguments = parser.parse_args()
+
+    dialog._dialog_cache.max_size = 0
+    baseline = load_baseline()
+    regressions = 0
+    for fixture_name in [arguments.fixture] if arguments.fixture else FIXTURES:
+        timings = run_fixture(fixture_name)
+        regressions += print_comparison(
+            fixture_name, timings, baseline.get(fixture_name, {})
+        )
+        baseline[fixture_name] = timings
+
+    if arguments.save:
+        save_baseline(baseline)
+        print("baseline saved to " + str(BASELINE_PATH))
+    elif not BASELINE_PATH.exists():
+        print("no baseline to compare with, save one with --save")
+    elif regressions:
+        print("{} cases are slower than the baseline".format(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare speaking forecast dialogs separately with merging them into utterances.
+
+Builds the dialogs of a week summary and a seven day forecast, renders them,
+groups them as the skill does for each sentences_per_utterance setting and
+speaks them on the stand-in TTS service.  Reports the simulated time until the
+first audio and until the last utterance finishes.
+
+Usage:
+    python test/benchmark/bench_utterances.py [fixture name]
+"""
+import sys
+
+from harness import (
+    build_config,
+    build_intent,
+    DialogRenderer,
+    install_stubs,
+    load_fixture,
+)
+from stub_tts import StubTTS
+
+install_stubs()
+
+from skill.dialog import DailyDialog, WeeklyDialog  # noqa: E402
+from skill.speech import group_dialogs, join_sentences  # noqa: E402
+from skill.weather import WeatherReport  # noqa: E402
+
+LANGUAGE = "en-us"
+SENTENCES_PER_UTTERANCE = (1, 2, 3, 0)
+
+
+def build_week_summary(weather, intent_data, config):
+    """Build the dialogs of a week summary like the skill does."""
+    forecast = weather.weekly_forecast
+    speakable_days = weather.get_speakable_days(LANGUAGE)
+    for condition in forecast.conditions:
+        dialog = WeeklyDialog(intent_data, config, forecast, speakable_days)
+        dialog.build_condition_dialog(condition=condition)
+        yield dialog
+    dialog = WeeklyDialog(intent_data, config, forecast, speakable_days)
+    dialog.build_temperature_dialog()
+    yield dialog
+
+
+def build_seven_day_forecast(weather, intent_data, config):
+    """Build the dialogs of a seven day forecast like the skill does."""
+    speakable_days = weather.get_speakable_days(LANGUAGE)
+    for forecast_day in weather.weekly_forecast:
+        dialog = DailyDialog(intent_data, config, forecast_day, speakable_days)
+        dialog.build_weather_dialog()
+        yield dialog
+
+
+def speak(dialogs, group_size: int):
+    """Speak dialogs merged into groups, returning the first audio and end times."""
+    renderer = DialogRenderer(LANGUAGE)
+    tts = StubTTS()
+    first_audio = None
+    for dialog_group in group_dialogs(dialogs, group_size):
+        utterance = join_sentences(
+            [renderer.render(dialog.name, dialog.data) for dialog in dialog_group]
+        )
+        latency = tts.speak(utterance)
+        if first_audio is None:
+            first_audio = latency
+
+    return len(tts.spoken), first_audio, tts.clock
+
+
+def main(fixture_name: str = "onecall_clear"):
+    weather = WeatherReport(load_fixture(fixture_name))
+    intent_data = build_intent("what's the weather this week")
+    config = build_config()
+
+    print("fixture: " + fixture_name)
+    print(
+        "{:<22}{:>12}{:>12}{:>16}{:>12}".format(
+            "", "sentences", "utterances", "first audio (s)", "done (s)"
+        )
+    )
+    for label, build in (
+        ("week summary", build_week_summary),
+        ("seven day forecast", build_seven_day_forecast),
+    ):
+        for group_size in SENTENCES_PER_UTTERANCE:
+            utterances, first_audio, done = speak(
+                build(weather, intent_data, config), group_size
+            )
+            print(
+                "{:<22}{:>12}{:>12}{:>16.2f}{:>12.2f}".format(
+                    label, group_size or "all", utterances, first_audio, done
+                )
+            )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,315 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared setup for the weather skill benchmarks.
+
+The benchmarks run offline against recorded One Call API responses in the
+fixtures directory.  When mycroft-core is not installed, minimal stand-ins for
+the mycroft utilities used by the skill are installed so the skill modules can
+be imported.  The stand-ins are deterministic, which keeps timings comparable
+between runs but means language specific formatting is not exercised.
+"""
+import collections
+import json
+import random
+import re
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+
+import pytz
+
+SKILL_DIRECTORY = Path(__file__).parents[2]
+FIXTURE_DIRECTORY = Path(__file__).parent.joinpath("fixtures")
+STUB_TIMEZONE = "America/Chicago"
+STUB_CORE_CONFIG = dict(
+    system_unit="imperial",
+    time_format="half",
+    location=dict(
+        city=dict(
+            name="Kansas City",
+            state=dict(name="Missouri", country=dict(name="United States")),
+        ),
+        coordinate=dict(latitude=39.0997, longitude=-94.5786),
+    ),
+)
+
+
+_frozen_timestamp = None
+
+
+def freeze_clock(timestamp: float = None):
+    """Make the stand-in clock report a fixed time, or the real time again.
+
+    Benchmarks freeze the clock at the time a fixture was recorded so that
+    requests like "tomorrow" resolve to the same forecast entries on every run.
+    """
+    global _frozen_timestamp
+    _frozen_timestamp = timestamp
+
+
+def _now_local(tz=None):
+    """Stand-in for mycroft.util.time.now_local()"""
+    if tz is None:
+        tz = STUB_TIMEZONE
+    if isinstance(tz, str):
+        tz = pytz.timezone(tz)
+    if _frozen_timestamp is None:
+        return datetime.now(tz)
+
+    return datetime.fromtimestamp(_frozen_timestamp, tz)
+
+
+def _nice_date(date_time, lang=None, now=None):
+    """Stand-in for mycroft.util.format.nice_date()"""
+    return date_time.strftime("%A, %B %d, %Y")
+
+
+def _nice_time(date_time, lang=None, speech=True, use_24hour=False, use_ampm=False):
+    """Stand-in for mycroft.util.format.nice_time()"""
+    return date_time.strftime("%I:%M %p").lstrip("0")
+
+
+def _nice_number(number, lang=None, speech=True, denominators=None):
+    """Stand-in for mycroft.util.format.nice_number()"""
+    return str(number)
+
+
+def _join_list(items, connector, sep=None, lang=None):
+    """Stand-in for mycroft.util.format.join_list()"""
+    items = list(items)
+    if len(items) < 2:
+        return "".join(items)
+
+    return ", ".join(items[:-1]) + " " + connector + " " + items[-1]
+
+
+def _expand_options(phrase):
+    """Stand-in for mycroft.util.format.expand_options() without nesting support."""
+    match = re.search(r"\(([^()]*)\)", phrase)
+    if match is None:
+        return [phrase]
+    expanded = []
+    for option in match.group(1).split("|"):
+        expanded.extend(
+            _expand_options(phrase[: match.start()] + option + phrase[match.end() :])
+        )
+
+    return expanded
+
+
+def _extract_datetime(text, anchorDate=None, lang=None, default_time=None):
+    """Stand-in for mycroft.util.parse.extract_datetime() that knows a few words."""
+    anchor = (anchorDate or _now_local()).replace(microsecond=0)
+    midnight = anchor.replace(hour=0, minute=0, second=0)
+    if "tomorrow" in text:
+        extracted = midnight + timedelta(days=1)
+    elif "tonight" in text:
+        extracted = midnight.replace(hour=22)
+    else:
+        return None
+
+    return extracted, ""
+
+
+def _extract_number(text, lang=None, short_scale=True, ordinals=False):
+    """Stand-in for mycroft.util.parse.extract_number()"""
+    for word in text.split():
+        if word.isdigit():
+            return int(word)
+
+    return False
+
+
+class _Api:
+    """Stand-in for mycroft.api.Api that refuses to reach the network."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def request(self, params):
+        raise RuntimeError("Benchmarks must not call the Mycroft API")
+
+
+class _GeolocationApi(_Api):
+    """Stand-in for mycroft.api.GeolocationApi"""
+
+    def __init__(self):
+        super().__init__("geolocation")
+
+    def get_geolocation(self, location):
+        return None
+
+
+def _module(name: str, **attributes) -> ModuleType:
+    """Register a stand-in module in the import system."""
+    module = ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+
+    return module
+
+
+def _is_core_installed() -> bool:
+    """Determine if mycroft-core can be imported."""
+    try:
+        import mycroft  # noqa: F401
+    except ImportError:
+        return False
+
+    return True
+
+
+def install_stubs(always: bool = False):
+    """Make the skill importable, using mycroft stand-ins if core is missing.
+
+    Args:
+        always: use the stand-ins even when mycroft-core is installed, for
+            timings that do not depend on the installed version of core
+    """
+    if str(SKILL_DIRECTORY) not in sys.path:
+        sys.path.insert(0, str(SKILL_DIRECTORY))
+    if always or not _is_core_installed():
+        _module("mycroft", __path__=[])
+        _module("mycroft.api", Api=_Api, GeolocationApi=_GeolocationApi)
+        _module("mycroft.messagebus", __path__=[])
+        _module("mycroft.messagebus.message", Message=StubMessage)
+        _module("mycroft.util", __path__=[])
+        _module(
+            "mycroft.util.format",
+            expand_options=_expand_options,
+            join_list=_join_list,
+            nice_date=_nice_date,
+            nice_number=_nice_number,
+            nice_time=_nice_time,
+        )
+        _module(
+            "mycroft.util.parse",
+            extract_datetime=_extract_datetime,
+            extract_number=_extract_number,
+        )
+        _module("mycroft.util.time", now_local=_now_local)
+
+
+class DialogRenderer:
+    """Stand-in for the mycroft dialog renderer reading the skill's locale files.
+
+    Templates are picked with a seeded random generator so runs are repeatable.
+    """
+
+    def __init__(self, language: str = "en-us", seed: int = 0):
+        self.language = language
+        self.random = random.Random(seed)
+        self.templates = dict()
+        language_directory = SKILL_DIRECTORY.joinpath("locale", language)
+        for dialog_path in language_directory.glob("**/*.dialog"):
+            lines = dialog_path.read_text(encoding="utf-8").splitlines()
+            self.templates[dialog_path.stem] = [line for line in lines if line]
+
+    def render(self, template_name: str, context: dict = None) -> str:
+        template = self.random.choice(self.templates[template_name])
+
+        return template.format_map(collections.defaultdict(str, context or {}))
+
+
+class StubGui:
+    """Stand-in for mycroft.enclosure.gui.SkillGUI that records its bus messages.
+
+    Follows the behaviour of SkillGUI: once a page is showing, every assignment
+    sends all of the skill's values; before that, values are only stored and
+    sent along with the next page shown.  It also stands in for the skill's
+    message bus, recording the messages emitted on it.
+    """
+
+    connected = True
+
+    def __init__(self, skill_id: str = "mycroft-weather.mycroftai"):
+        self.skill_id = skill_id
+        self.session_data = dict()
+        self.pages = []
+        self.messages = []
+
+    @property
+    def page(self):
+        return self.pages[-1] if self.pages else None
+
+    @property
+    def _SkillGUI__session_data(self):
+        """The private session data of SkillGUI, under its mangled name."""
+        return self.session_data
+
+    def _emit(self, msg_type: str, data: dict):
+        self.messages.append((msg_type, json.dumps(data)))
+
+    def emit(self, message):
+        self._emit(message.msg_type, message.data)
+
+    def __setitem__(self, key, value):
+        self.session_data[key] = value
+        if self.pages:
+            self._emit("gui.value.set", dict(self.session_data, __from=self.skill_id))
+
+    def clear(self):
+        self.session_data = dict()
+        self.pages = []
+        self._emit("gui.clear.namespace", dict(__from=self.skill_id))
+
+    def show_page(self, name: str, override_idle=None):
+        self._emit("gui.value.set", dict(self.session_data, __from=self.skill_id))
+        self.pages.append(name)
+        self._emit("gui.page.show", dict(page=self.pages, __from=self.skill_id))
+
+    def replace_page(self, name: str, override_idle=None):
+        self.pages = self.pages[:-1]
+        self.show_page(name, override_idle)
+
+
+class StubMessage:
+    """Stand-in for mycroft.messagebus.message.Message"""
+
+    def __init__(self, msg_type: str, data: dict = None):
+        self.msg_type = msg_type
+        self.data = data or {}
+
+
+def build_intent(utterance: str, language: str = "en-us"):
+    """Build the intent data for a request about the device's location."""
+    from skill.intent import WeatherIntent
+
+    return WeatherIntent(StubMessage("intent", dict(utterance=utterance)), language)
+
+
+def build_config(settings: dict = None):
+    """Build the weather configuration of the stand-in device."""
+    from skill.config import WeatherConfig
+
+    return WeatherConfig(STUB_CORE_CONFIG, settings or {})
+
+
+def load_fixture(name: str) -> dict:
+    """Load a recorded One Call API response from the fixtures directory."""
+    fixture_path = FIXTURE_DIRECTORY.joinpath(name + ".json")
+    with open(fixture_path) as fixture_file:
+        return json.load(fixture_file)
+
+
+def time_call(function, *args, repeat: int = 1000) -> float:
+    """Call a function repeatedly and report the mean duration in microseconds."""
+    start = perf_counter()
+    for _ in range(repeat):
+        function(*args)
+    elapsed = perf_counter() - start
+
+    return elapsed / repeat * 1_000_000
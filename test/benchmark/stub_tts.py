@@ -0,0 +1,74 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A stand-in TTS service with a sentence cache and a simulated clock.
+
+Nothing is synthesized and nothing sleeps.  Each request advances a simulated
+clock by a fixed round trip plus a synthesis time proportional to the length of
+the text, unless the text is already in the cache.  Playback advances the clock
+by a speaking time proportional to the number of words.  This keeps benchmark
+results deterministic while preserving the costs that matter: round trips,
+synthesis and gaps between utterances.
+"""
+REQUEST_ROUND_TRIP = 0.05
+SYNTHESIS_SECONDS_PER_CHARACTER = 0.004
+SPEAKING_SECONDS_PER_WORD = 0.3
+INTER_UTTERANCE_GAP = 0.25
+
+
+class StubTTS:
+    """Cache, synthesize and speak utterances on a simulated clock.
+
+    Attributes:
+        clock: the simulated time in seconds
+        cache: the utterances synthesized so far
+        prefetched: the utterances received in prefetch requests, in order
+        spoken: the utterances spoken, in order
+    """
+
+    def __init__(self):
+        self.clock = 0.0
+        self.cache = set()
+        self.prefetched = []
+        self.spoken = []
+
+    def handle_prefetch(self, message) -> list:
+        """Synthesize the utterances of a prefetch event into the cache.
+
+        Prefetching happens in the background, so it does not advance the clock.
+
+        Returns:
+            the utterances cached, as sent back to the skill in the response
+        """
+        for utterance in message.data["utterances"]:
+            self.prefetched.append(utterance)
+            self.cache.add(utterance)
+
+        return list(message.data["utterances"])
+
+    def speak(self, utterance: str) -> float:
+        """Synthesize, if necessary, and speak an utterance.
+
+        Returns:
+            the simulated time from the request until audio starts playing
+        """
+        latency = REQUEST_ROUND_TRIP
+        if utterance not in self.cache:
+            latency += len(utterance) * SYNTHESIS_SECONDS_PER_CHARACTER
+            self.cache.add(utterance)
+        if self.spoken:
+            latency += INTER_UTTERANCE_GAP
+        self.clock += latency + len(utterance.split()) * SPEAKING_SECONDS_PER_WORD
+        self.spoken.append(utterance)
+
+        return latency
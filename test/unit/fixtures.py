@@ -0,0 +1,98 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Recorded One Call API responses and stand-ins shared with the benchmarks."""
+import json
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+SKILL_DIRECTORY = Path(__file__).parents[2]
+BENCHMARK_DIRECTORY = SKILL_DIRECTORY.joinpath("test", "benchmark")
+FIXTURE_DIRECTORY = BENCHMARK_DIRECTORY.joinpath("fixtures")
+SKILL_PROVIDED_ATTRIBUTES = (
+    "bus",
+    "config_core",
+    "dialog_renderer",
+    "file_system",
+    "gui",
+    "lang",
+    "log",
+    "settings",
+    "skill_id",
+)
+FIXTURE_NAMES = (
+    "onecall_clear",
+    "onecall_rain",
+    "onecall_alerts",
+    "onecall_dst",
+    "onecall_southern",
+)
+
+
+def load_report(name: str = "onecall_clear") -> dict:
+    """Load a recorded One Call API response."""
+    with open(FIXTURE_DIRECTORY.joinpath(name + ".json")) as fixture_file:
+        return json.load(fixture_file)
+
+
+def import_from_path(module_name: str, path: Path):
+    """Import a module that is not on the import path, like the skill itself.
+
+    The skill directory is named after the skill, which is not a valid module
+    name, so it is imported as a package under the name given.
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        if path.name == "__init__.py":
+            spec = spec_from_file_location(
+                module_name, path, submodule_search_locations=[str(path.parent)]
+            )
+        else:
+            spec = spec_from_file_location(module_name, path)
+        module = module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+    return module
+
+
+def load_skill_module():
+    """Import the skill's __init__.py as the weather_skill package."""
+    return import_from_path("weather_skill", SKILL_DIRECTORY.joinpath("__init__.py"))
+
+
+def build_skill(test_case: TestCase, **attributes):
+    """Build a WeatherSkill for a test without mycroft-core loading it.
+
+    The attributes MycroftSkill provides, some of which are read-only properties,
+    are patched on the skill class until the test ends.  The others are set on
+    the skill.
+
+    Args:
+        test_case: the test the skill is built for
+        attributes: the attributes of the skill used by the test
+    """
+    skill_class = load_skill_module().WeatherSkill
+    skill = skill_class.__new__(skill_class)
+    for name, value in attributes.items():
+        if name in SKILL_PROVIDED_ATTRIBUTES:
+            patcher = patch.object(skill_class, name, value, create=True)
+            test_case.addCleanup(patcher.stop)
+            patcher.start()
+        else:
+            setattr(skill, name, value)
+
+    return skill
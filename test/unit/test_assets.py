@@ -0,0 +1,140 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for giving the GUI the prepared condition images."""
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from skill import assets
+from skill.assets import GuiAssets
+from skill.display import TWELVE_HOUR
+from skill.weather import WeatherReport
+from .fixtures import SKILL_DIRECTORY, load_report
+
+IMAGE_NAMES = ("sun.svg", "moon.svg")
+
+
+class TestPreparedConditionImages(TestCase):
+    def setUp(self):
+        assets._prepared_assets.clear()
+        self.addCleanup(assets._prepared_assets.clear)
+        self.weather = WeatherReport(load_report("onecall_clear"))
+
+    def _publish_current_image(self) -> str:
+        """Publish a prepared image of the current condition, returning its URL."""
+        svg_path = self.weather.current.condition.image
+        png_path = Path("/data/ui/images/112", Path(svg_path).stem + ".png")
+        GuiAssets._publish(svg_path, png_path)
+
+        return "file://" + str(png_path)
+
+    def test_image_is_the_svg_until_prepared(self):
+        svg_path = self.weather.current.condition.image
+        png_url = self._publish_current_image()
+
+        self.assertTrue(svg_path.startswith("images/"))
+        self.assertEqual(self.weather.current.condition.image, png_url)
+
+    def test_display_shown_before_preparation_is_rebuilt(self):
+        before = self.weather.get_display(TWELVE_HOUR).current_mark_ii
+        png_url = self._publish_current_image()
+        after = self.weather.get_display(TWELVE_HOUR).current_mark_ii
+
+        self.assertTrue(before["weatherCondition"].endswith(".svg"))
+        self.assertEqual(after["weatherCondition"], png_url)
+
+    def test_display_is_reused_while_assets_are_unchanged(self):
+        self._publish_current_image()
+
+        self.assertIs(
+            self.weather.get_display(TWELVE_HOUR),
+            self.weather.get_display(TWELVE_HOUR),
+        )
+
+
+class TestPrepareImages(TestCase):
+    """Rasterize images with a stand-in for cairosvg, which needs cairo installed."""
+
+    def setUp(self):
+        assets._prepared_assets.clear()
+        self.addCleanup(assets._prepared_assets.clear)
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.asset_directory = Path(temporary_directory.name)
+        self.cairosvg = Mock()
+        self.cairosvg.svg2png.side_effect = lambda url, output_height: (
+            "png of {} at {}".format(Path(url).name, output_height).encode()
+        )
+        patcher = patch.object(assets, "cairosvg", self.cairosvg)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        self.gui_assets = GuiAssets(
+            SKILL_DIRECTORY.joinpath("ui"), self.asset_directory
+        )
+
+    def _get_png_path(self, image_name: str, height: int = 112) -> Path:
+        return self.asset_directory.joinpath(
+            "images", str(height), Path(image_name).stem + ".png"
+        )
+
+    def test_images_are_rasterized_at_the_height(self):
+        image_count = self.gui_assets.prepare_images(IMAGE_NAMES, height=112)
+
+        self.assertEqual(2, image_count)
+        self.assertEqual(
+            b"png of sun.svg at 112", self._get_png_path("sun.svg").read_bytes()
+        )
+        self.assertEqual(
+            [], list(self.asset_directory.joinpath("images", "112").glob("*.tmp"))
+        )
+
+    def test_prepared_images_are_given_to_the_gui(self):
+        self.gui_assets.prepare_images(IMAGE_NAMES, height=112)
+
+        self.assertEqual(2, assets.count_prepared_assets())
+        self.assertEqual(
+            "file://" + str(self._get_png_path("sun.svg")),
+            assets.resolve_asset("images/sun.svg"),
+        )
+        self.assertEqual("images/rain.svg", assets.resolve_asset("images/rain.svg"))
+
+    def test_up_to_date_images_are_not_rasterized_again(self):
+        self.gui_assets.prepare_images(IMAGE_NAMES)
+        self.cairosvg.svg2png.reset_mock()
+
+        self.assertEqual(2, self.gui_assets.prepare_images(IMAGE_NAMES))
+        self.cairosvg.svg2png.assert_not_called()
+
+    def test_image_older_than_its_source_is_rasterized_again(self):
+        self.gui_assets.prepare_images(IMAGE_NAMES)
+        png_path = self._get_png_path("sun.svg")
+        os.utime(str(png_path), ns=(0, 0))
+        self.cairosvg.svg2png.reset_mock()
+
+        self.gui_assets.prepare_images(IMAGE_NAMES)
+
+        self.cairosvg.svg2png.assert_called_once_with(
+            url=str(SKILL_DIRECTORY.joinpath("ui", "images", "sun.svg")),
+            output_height=112,
+        )
+
+    def test_nothing_is_prepared_without_cairosvg(self):
+        with patch.object(assets, "cairosvg", None):
+            image_count = self.gui_assets.prepare_images(IMAGE_NAMES)
+
+        self.assertEqual(0, image_count)
+        self.assertEqual(0, assets.count_prepared_assets())
+        self.assertFalse(self.asset_directory.joinpath("images").exists())
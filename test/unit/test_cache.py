@@ -0,0 +1,93 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the forecast cache."""
+from unittest import TestCase
+
+from skill.cache import build_forecast_key, ForecastCache
+from skill.util import estimate_size
+from skill.weather import WeatherReport
+from .fixtures import load_report
+
+KANSAS_CITY = build_forecast_key("imperial", 39.0997, -94.5786, "en-us")
+SEATTLE = build_forecast_key("imperial", 47.6062, -122.3321, "en-us")
+SYDNEY = build_forecast_key("metric", -33.8688, 151.2093, "en-us")
+
+
+class TestForecastCacheMemoryBudget(TestCase):
+    def setUp(self):
+        self.reports = {
+            KANSAS_CITY: WeatherReport(load_report("onecall_clear")),
+            SEATTLE: WeatherReport(load_report("onecall_rain")),
+            SYDNEY: WeatherReport(load_report("onecall_southern")),
+        }
+        self.sizes = {
+            key: estimate_size(report) for key, report in self.reports.items()
+        }
+
+    def _fill(self, cache: ForecastCache, *keys):
+        for key in keys:
+            cache.update(key, self.reports[key])
+
+    def test_tracks_the_memory_used(self):
+        cache = ForecastCache()
+        self._fill(cache, KANSAS_CITY, SEATTLE)
+
+        self.assertEqual(
+            cache.memory_used, self.sizes[KANSAS_CITY] + self.sizes[SEATTLE]
+        )
+
+    def test_evicts_the_least_recently_used_location(self):
+        cache = ForecastCache(self.sizes[KANSAS_CITY] + self.sizes[SEATTLE])
+        self._fill(cache, KANSAS_CITY, SEATTLE)
+        cache.get(KANSAS_CITY)
+
+        self._fill(cache, SYDNEY)
+
+        self.assertIsNone(cache.get(SEATTLE))
+        self.assertIs(cache.get(KANSAS_CITY), self.reports[KANSAS_CITY])
+        self.assertIs(cache.get(SYDNEY), self.reports[SYDNEY])
+        self.assertEqual(
+            cache.memory_used, self.sizes[KANSAS_CITY] + self.sizes[SYDNEY]
+        )
+
+    def test_keeps_the_latest_report_over_budget(self):
+        cache = ForecastCache(1)
+        self._fill(cache, KANSAS_CITY, SEATTLE)
+
+        self.assertEqual(len(cache), 1)
+        self.assertIs(cache.get(SEATTLE), self.reports[SEATTLE])
+        self.assertEqual(cache.memory_used, self.sizes[SEATTLE])
+
+    def test_lowering_the_budget_evicts(self):
+        cache = ForecastCache()
+        self._fill(cache, KANSAS_CITY, SEATTLE, SYDNEY)
+
+        cache.set_memory_budget(self.sizes[SYDNEY])
+
+        self.assertEqual(len(cache), 1)
+        self.assertIsNotNone(cache.get(SYDNEY))
+        self.assertEqual(cache.memory_used, self.sizes[SYDNEY])
+
+    def test_refreshing_a_location_replaces_its_size(self):
+        cache = ForecastCache()
+        self._fill(cache, KANSAS_CITY)
+
+        report, changes = cache.update(
+            KANSAS_CITY, WeatherReport(load_report("onecall_clear"))
+        )
+
+        self.assertIs(report, self.reports[KANSAS_CITY])
+        self.assertFalse(changes)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.memory_used, estimate_size(report))
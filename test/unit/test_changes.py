@@ -0,0 +1,138 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for reconciling a refreshed report with the previous one."""
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from skill.weather import ReportChanges, WeatherReport
+from .fixtures import build_skill, load_report, load_skill_module
+
+FORECAST_CHANGED_EVENT = "skill.weather.forecast-changed"
+
+
+def _load_changed_report(timeframe: str, index: int) -> dict:
+    """Load the clear day report with the temperature of one entry raised."""
+    report = load_report("onecall_clear")
+    entry = report[timeframe][index]
+    if timeframe == "hourly":
+        entry["temp"] += 5
+    else:
+        entry["temp"]["max"] += 5
+
+    return report
+
+
+class TestReportMerge(TestCase):
+    def setUp(self):
+        self.previous = WeatherReport(load_report("onecall_clear"))
+
+    def test_unchanged_refresh_is_the_previous_report(self):
+        latest = WeatherReport(load_report("onecall_clear"))
+
+        self.assertIs(latest.merge(self.previous), self.previous)
+        self.assertFalse(ReportChanges(self.previous, latest))
+
+    def test_new_observation_time_alone_is_not_a_change(self):
+        report = load_report("onecall_clear")
+        report["current"]["dt"] += 60
+        latest = WeatherReport(report)
+
+        self.assertFalse(ReportChanges(self.previous, latest))
+
+    def test_changed_hourly_entry_is_reported(self):
+        latest = WeatherReport(_load_changed_report("hourly", 5))
+        merged = latest.merge(self.previous)
+        changes = ReportChanges(self.previous, merged)
+
+        self.assertEqual(changes.hourly, [merged.hourly[5]])
+        self.assertEqual(changes.daily, [])
+        self.assertEqual(changes.current, [])
+        self.assertIsNot(merged.hourly[5], self.previous.hourly[5])
+        for index, hourly in enumerate(merged.hourly):
+            if index != 5:
+                self.assertIs(hourly, self.previous.hourly[index])
+        self.assertIs(merged.current, self.previous.current)
+
+    def test_changed_daily_entry_is_reported(self):
+        latest = WeatherReport(_load_changed_report("daily", 2))
+        merged = latest.merge(self.previous)
+        changes = ReportChanges(self.previous, merged)
+
+        self.assertEqual(changes.daily, [merged.daily[2]])
+        self.assertEqual(changes.hourly, [])
+        self.assertEqual(
+            changes.to_dict()["daily"], [merged.daily[2].date_time.date().isoformat()]
+        )
+        self.assertIs(merged.daily[1], self.previous.daily[1])
+
+
+class TestForecastChangedEvent(TestCase):
+    def setUp(self):
+        weather_skill = load_skill_module()
+        self.now = 1000.0
+        for module in (weather_skill.skill.cache, weather_skill.skill.fetch):
+            patcher = patch.object(module, "monotonic", lambda: self.now)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+        self.weather_api = Mock()
+        self.bus = Mock()
+        self.skill = build_skill(
+            self,
+            lang="en-us",
+            bus=self.bus,
+            config_core=dict(system_unit="imperial"),
+            weather_api=self.weather_api,
+            forecast_fetcher=weather_skill.ForecastFetcher(
+                weather_skill.ForecastCache()
+            ),
+            weather_config=SimpleNamespace(latitude=0.0, longitude=0.0),
+            speech_prefetch_executor=Mock(),
+        )
+        self.weather_skill = weather_skill
+
+    def _refresh(self, report: dict):
+        """Fetch the weather after the report was reused for long enough."""
+        self.now += 120
+        self.weather_api.get_weather_for_coordinates.return_value = (
+            self.weather_skill.WeatherReport(report)
+        )
+        self.skill._fetch_weather(39.0997, -94.5786)
+
+    def _list_change_events(self) -> list:
+        return [
+            message
+            for (message,), _ in self.bus.emit.call_args_list
+            if message.msg_type == FORECAST_CHANGED_EVENT
+        ]
+
+    def test_first_report_is_not_a_change(self):
+        self._refresh(load_report("onecall_clear"))
+
+        self.assertEqual(self._list_change_events(), [])
+
+    def test_unchanged_refresh_emits_nothing(self):
+        self._refresh(load_report("onecall_clear"))
+        self._refresh(load_report("onecall_clear"))
+
+        self.assertEqual(self._list_change_events(), [])
+
+    def test_changed_refresh_emits_the_changes(self):
+        self._refresh(load_report("onecall_clear"))
+        self._refresh(_load_changed_report("hourly", 5))
+
+        events = self._list_change_events()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(len(events[0].data["changes"]["hourly"]), 1)
+        self.assertEqual(events[0].data["latitude"], 39.0997)
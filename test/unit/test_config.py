@@ -0,0 +1,63 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for reading whole numbers from the skill settings."""
+from unittest import TestCase
+
+from skill.config import (
+    DEFAULT_CACHE_MEMORY_BUDGET,
+    DEFAULT_PROFILE_EVERY,
+    WeatherConfig,
+)
+
+
+def _read_profile_every(value) -> int:
+    """Return the profile_every setting read from a settings value."""
+    return WeatherConfig(dict(), dict(profile_every=value)).profile_every
+
+
+class TestNonNegativeIntSetting(TestCase):
+    def test_missing_setting_uses_default(self):
+        config = WeatherConfig(dict(), dict())
+
+        self.assertEqual(DEFAULT_PROFILE_EVERY, config.profile_every)
+
+    def test_number_is_used(self):
+        self.assertEqual(5, _read_profile_every(5))
+
+    def test_decimal_string_is_truncated(self):
+        self.assertEqual(2, _read_profile_every("2.0"))
+        self.assertEqual(2, _read_profile_every("2.7"))
+
+    def test_negative_number_is_raised_to_zero(self):
+        self.assertEqual(0, _read_profile_every(-3))
+        self.assertEqual(0, _read_profile_every("-3"))
+
+    def test_infinity_uses_default(self):
+        for value in ("inf", "-inf", float("inf")):
+            with self.subTest(value=value):
+                self.assertEqual(DEFAULT_PROFILE_EVERY, _read_profile_every(value))
+
+    def test_not_a_number_uses_default(self):
+        for value in ("nan", "often", "", None, [3]):
+            with self.subTest(value=value):
+                self.assertEqual(DEFAULT_PROFILE_EVERY, _read_profile_every(value))
+
+    def test_cache_memory_budget_is_in_kilobytes(self):
+        config = WeatherConfig(dict(), dict(cache_memory_budget="inf"))
+        self.assertEqual(
+            DEFAULT_CACHE_MEMORY_BUDGET * 1024, config.cache_memory_budget
+        )
+        config.settings["cache_memory_budget"] = "64"
+
+        self.assertEqual(64 * 1024, config.cache_memory_budget)
@@ -0,0 +1,119 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the keys of the dialog cache."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytz
+
+from skill import dialog
+from skill.dialog import CurrentDialog, DialogCache, WeeklyDialog
+from skill.weather import WeatherOverlay, WeatherReport
+from .fixtures import load_report
+
+TODAY = pytz.timezone("America/Chicago").localize(datetime(2026, 10, 17, 9, 15))
+CONFIG = SimpleNamespace(
+    country="United States", temperature_unit="fahrenheit", speed_unit="mph"
+)
+
+
+def _build_intent_data(language: str = "en-us"):
+    """Build the intent data of a request for the local weather."""
+    return SimpleNamespace(language=language, unit=None, location=None)
+
+
+class TestDialogCacheKeys(TestCase):
+    def setUp(self):
+        self.report = WeatherReport(load_report("onecall_clear"))
+        self.now = TODAY
+        patcher = patch("skill.dialog.now_local", lambda *args, **kwargs: self.now)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        patcher = patch.object(dialog, "_dialog_cache", DialogCache())
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def _build_key(self, weather, method_name="build_weather_dialog", **kwargs):
+        """Build the cache key of a current weather dialog."""
+        intent_data = _build_intent_data(**kwargs)
+        dialog_builder = CurrentDialog(intent_data, CONFIG, weather)
+
+        return dialog_builder.build_cache_key(method_name, (), {})
+
+    def test_same_entry_gives_the_same_key(self):
+        self.assertEqual(
+            self._build_key(self.report.current), self._build_key(self.report.current)
+        )
+
+    def test_entries_give_different_keys(self):
+        self.assertNotEqual(
+            self._build_key(self.report.current), self._build_key(self.report.today)
+        )
+
+    def test_build_method_is_part_of_the_key(self):
+        self.assertNotEqual(
+            self._build_key(self.report.current),
+            self._build_key(self.report.current, "build_humidity_dialog"),
+        )
+
+    def test_language_is_part_of_the_key(self):
+        self.assertNotEqual(
+            self._build_key(self.report.current),
+            self._build_key(self.report.current, language="de-de"),
+        )
+
+    def test_current_date_is_part_of_the_key(self):
+        today_key = self._build_key(self.report.current)
+        self.now = TODAY + timedelta(days=1)
+
+        self.assertNotEqual(today_key, self._build_key(self.report.current))
+
+    def test_overlays_of_an_entry_share_a_key(self):
+        first = WeatherOverlay(self.report.current, wind_direction="north")
+        second = WeatherOverlay(self.report.current, wind_direction="north")
+
+        self.assertEqual(self._build_key(first), self._build_key(second))
+
+    def test_overrides_are_part_of_the_key(self):
+        north = WeatherOverlay(self.report.current, wind_direction="north")
+        south = WeatherOverlay(self.report.current, wind_direction="south")
+
+        self.assertNotEqual(self._build_key(north), self._build_key(south))
+        self.assertNotEqual(
+            self._build_key(north), self._build_key(self.report.current)
+        )
+
+    def test_wind_dialog_of_a_new_overlay_is_reused(self):
+        built = []
+        for _ in range(2):
+            weather = WeatherOverlay(self.report.current, wind_direction="north")
+            dialog_builder = CurrentDialog(_build_intent_data(), CONFIG, weather)
+            with patch("skill.dialog.nice_number", side_effect=str) as nice_number:
+                dialog_builder.build_wind_dialog()
+            built.append(nice_number.called)
+
+        self.assertEqual(built, [True, False])
+        self.assertEqual(dialog_builder.data["direction"], "north")
+
+    def test_weekly_key_uses_the_forecast_span(self):
+        intent_data = _build_intent_data()
+        first = WeeklyDialog(intent_data, CONFIG, self.report.weekly_forecast)
+        second = WeeklyDialog(intent_data, CONFIG, self.report.weekly_forecast)
+
+        self.assertEqual(
+            first.build_cache_key("build_temperature_dialog", (), {}),
+            second.build_cache_key("build_temperature_dialog", (), {}),
+        )
@@ -0,0 +1,122 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for sharing and rate limiting the calls to the weather API."""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from skill.cache import build_forecast_key, ForecastCache
+from skill.fetch import ForecastFetcher
+from skill.weather import WeatherReport
+from .fixtures import load_report
+
+KANSAS_CITY = build_forecast_key("imperial", 39.0997, -94.5786, "en-us")
+SEATTLE = build_forecast_key("imperial", 47.6062, -122.3321, "en-us")
+SYDNEY = build_forecast_key("metric", -33.8688, 151.2093, "en-us")
+
+
+class TestForecastFetcher(TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        for target in ("skill.cache.monotonic", "skill.fetch.monotonic"):
+            patcher = patch(target, lambda: self.now)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+        self.fetcher = ForecastFetcher(
+            ForecastCache(), min_refresh_interval=30, calls_per_minute=2
+        )
+        self.call_api = Mock(
+            side_effect=lambda: WeatherReport(load_report("onecall_clear"))
+        )
+
+    def test_first_report_has_no_changes(self):
+        report, changes = self.fetcher.fetch(KANSAS_CITY, self.call_api)
+
+        self.assertIsInstance(report, WeatherReport)
+        self.assertIsNone(changes)
+
+    def test_recent_report_is_reused(self):
+        first, _ = self.fetcher.fetch(KANSAS_CITY, self.call_api)
+        self.now += 29
+        second, changes = self.fetcher.fetch(KANSAS_CITY, self.call_api)
+
+        self.assertIs(second, first)
+        self.assertFalse(changes)
+        self.assertEqual(self.call_api.call_count, 1)
+
+    def test_old_report_is_requested_again(self):
+        self.fetcher.fetch(KANSAS_CITY, self.call_api)
+        self.now += 31
+        self.fetcher.fetch(KANSAS_CITY, self.call_api)
+
+        self.assertEqual(self.call_api.call_count, 2)
+
+    def test_concurrent_requests_share_one_call(self):
+        call_started = Event()
+        release_call = Event()
+
+        def call_api():
+            call_started.set()
+            release_call.wait(5)
+            return WeatherReport(load_report("onecall_clear"))
+
+        second_call_api = Mock()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(self.fetcher.fetch, KANSAS_CITY, call_api)
+            call_started.wait(5)
+            second = executor.submit(self.fetcher.fetch, KANSAS_CITY, second_call_api)
+            release_call.set()
+            first_report, first_changes = first.result(5)
+            second_report, second_changes = second.result(5)
+
+        self.assertIs(second_report, first_report)
+        self.assertIsNone(first_changes)
+        self.assertFalse(second_changes)
+        second_call_api.assert_not_called()
+
+    def test_failed_call_is_raised_and_not_kept(self):
+        failing_call_api = Mock(side_effect=ConnectionError)
+
+        with self.assertRaises(ConnectionError):
+            self.fetcher.fetch(KANSAS_CITY, failing_call_api)
+        report, _ = self.fetcher.fetch(KANSAS_CITY, self.call_api)
+
+        self.assertIsInstance(report, WeatherReport)
+
+    def test_rate_limited_request_uses_the_last_report(self):
+        kansas_city, _ = self.fetcher.fetch(KANSAS_CITY, self.call_api)
+        self.now += 31
+        self.fetcher.fetch(SEATTLE, self.call_api)
+        report, changes = self.fetcher.fetch(KANSAS_CITY, self.call_api)
+
+        self.assertIs(report, kansas_city)
+        self.assertFalse(changes)
+        self.assertEqual(self.call_api.call_count, 2)
+
+    def test_rate_limit_ends_after_a_minute(self):
+        self.fetcher.fetch(KANSAS_CITY, self.call_api)
+        self.fetcher.fetch(SEATTLE, self.call_api)
+        self.now += 61
+        self.fetcher.fetch(SYDNEY, self.call_api)
+
+        self.assertEqual(self.call_api.call_count, 3)
+
+    def test_rate_limited_request_without_a_report_calls_the_api(self):
+        self.fetcher.fetch(KANSAS_CITY, self.call_api)
+        self.fetcher.fetch(SEATTLE, self.call_api)
+        report, changes = self.fetcher.fetch(SYDNEY, self.call_api)
+
+        self.assertIsNone(changes)
+        self.assertEqual(self.call_api.call_count, 3)
@@ -0,0 +1,94 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for showing the skill's GUI pages with their complete models."""
+import json
+from unittest import TestCase
+
+from skill.gui import GuiPages
+from .fixtures import BENCHMARK_DIRECTORY, import_from_path
+
+harness = import_from_path("harness", BENCHMARK_DIRECTORY.joinpath("harness.py"))
+
+MODEL = dict(currentTemperature=72, weatherLocation="Kansas City, Missouri")
+
+
+class TestGuiPages(TestCase):
+    def setUp(self):
+        self.gui = harness.StubGui()
+        self.gui_pages = GuiPages(self.gui, self.gui, self.gui.skill_id)
+
+    def _show_again(self, model: dict) -> list:
+        """Show the page again after it was shown, returning the messages sent."""
+        self.gui_pages.show("current_mark_ii.qml", MODEL)
+        self.gui.messages.clear()
+        self.gui_pages.show("current_mark_ii.qml", model)
+
+        return [msg_type for msg_type, _ in self.gui.messages]
+
+    def test_shows_a_new_page_with_all_of_its_values(self):
+        self.gui.show_page("previous.qml")
+        self.gui.messages.clear()
+
+        self.gui_pages.show("current_mark_ii.qml", MODEL, replace=True)
+
+        self.assertEqual(self.gui.pages, ["current_mark_ii.qml"])
+        self.assertEqual(self.gui.session_data, MODEL)
+        self.assertEqual(
+            [msg_type for msg_type, _ in self.gui.messages],
+            ["gui.clear.namespace", "gui.value.set", "gui.page.show"],
+        )
+
+    def test_unchanged_page_sends_nothing(self):
+        messages = self._show_again(dict(MODEL))
+
+        self.assertEqual(messages, [])
+        self.assertEqual(self.gui.page, "current_mark_ii.qml")
+
+    def test_changed_values_are_sent_in_one_message(self):
+        model = dict(MODEL, currentTemperature=75, highTemperature=80)
+        del model["weatherLocation"]
+
+        messages = self._show_again(model)
+
+        self.assertEqual(messages, ["gui.value.set"])
+        _, payload = self.gui.messages[0]
+        self.assertEqual(
+            json.loads(payload),
+            dict(
+                currentTemperature=75,
+                highTemperature=80,
+                weatherLocation=None,
+                __from=self.gui.skill_id,
+            ),
+        )
+
+    def test_changed_values_are_kept_in_the_session_data(self):
+        self._show_again(dict(MODEL, currentTemperature=75))
+        self.gui.messages.clear()
+
+        self.gui.show_page("hourly_mark_ii.qml")
+
+        _, payload = self.gui.messages[0]
+        self.assertEqual(json.loads(payload)["currentTemperature"], 75)
+
+    def test_page_shown_after_forgetting_is_shown_in_full(self):
+        self.gui_pages.show("current_mark_ii.qml", MODEL)
+        self.gui_pages.forget()
+        self.gui.messages.clear()
+
+        self.gui_pages.show("current_mark_ii.qml", MODEL)
+
+        msg_type, payload = self.gui.messages[0]
+        self.assertEqual(msg_type, "gui.clear.namespace")
+        self.assertEqual(json.loads(payload)["__from"], self.gui.skill_id)
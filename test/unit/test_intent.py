@@ -0,0 +1,94 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for resolving the datetime of an intent naming a location."""
+from datetime import date, datetime, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytz
+
+from mycroft.messagebus.message import Message
+from skill import util
+from skill.intent import WeatherIntent
+
+CHICAGO = pytz.timezone("America/Chicago")
+SYDNEY_GEOLOCATION = dict(
+    city="Sydney",
+    region="New South Wales",
+    country="Australia",
+    timezone="Australia/Sydney",
+    latitude=-33.8688,
+    longitude=151.2093,
+)
+# Saturday 7:00 PM in Chicago is already Sunday 11:00 AM in Sydney.
+DEVICE_NOW = CHICAGO.localize(datetime(2026, 10, 17, 19, 0, 30))
+
+
+def _now_local(tz=None):
+    """Report the fixed device time in the requested timezone."""
+    return DEVICE_NOW.astimezone(tz or CHICAGO)
+
+
+def _extract_datetime(text, anchorDate=None, lang=None, default_time=None):
+    """Resolve the few expressions used by the tests the way mycroft-core does."""
+    midnight = anchorDate.replace(hour=0, minute=0, second=0, microsecond=0)
+    if "sunday" in text:
+        extracted = midnight + timedelta(days=(6 - anchorDate.weekday()) % 7)
+    elif "tomorrow" in text:
+        extracted = midnight + timedelta(days=1)
+    elif "in three hours" in text:
+        extracted = anchorDate.replace(microsecond=0) + timedelta(hours=3)
+    else:
+        return None
+
+    return extracted, ""
+
+
+class TestLocationIntentDatetime(TestCase):
+    def setUp(self):
+        util._utterance_datetimes._extractions.clear()
+        self.extract_datetime = self._patch(
+            "skill.util.extract_datetime", wraps=_extract_datetime
+        )
+        self._patch("skill.intent.now_local", _now_local)
+        self._patch("skill.util.now_local", _now_local)
+        self._patch("skill.intent.get_geolocation", return_value=SYDNEY_GEOLOCATION)
+
+    def _patch(self, target: str, *args, **kwargs):
+        patcher = patch(target, *args, **kwargs)
+        self.addCleanup(patcher.stop)
+
+        return patcher.start()
+
+    def _build_intent(self, utterance: str) -> WeatherIntent:
+        message = Message("intent", data=dict(utterance=utterance, location="sydney"))
+
+        return WeatherIntent(message, "en-us")
+
+    def test_weekday_when_the_location_is_a_day_ahead(self):
+        intent_data = self._build_intent("what is the weather on sunday in sydney")
+
+        self.assertEqual(intent_data.intent_datetime.date(), date(2026, 10, 18))
+
+    def test_relative_day_when_the_location_is_a_day_ahead(self):
+        intent_data = self._build_intent("what is the weather tomorrow in sydney")
+
+        self.assertEqual(intent_data.intent_datetime.date(), date(2026, 10, 19))
+
+    def test_time_offset_reuses_the_device_extraction(self):
+        intent_data = self._build_intent("what is the weather in three hours in sydney")
+
+        expected = DEVICE_NOW.replace(microsecond=0) + timedelta(hours=3)
+        self.assertEqual(intent_data.intent_datetime, expected)
+        self.assertEqual(self.extract_datetime.call_count, 1)
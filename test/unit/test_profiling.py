@@ -0,0 +1,161 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for profiling a sample of the requests handled by the skill."""
+import os
+import pstats
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import Mock
+
+from skill.profiling import RequestProfiler, profile_request
+
+
+def handle_request(value):
+    """Stand-in for an intent handler."""
+    return value * 2
+
+
+class TestRequestSampling(TestCase):
+    def setUp(self):
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = Path(temporary_directory.name).joinpath("profiles")
+        self.profiler = RequestProfiler(self.directory, sample_every=3)
+
+    def _list_profiles(self):
+        return sorted(path.name for path in self.directory.glob("*.prof"))
+
+    def test_every_nth_request_is_profiled(self):
+        results = [self.profiler.run(handle_request, value) for value in range(7)]
+
+        self.assertEqual([value * 2 for value in range(7)], results)
+        profiles = self._list_profiles()
+        self.assertEqual(2, len(profiles))
+        self.assertTrue(profiles[0].endswith("-000003-handle_request.prof"))
+        self.assertTrue(profiles[1].endswith("-000006-handle_request.prof"))
+
+    def test_profile_is_readable_by_pstats(self):
+        for value in range(3):
+            self.profiler.run(handle_request, value)
+        profile_path = self.directory.joinpath(self._list_profiles()[0])
+
+        stats = pstats.Stats(str(profile_path))
+
+        self.assertTrue(
+            any(function[2] == "handle_request" for function in stats.stats)
+        )
+
+    def test_one_request_is_profiled_at_a_time(self):
+        self.profiler._profile_lock.acquire()
+        self.addCleanup(self.profiler._profile_lock.release)
+        for value in range(3):
+            self.assertEqual(value * 2, self.profiler.run(handle_request, value))
+
+        self.assertFalse(self.directory.exists())
+
+    def test_failing_handler_is_still_profiled(self):
+        handler = Mock(side_effect=[None, None, ValueError], __name__="handle_failure")
+        for _ in range(2):
+            self.profiler.run(handler)
+
+        with self.assertRaises(ValueError):
+            self.profiler.run(handler)
+        self.assertEqual(1, len(self._list_profiles()))
+        self.assertTrue(self.profiler._profile_lock.acquire(blocking=False))
+
+    def test_unwritable_directory_does_not_fail_request(self):
+        self.directory.parent.joinpath("profiles").write_text("not a directory")
+        for value in range(2):
+            self.profiler.run(handle_request, value)
+
+        self.assertEqual(4, self.profiler.run(handle_request, 2))
+
+
+class TestProfileRotation(TestCase):
+    def setUp(self):
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = Path(temporary_directory.name)
+
+    def _write_profile(self, name: str, size: int, age: int):
+        """Write a profile of a given size that was modified age seconds ago."""
+        path = self.directory.joinpath(name + ".prof")
+        path.write_bytes(b"x" * size)
+        modified = path.stat().st_mtime - age
+        os.utime(str(path), (modified, modified))
+
+    def _list_profiles(self):
+        return sorted(path.stem for path in self.directory.glob("*.prof"))
+
+    def test_oldest_profiles_are_deleted_beyond_budget(self):
+        self._write_profile("oldest", 400, age=30)
+        self._write_profile("older", 400, age=20)
+        self._write_profile("newest", 400, age=10)
+        profiler = RequestProfiler(self.directory, 1, directory_budget=1000)
+
+        profiler._delete_oldest_profiles()
+
+        self.assertEqual(["newest", "older"], self._list_profiles())
+
+    def test_profiles_within_budget_are_kept(self):
+        self._write_profile("older", 400, age=20)
+        self._write_profile("newest", 400, age=10)
+        profiler = RequestProfiler(self.directory, 1, directory_budget=800)
+
+        profiler._delete_oldest_profiles()
+
+        self.assertEqual(["newest", "older"], self._list_profiles())
+
+    def test_newest_profile_is_kept_when_over_budget(self):
+        self._write_profile("older", 400, age=20)
+        self._write_profile("newest", 400, age=10)
+        profiler = RequestProfiler(self.directory, 1, directory_budget=100)
+
+        profiler._delete_oldest_profiles()
+
+        self.assertEqual(["newest"], self._list_profiles())
+
+    def test_other_files_are_not_deleted(self):
+        self.directory.joinpath("notes.txt").write_bytes(b"x" * 400)
+        self._write_profile("older", 400, age=20)
+        self._write_profile("newest", 400, age=10)
+        profiler = RequestProfiler(self.directory, 1, directory_budget=100)
+
+        profiler._delete_oldest_profiles()
+
+        self.assertTrue(self.directory.joinpath("notes.txt").exists())
+
+
+class TestProfileRequestDecorator(TestCase):
+    def test_handler_runs_directly_without_profiler(self):
+        handler = Mock(return_value="spoken", __name__="handle_current_weather")
+        skill = SimpleNamespace(request_profiler=None)
+
+        result = profile_request(handler)(skill, "message")
+
+        self.assertEqual("spoken", result)
+        handler.assert_called_once_with(skill, "message")
+
+    def test_handler_is_passed_to_profiler(self):
+        handler = Mock(__name__="handle_current_weather")
+        skill = SimpleNamespace(request_profiler=Mock())
+        skill.request_profiler.run.return_value = "spoken"
+
+        result = profile_request(handler)(skill, "message")
+
+        self.assertEqual("spoken", result)
+        skill.request_profiler.run.assert_called_once_with(handler, skill, "message")
+        handler.assert_not_called()
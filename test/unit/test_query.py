@@ -0,0 +1,138 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for parsing and answering weather queries from other skills."""
+import json
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from skill.query import WeatherQuery, WeatherQueryError
+from skill.weather import WeatherReport
+from .fixtures import build_skill, load_report, load_skill_module
+
+PARIS_GEOLOCATION = dict(city="Paris", latitude=48.8566, longitude=2.3522)
+
+
+class TestWeatherQueryParsing(TestCase):
+    def test_defaults(self):
+        query = WeatherQuery(dict())
+
+        self.assertIsNone(query.location)
+        self.assertEqual(query.timeframe, "current")
+        self.assertIsNone(query.count)
+        self.assertIsNone(query.fields)
+
+    def test_empty_location_is_the_device_location(self):
+        self.assertIsNone(WeatherQuery(dict(location="")).location)
+
+    def test_count_is_converted_to_a_number(self):
+        self.assertEqual(WeatherQuery(dict(timeframe="daily", count="3")).count, 3)
+
+    def test_single_field_name_is_a_list(self):
+        query = WeatherQuery(dict(fields="temperature"))
+
+        self.assertEqual(query.fields, ["temperature"])
+
+    def test_malformed_queries_are_rejected(self):
+        for data in (
+            dict(timeframe="weekly"),
+            dict(count="three"),
+            dict(count=0),
+            dict(count=[3]),
+            dict(fields=3),
+            dict(fields=["temperature", 3]),
+        ):
+            with self.subTest(data=data):
+                with self.assertRaises(WeatherQueryError):
+                    WeatherQuery(data)
+
+
+class TestWeatherQueryAnswer(TestCase):
+    def setUp(self):
+        self.weather = WeatherReport(load_report("onecall_clear"))
+
+    def test_current_weather_with_selected_fields(self):
+        answer = WeatherQuery(dict(fields=["temperature"])).answer(self.weather)
+
+        self.assertEqual(answer["timeframe"], "current")
+        self.assertEqual(set(answer["forecast"]), {"date_time", "temperature"})
+        self.assertEqual(
+            answer["forecast"]["date_time"],
+            self.weather.current.date_time.isoformat(),
+        )
+
+    def test_count_limits_the_forecasts(self):
+        answer = WeatherQuery(dict(timeframe="hourly", count=3)).answer(self.weather)
+
+        self.assertEqual(len(answer["forecast"]), 3)
+
+    def test_answer_can_be_sent_on_the_bus(self):
+        answer = WeatherQuery(dict(timeframe="daily")).answer(self.weather)
+
+        self.assertEqual(json.loads(json.dumps(answer)), answer)
+        self.assertEqual(len(answer["forecast"]), len(self.weather.daily))
+
+
+class TestWeatherQueryLocation(TestCase):
+    def setUp(self):
+        weather_skill = load_skill_module()
+        patcher = patch.object(
+            weather_skill.skill.intent,
+            "get_geolocation",
+            return_value=PARIS_GEOLOCATION,
+        )
+        self.addCleanup(patcher.stop)
+        self.get_geolocation = patcher.start()
+        self.skill = build_skill(
+            self,
+            bus=Mock(),
+            log=Mock(),
+            weather_config=SimpleNamespace(
+                latitude=39.0997, longitude=-94.5786, publish_traces=False
+            ),
+        )
+        self.skill._fetch_weather = Mock(
+            return_value=WeatherReport(load_report("onecall_clear"))
+        )
+        self.weather_skill = weather_skill
+
+    def _query(self, location: str) -> dict:
+        """Send a query for a location and return the data of the response."""
+        message = Mock(data=dict(location=location))
+        self.skill.handle_weather_query(message)
+        (response_data,), _ = message.response.call_args
+
+        return response_data
+
+    def test_city_is_looked_up(self):
+        response_data = self._query("Paris")
+
+        self.assertNotIn("error", response_data)
+        self.skill._fetch_weather.assert_called_once_with(48.8566, 2.3522)
+
+    def test_location_that_is_not_a_city_is_an_error(self):
+        response_data = self._query("France")
+
+        self.assertEqual(dict(error="France is not a city"), response_data)
+        self.skill._fetch_weather.assert_not_called()
+
+    def test_unknown_location_is_an_error(self):
+        self.get_geolocation.side_effect = self.weather_skill.LocationNotFoundError(
+            "Location Atlantis is unknown"
+        )
+
+        response_data = self._query("Atlantis")
+
+        self.assertEqual(dict(error="Location Atlantis is unknown"), response_data)
+        self.skill._fetch_weather.assert_not_called()
@@ -0,0 +1,93 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the compact binary encoding of weather reports."""
+from struct import Struct
+from unittest import TestCase
+
+from skill.serialization import (
+    BinaryReader,
+    BinaryWriter,
+    FORMAT_VERSION,
+    HEADER_LAYOUT,
+    SerializationError,
+)
+from skill.weather import WeatherReport
+from .fixtures import FIXTURE_NAMES, load_report
+
+RECORD_LAYOUT = Struct("<HhH")
+
+
+class TestBinaryEncoding(TestCase):
+    def test_records_and_strings_round_trip(self):
+        writer = BinaryWriter()
+        writer.pack(RECORD_LAYOUT, writer.string("rain"), -12, writer.string(None))
+        writer.pack(RECORD_LAYOUT, writer.string("rain"), 7, writer.string("snow"))
+
+        reader = BinaryReader(writer.getvalue())
+        first_name, first_value, first_missing = reader.unpack(RECORD_LAYOUT)
+        second_name, second_value, second_other = reader.unpack(RECORD_LAYOUT)
+
+        self.assertEqual(reader.string(first_name), "rain")
+        self.assertEqual(first_value, -12)
+        self.assertIsNone(reader.string(first_missing))
+        self.assertEqual(second_name, first_name)
+        self.assertEqual(second_value, 7)
+        self.assertEqual(reader.string(second_other), "snow")
+        self.assertEqual(reader.strings, ["rain", "snow"])
+
+    def test_rejects_other_data(self):
+        with self.assertRaises(SerializationError):
+            BinaryReader(b'{"timezone": "America/Chicago"}')
+
+    def test_rejects_other_format_versions(self):
+        data = bytearray(BinaryWriter().getvalue())
+        data[: HEADER_LAYOUT.size] = HEADER_LAYOUT.pack(b"OWMR", FORMAT_VERSION + 1)
+
+        with self.assertRaises(SerializationError):
+            BinaryReader(bytes(data))
+
+    def test_rejects_truncated_data(self):
+        writer = BinaryWriter()
+        writer.pack(RECORD_LAYOUT, writer.string("rain"), 1, 2)
+        reader = BinaryReader(writer.getvalue()[:-1])
+
+        with self.assertRaises(SerializationError):
+            reader.unpack(RECORD_LAYOUT)
+
+    def test_rejects_unknown_string_references(self):
+        reader = BinaryReader(BinaryWriter().getvalue())
+
+        with self.assertRaises(SerializationError):
+            reader.string(3)
+
+
+class TestReportEncoding(TestCase):
+    def test_reports_round_trip(self):
+        for fixture_name in FIXTURE_NAMES:
+            with self.subTest(fixture=fixture_name):
+                report = WeatherReport(load_report(fixture_name))
+
+                decoded = WeatherReport.from_bytes(report.to_bytes())
+
+                self.assertEqual(decoded, report)
+                self.assertEqual(decoded.current.date_time, report.current.date_time)
+                self.assertEqual(decoded.daily[-1].sunset, report.daily[-1].sunset)
+
+    def test_alerts_round_trip(self):
+        report = WeatherReport(load_report("onecall_alerts"))
+
+        decoded = WeatherReport.from_bytes(report.to_bytes())
+
+        self.assertEqual(len(decoded.alerts), 2)
+        self.assertEqual(decoded.alerts, report.alerts)
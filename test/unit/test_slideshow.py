@@ -0,0 +1,91 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for showing GUI pages in sequence from scheduled events."""
+from types import SimpleNamespace
+from unittest import TestCase
+
+from skill.slideshow import Slideshow
+
+
+class StubScheduler:
+    """Record the events scheduled by a slideshow and fire them on demand."""
+
+    def __init__(self):
+        self.events = dict()
+        self.delays = []
+
+    def schedule_event(self, handler, delay, data=None, name=None):
+        self.events[name] = (handler, data)
+        self.delays.append(delay)
+
+    def cancel_scheduled_event(self, name):
+        del self.events[name]
+
+    def fire(self, name: str):
+        """Run the handler of a scheduled event as the event scheduler would."""
+        handler, data = self.events.pop(name)
+        handler(SimpleNamespace(data=data))
+
+
+class TestSlideshow(TestCase):
+    def setUp(self):
+        self.scheduler = StubScheduler()
+        self.slideshow = Slideshow(
+            self.scheduler.schedule_event, self.scheduler.cancel_scheduled_event
+        )
+        self.shown = []
+
+    def _build_slide(self, delay: float, page: str):
+        return delay, lambda: self.shown.append(page)
+
+    def test_shows_the_pages_in_order(self):
+        self.slideshow.start(
+            [self._build_slide(0, "current"), self._build_slide(15, "hourly")]
+        )
+        self.scheduler.fire("WeatherSlideshow-1")
+        self.scheduler.fire("WeatherSlideshow-2")
+
+        self.assertEqual(self.shown, ["current", "hourly"])
+        self.assertEqual(self.scheduler.delays, [0, 15])
+        self.assertEqual(self.scheduler.events, dict())
+
+    def test_new_slideshow_replaces_the_one_in_progress(self):
+        self.slideshow.start(
+            [self._build_slide(0, "current"), self._build_slide(15, "hourly")]
+        )
+        self.scheduler.fire("WeatherSlideshow-1")
+        self.slideshow.start([self._build_slide(0, "daily")])
+
+        self.assertEqual(list(self.scheduler.events), ["WeatherSlideshow-3"])
+        self.scheduler.fire("WeatherSlideshow-3")
+        self.assertEqual(self.shown, ["current", "daily"])
+
+    def test_stale_event_is_ignored(self):
+        self.slideshow.start([self._build_slide(0, "current")])
+        handler, data = self.scheduler.events["WeatherSlideshow-1"]
+        self.slideshow.start([self._build_slide(0, "daily")])
+
+        handler(SimpleNamespace(data=data))
+
+        self.assertEqual(self.shown, [])
+
+    def test_cancel_leaves_the_current_page(self):
+        self.slideshow.start(
+            [self._build_slide(0, "current"), self._build_slide(15, "hourly")]
+        )
+        self.scheduler.fire("WeatherSlideshow-1")
+        self.slideshow.cancel()
+
+        self.assertEqual(self.shown, ["current"])
+        self.assertEqual(self.scheduler.events, dict())
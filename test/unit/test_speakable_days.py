@@ -0,0 +1,98 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the speakable days and screen values memoized on a report."""
+from datetime import timedelta
+from unittest import TestCase
+from unittest.mock import patch
+
+from skill.display import TWELVE_HOUR
+from skill.weather import WeatherReport
+from .fixtures import load_report
+
+TWENTY_FOUR_HOUR = "full"
+
+
+def _nice_date(date_time, lang=None, now=None):
+    """Speak a date relative to the current date the way mycroft-core does."""
+    if date_time.date() == now.date():
+        spoken_date = "today"
+    elif date_time.date() == now.date() + timedelta(days=1):
+        spoken_date = "tomorrow"
+    else:
+        spoken_date = date_time.strftime("%A, %B %d, %Y")
+    if lang == "de-de":
+        spoken_date = "de " + spoken_date
+
+    return spoken_date
+
+
+class TestSpeakableDays(TestCase):
+    def setUp(self):
+        self.weather = WeatherReport(load_report("onecall_clear"))
+        self.today = self.weather.daily[0].date_time
+        self.now = self.today.replace(hour=23, minute=59)
+        for target, new in (
+            ("skill.util.now_local", lambda *args, **kwargs: self.now),
+            ("skill.util.nice_date", _nice_date),
+        ):
+            patcher = patch(target, new)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+
+    def test_table_is_reused_until_midnight(self):
+        speakable_days = self.weather.get_speakable_days("en-us")
+        self.now -= timedelta(hours=12)
+
+        self.assertIs(self.weather.get_speakable_days("en-us"), speakable_days)
+        self.assertEqual(speakable_days.day_of_week(self.today), "today")
+
+    def test_table_is_rebuilt_after_midnight(self):
+        before_midnight = self.weather.get_speakable_days("en-us")
+        self.now += timedelta(minutes=2)
+        after_midnight = self.weather.get_speakable_days("en-us")
+
+        self.assertFalse(before_midnight.is_valid())
+        self.assertIsNot(after_midnight, before_midnight)
+        tomorrow = self.weather.daily[1].date_time
+        self.assertEqual(after_midnight.day_of_week(tomorrow), "today")
+        self.assertEqual(
+            after_midnight.day_of_week(self.today), self.today.strftime("%A")
+        )
+
+    def test_tomorrow_is_spoken_as_a_weekday(self):
+        speakable_days = self.weather.get_speakable_days("en-us")
+        tomorrow = self.weather.daily[1].date_time
+
+        self.assertEqual(speakable_days.day_of_week(tomorrow), tomorrow.strftime("%A"))
+
+    def test_table_is_kept_per_language(self):
+        english = self.weather.get_speakable_days("en-us")
+        german = self.weather.get_speakable_days("de-de")
+
+        self.assertIsNot(german, english)
+        self.assertIs(self.weather.get_speakable_days("de-de"), german)
+        self.assertEqual(german.day_of_week(self.today), "de today")
+
+
+class TestDisplays(TestCase):
+    def setUp(self):
+        self.weather = WeatherReport(load_report("onecall_clear"))
+
+    def test_display_is_kept_per_time_format(self):
+        twelve_hour = self.weather.get_display(TWELVE_HOUR)
+        twenty_four_hour = self.weather.get_display(TWENTY_FOUR_HOUR)
+
+        self.assertIsNot(twenty_four_hour, twelve_hour)
+        self.assertIs(self.weather.get_display(TWELVE_HOUR), twelve_hour)
+        self.assertEqual(twenty_four_hour.time_format, TWENTY_FOUR_HOUR)
@@ -0,0 +1,154 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for sending the likely dialogs to the TTS cache after a refresh."""
+from unittest import TestCase
+from unittest.mock import Mock
+
+from .fixtures import (
+    BENCHMARK_DIRECTORY,
+    build_skill,
+    import_from_path,
+    load_report,
+    load_skill_module,
+)
+
+harness = import_from_path("harness", BENCHMARK_DIRECTORY.joinpath("harness.py"))
+stub_tts = import_from_path("stub_tts", BENCHMARK_DIRECTORY.joinpath("stub_tts.py"))
+weather_skill = load_skill_module()
+
+LANGUAGE = "en-us"
+
+
+class StubBus:
+    """Pass the prefetch events emitted by the skill to the stand-in TTS.
+
+    The TTS response is kept until deliver_responses() is called, like a reply
+    arriving on the message bus after the prefetch.
+    """
+
+    def __init__(self, tts):
+        self.tts = tts
+        self.messages = []
+        self.responses = []
+
+    def emit(self, message):
+        self.messages.append(message)
+        if message.msg_type == weather_skill.TTS_PREFETCH_EVENT:
+            cached_utterances = self.tts.handle_prefetch(message)
+            self.responses.append(
+                harness.StubMessage(
+                    weather_skill.TTS_PREFETCH_RESPONSE_EVENT,
+                    dict(utterances=cached_utterances, lang=message.data["lang"]),
+                )
+            )
+
+    def deliver_responses(self, skill):
+        for response in self.responses:
+            skill.handle_tts_prefetch_response(response)
+        self.responses = []
+
+
+class TestSpeechPrefetch(TestCase):
+    def setUp(self):
+        self.tts = stub_tts.StubTTS()
+        self.bus = StubBus(self.tts)
+        self.skill = build_skill(
+            self,
+            lang=LANGUAGE,
+            bus=self.bus,
+            dialog_renderer=harness.DialogRenderer(LANGUAGE),
+            log=Mock(),
+            weather_config=harness.build_config(),
+            rendered_dialogs=weather_skill.RenderedDialogs(),
+        )
+        self.weather = weather_skill.WeatherReport(load_report("onecall_clear"))
+        self.intent_data = harness.build_intent("what's the weather")
+
+    def _build_likely_dialogs(self):
+        """Build the dialogs of the requests expected after a refresh."""
+        return weather_skill.build_likely_dialogs(
+            self.weather, self.intent_data, self.skill.weather_config
+        )
+
+    def test_sends_the_likely_dialogs_to_tts(self):
+        self.skill._prefetch_speech(self.weather, self.intent_data)
+
+        self.assertEqual(len(self.bus.messages), 1)
+        self.assertEqual(self.bus.messages[0].data["lang"], LANGUAGE)
+        self.assertEqual(len(self.tts.prefetched), 3)
+
+    def test_speaks_the_prefetched_text(self):
+        self.skill._prefetch_speech(self.weather, self.intent_data)
+        self.bus.deliver_responses(self.skill)
+
+        latencies = [
+            self.tts.speak(self.skill._render_dialog(dialog))
+            for dialog in self._build_likely_dialogs()
+        ]
+
+        self.assertEqual(self.tts.spoken, self.tts.prefetched)
+        self.assertEqual(latencies[0], stub_tts.REQUEST_ROUND_TRIP)
+
+    def test_unconfirmed_text_is_not_reused(self):
+        self.skill._prefetch_speech(self.weather, self.intent_data)
+
+        for dialog in self._build_likely_dialogs():
+            self.assertIsNone(self.skill.rendered_dialogs.get(LANGUAGE, dialog))
+
+    def test_only_confirmed_text_is_reused(self):
+        self.skill._prefetch_speech(self.weather, self.intent_data)
+        current_utterance = self.tts.prefetched[0]
+        self.skill.handle_tts_prefetch_response(
+            harness.StubMessage(
+                weather_skill.TTS_PREFETCH_RESPONSE_EVENT,
+                dict(utterances=[current_utterance], lang=LANGUAGE),
+            )
+        )
+
+        current_dialog, *other_dialogs = self._build_likely_dialogs()
+        self.assertEqual(
+            current_utterance,
+            self.skill.rendered_dialogs.get(LANGUAGE, current_dialog),
+        )
+        for dialog in other_dialogs:
+            self.assertIsNone(self.skill.rendered_dialogs.get(LANGUAGE, dialog))
+
+    def test_confirmation_in_other_language_is_ignored(self):
+        self.skill._prefetch_speech(self.weather, self.intent_data)
+        self.skill.handle_tts_prefetch_response(
+            harness.StubMessage(
+                weather_skill.TTS_PREFETCH_RESPONSE_EVENT,
+                dict(utterances=self.tts.prefetched, lang="de-de"),
+            )
+        )
+
+        for dialog in self._build_likely_dialogs():
+            self.assertIsNone(self.skill.rendered_dialogs.get(LANGUAGE, dialog))
+
+    def test_renders_dialogs_that_were_not_prefetched(self):
+        utterances = [
+            self.skill._render_dialog(dialog)
+            for dialog in self._build_likely_dialogs()
+        ]
+
+        self.assertTrue(all(utterances))
+        self.assertEqual(self.bus.messages, [])
+
+    def test_failure_does_not_fail_the_request(self):
+        self.skill.weather_config = None
+
+        self.skill._prefetch_speech(self.weather, self.intent_data)
+
+        self.assertEqual(self.bus.messages, [])
+        self.skill.log.exception.assert_called_once()
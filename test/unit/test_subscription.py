@@ -0,0 +1,198 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the leases of the local forecast subscriptions."""
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from skill.subscription import LocalForecastSubscriptions
+from .fixtures import build_skill, load_report, load_skill_module
+
+LEASE = 60
+UPDATE = dict(temperature=72)
+LOCAL_FORECAST_EVENT = "skill.weather.local-forecast-obtained"
+
+
+class TestLocalForecastSubscriptions(TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch("skill.subscription.monotonic", lambda: self.now)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        self.subscriptions = LocalForecastSubscriptions(lease=LEASE)
+
+    def test_only_the_first_subscription_is_reported(self):
+        self.assertTrue(self.subscriptions.subscribe("homescreen"))
+        self.assertFalse(self.subscriptions.subscribe("weather-widget"))
+        self.assertFalse(self.subscriptions.subscribe("homescreen"))
+
+    def test_lease_ends_unless_renewed(self):
+        self.subscriptions.subscribe("homescreen")
+        self.now += LEASE / 2
+        self.subscriptions.subscribe("homescreen")
+        self.now += LEASE
+        self.assertTrue(self.subscriptions)
+
+        self.now += 1
+        self.assertFalse(self.subscriptions)
+
+    def test_subscribing_after_every_lease_ended_is_a_first_subscription(self):
+        self.subscriptions.subscribe("homescreen")
+        self.now += LEASE + 1
+
+        self.assertTrue(self.subscriptions.subscribe("homescreen"))
+
+    def test_unsubscribe_reports_when_none_remain(self):
+        self.subscriptions.subscribe("homescreen")
+        self.subscriptions.subscribe("weather-widget")
+
+        self.assertFalse(self.subscriptions.unsubscribe("homescreen"))
+        self.assertTrue(self.subscriptions.unsubscribe("weather-widget"))
+
+    def test_unchanged_update_is_not_sent_again(self):
+        self.subscriptions.subscribe("homescreen")
+
+        self.assertEqual(self.subscriptions.filter_update(UPDATE), UPDATE)
+        self.assertIsNone(self.subscriptions.filter_update(dict(UPDATE)))
+
+    def test_new_subscriber_gets_the_update_again(self):
+        self.subscriptions.subscribe("homescreen")
+        self.subscriptions.filter_update(UPDATE)
+        self.subscriptions.subscribe("weather-widget")
+
+        self.assertEqual(self.subscriptions.filter_update(UPDATE), UPDATE)
+
+    def test_no_update_without_subscribers(self):
+        self.subscriptions.subscribe("homescreen")
+        self.now += LEASE + 1
+
+        self.assertIsNone(self.subscriptions.filter_update(UPDATE))
+
+    def test_recorded_update_is_not_sent_again(self):
+        self.subscriptions.subscribe("homescreen")
+        self.subscriptions.record_update(UPDATE)
+
+        self.assertIsNone(self.subscriptions.filter_update(dict(UPDATE)))
+
+    def test_update_recorded_without_subscribers_is_forgotten(self):
+        self.subscriptions.record_update(UPDATE)
+        self.subscriptions.subscribe("homescreen")
+
+        self.assertEqual(self.subscriptions.filter_update(UPDATE), UPDATE)
+
+
+class TestLocalForecastRequests(TestCase):
+    def setUp(self):
+        weather_skill = load_skill_module()
+        self.now = 1000.0
+        for module in (
+            weather_skill.skill.cache,
+            weather_skill.skill.fetch,
+            weather_skill.skill.subscription,
+        ):
+            patcher = patch.object(module, "monotonic", lambda: self.now)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+        forecast_cache = weather_skill.ForecastCache()
+        weather_api = Mock()
+        weather_api.get_weather_for_coordinates.return_value = (
+            weather_skill.WeatherReport(load_report("onecall_clear"))
+        )
+        self.skill = build_skill(
+            self,
+            lang="en-us",
+            bus=Mock(),
+            log=Mock(),
+            config_core=dict(system_unit="imperial"),
+            weather_api=weather_api,
+            forecast_cache=forecast_cache,
+            forecast_fetcher=weather_skill.ForecastFetcher(forecast_cache),
+            weather_config=SimpleNamespace(
+                latitude=39.0997, longitude=-94.5786, publish_traces=False
+            ),
+            gui_image_directory=Path("ui"),
+            local_forecast_subscriptions=LocalForecastSubscriptions(),
+            speech_prefetch_executor=Mock(),
+            cancel_scheduled_event=Mock(),
+            schedule_repeating_event=Mock(),
+        )
+        self.weather_skill = weather_skill
+
+    def _build_message(self, **data):
+        return self.weather_skill.Message("skill.weather.subscribe", data=data)
+
+    def _change_temperature(self):
+        """Make the next report retrieved warmer, once the cached one is stale."""
+        report = load_report("onecall_clear")
+        report["current"]["temp"] += 5
+        self.skill.weather_api.get_weather_for_coordinates.return_value = (
+            self.weather_skill.WeatherReport(report)
+        )
+        self.now += 600
+
+    def _list_local_forecast_events(self) -> list:
+        return [
+            message
+            for (message,), _ in self.skill.bus.emit.call_args_list
+            if message.msg_type == LOCAL_FORECAST_EVENT
+        ]
+
+    def test_request_is_answered_once_when_forecast_is_fetched(self):
+        self.skill.handle_subscribe_local_forecast(
+            self._build_message(subscriber="homescreen")
+        )
+        self.skill.bus.emit.reset_mock()
+        self._change_temperature()
+
+        self.skill.handle_get_local_forecast(None)
+
+        self.assertEqual(len(self._list_local_forecast_events()), 1)
+
+    def test_request_is_answered_without_subscribers(self):
+        self.skill.handle_get_local_forecast(None)
+        self.skill.handle_get_local_forecast(None)
+
+        self.assertEqual(len(self._list_local_forecast_events()), 2)
+
+    def test_answered_request_is_not_pushed_to_subscribers_again(self):
+        self.skill.handle_subscribe_local_forecast(
+            self._build_message(subscriber="homescreen")
+        )
+        self._change_temperature()
+        self.skill.handle_get_local_forecast(None)
+        self.skill.bus.emit.reset_mock()
+
+        self.skill._refresh_local_forecast()
+
+        self.assertEqual(self._list_local_forecast_events(), [])
+
+    def test_subscription_without_name_is_rejected(self):
+        for data in (dict(), dict(subscriber="")):
+            with self.subTest(data=data):
+                self.skill.handle_subscribe_local_forecast(self._build_message(**data))
+
+                self.assertFalse(self.skill.local_forecast_subscriptions)
+                self.skill.schedule_repeating_event.assert_not_called()
+                self.assertEqual(self._list_local_forecast_events(), [])
+
+    def test_unsubscription_without_name_is_rejected(self):
+        self.skill.handle_subscribe_local_forecast(
+            self._build_message(subscriber="homescreen")
+        )
+
+        self.skill.handle_unsubscribe_local_forecast(self._build_message())
+
+        self.assertTrue(self.skill.local_forecast_subscriptions)
+        self.skill.cancel_scheduled_event.assert_called_once()
@@ -0,0 +1,185 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for tracing the stages of the requests handled by the skill."""
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from skill.config import WeatherConfig
+from skill.tracing import get_active_trace, trace_request, trace_span, traced
+from .fixtures import build_skill, load_skill_module
+
+weather_skill = load_skill_module()
+
+
+class StubSkill:
+    """Collect the trace records published by the traced handlers."""
+
+    def __init__(self):
+        self.records = []
+
+    def publish_trace(self, record: dict):
+        self.records.append(record)
+
+    @trace_request
+    def handle_request(self, stages):
+        for stage in stages:
+            with trace_span(stage):
+                pass
+        return "handled"
+
+    @trace_request
+    def handle_failure(self):
+        with trace_span("failing"):
+            raise ValueError
+
+    @trace_request
+    def handle_nested_request(self):
+        self.handle_request(["inner"])
+        with trace_span("outer"):
+            pass
+
+    @traced()
+    def build_dialog(self):
+        return "dialog"
+
+
+class TestTraceRequest(TestCase):
+    def setUp(self):
+        self.skill = StubSkill()
+
+    def test_spans_are_published_in_order(self):
+        self.assertEqual("handled", self.skill.handle_request(["weather", "speak"]))
+
+        self.assertEqual(1, len(self.skill.records))
+        record = self.skill.records[0]
+        self.assertEqual("handle_request", record["request"])
+        self.assertEqual(
+            ["weather", "speak"], [span["name"] for span in record["spans"]]
+        )
+        self.assertEqual(32, len(record["correlation_id"]))
+        for span in record["spans"]:
+            self.assertGreaterEqual(span["start"], 0)
+            self.assertLessEqual(span["start"] + span["duration"], record["duration"])
+
+    def test_each_request_has_its_own_correlation_id(self):
+        self.skill.handle_request([])
+        self.skill.handle_request([])
+
+        first, second = self.skill.records
+        self.assertNotEqual(first["correlation_id"], second["correlation_id"])
+
+    def test_failed_request_is_published(self):
+        with self.assertRaises(ValueError):
+            self.skill.handle_failure()
+
+        self.assertEqual(
+            ["failing"], [span["name"] for span in self.skill.records[0]["spans"]]
+        )
+        self.assertIsNone(get_active_trace())
+
+    def test_nested_request_restores_enclosing_trace(self):
+        self.skill.handle_nested_request()
+
+        inner, outer = self.skill.records
+        self.assertEqual(["inner"], [span["name"] for span in inner["spans"]])
+        self.assertEqual(["outer"], [span["name"] for span in outer["spans"]])
+        self.assertIsNone(get_active_trace())
+
+    def test_traced_function_is_recorded_under_its_name(self):
+        @trace_request
+        def handle_dialog(skill):
+            return skill.build_dialog()
+
+        self.assertEqual("dialog", handle_dialog(self.skill))
+        self.assertEqual(
+            ["StubSkill.build_dialog"],
+            [span["name"] for span in self.skill.records[0]["spans"]],
+        )
+
+    def test_spans_outside_request_are_not_recorded(self):
+        with trace_span("untraced"):
+            pass
+
+        self.assertEqual("dialog", self.skill.build_dialog())
+        self.assertIsNone(get_active_trace())
+        self.assertEqual([], self.skill.records)
+
+    def test_threads_trace_separately(self):
+        started = threading.Event()
+        finish = threading.Event()
+
+        def wait_in_span():
+            started.set()
+            finish.wait(5)
+
+        @trace_request
+        def handle_waiting_request(skill):
+            with trace_span("waiting"):
+                wait_in_span()
+
+        thread = threading.Thread(target=handle_waiting_request, args=(self.skill,))
+        thread.start()
+        started.wait(5)
+        self.skill.handle_request(["main"])
+        finish.set()
+        thread.join(5)
+
+        main, waiting = self.skill.records
+        self.assertEqual(["main"], [span["name"] for span in main["spans"]])
+        self.assertEqual(["waiting"], [span["name"] for span in waiting["spans"]])
+
+
+class TestPublishTrace(TestCase):
+    def _build_skill(self, settings: dict):
+        return build_skill(
+            self,
+            bus=Mock(),
+            log=Mock(),
+            weather_config=WeatherConfig(dict(), settings),
+        )
+
+    def test_trace_is_logged_at_debug_level(self):
+        skill = self._build_skill(dict())
+
+        skill.publish_trace(dict(request="handle_get_local_forecast"))
+
+        skill.log.debug.assert_called_once()
+        skill.log.info.assert_not_called()
+
+    def test_trace_is_not_emitted_by_default(self):
+        skill = self._build_skill(dict())
+
+        skill.publish_trace(dict(request="handle_get_local_forecast"))
+
+        skill.bus.emit.assert_not_called()
+
+    def test_trace_is_emitted_when_enabled(self):
+        for value in (True, "true", "True"):
+            with self.subTest(value=value):
+                skill = self._build_skill(dict(publish_traces=value))
+                record = dict(request="handle_current_weather")
+
+                skill.publish_trace(record)
+
+                message = skill.bus.emit.call_args[0][0]
+                self.assertEqual(weather_skill.TRACE_EVENT, message.msg_type)
+                self.assertEqual(record, message.data)
+
+    def test_unchecked_setting_does_not_emit(self):
+        skill = self._build_skill(dict(publish_traces="false"))
+
+        skill.publish_trace(dict(request="handle_current_weather"))
+
+        skill.bus.emit.assert_not_called()
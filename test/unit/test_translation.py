@@ -0,0 +1,88 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for translating conditions, directions and percentages."""
+from unittest import TestCase
+
+from skill.translation import TranslationTable
+from .fixtures import SKILL_DIRECTORY, build_skill, load_skill_module
+
+LOCALE_DIRECTORY = SKILL_DIRECTORY.joinpath("locale")
+weather_skill = load_skill_module()
+
+
+class TestTranslationTable(TestCase):
+    def setUp(self):
+        self.table = TranslationTable.from_locale_directory(
+            LOCALE_DIRECTORY.joinpath("en-us")
+        )
+
+    def test_condition_is_translated(self):
+        self.assertEqual("a clear sky", self.table.translate("clear-sky"))
+
+    def test_direction_is_translated(self):
+        self.assertEqual("north", self.table.translate("north"))
+
+    def test_percentage_is_rendered_with_its_value(self):
+        self.assertEqual(
+            "42 percent",
+            self.table.translate("percentage-number", data=dict(number=42)),
+        )
+
+    def test_missing_word_is_returned_without_dots(self):
+        self.assertEqual("light rain", self.table.translate("light.rain"))
+
+    def test_several_phrasings_are_all_used(self):
+        table = TranslationTable(dict(sky=["clear sky", "cloudless sky"]))
+        translations = {table.translate("sky") for _ in range(100)}
+
+        self.assertEqual({"clear sky", "cloudless sky"}, translations)
+
+    def test_dialog_without_phrasings_is_not_kept(self):
+        table = TranslationTable(dict(sky=[]))
+
+        self.assertEqual("sky", table.translate("sky"))
+
+
+class TestLocaleWithoutTable(TestCase):
+    def test_table_is_empty(self):
+        table = TranslationTable.from_locale_directory(
+            LOCALE_DIRECTORY.joinpath("xx-xx")
+        )
+
+        self.assertEqual({}, table.templates)
+        self.assertEqual("clear sky", table.translate("clear.sky"))
+
+    def test_skill_returns_words_untranslated(self):
+        skill = build_skill(
+            self,
+            lang="xx-xx",
+            root_dir=str(SKILL_DIRECTORY),
+            translation_tables=dict(),
+        )
+
+        self.assertEqual("north", skill._translate_word("north"))
+        self.assertIn("xx-xx", skill.translation_tables)
+
+    def test_skill_keeps_a_table_per_language(self):
+        skill = build_skill(
+            self,
+            lang="en-us",
+            root_dir=str(SKILL_DIRECTORY),
+            translation_tables=dict(),
+        )
+        self.assertEqual("a clear sky", skill._translate_word("clear-sky"))
+        skill.lang = "xx-xx"
+
+        self.assertEqual("clear-sky", skill._translate_word("clear-sky"))
+        self.assertEqual({"en-us", "xx-xx"}, set(skill.translation_tables))
@@ -0,0 +1,97 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the cache of datetimes extracted from utterances."""
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytz
+
+from skill.util import UtteranceDatetimeCache
+
+CHICAGO = pytz.timezone("America/Chicago")
+SYDNEY = pytz.timezone("Australia/Sydney")
+# Extractions are only cached when the anchor is not on a whole minute.
+ANCHOR = CHICAGO.localize(datetime(2026, 10, 17, 9, 15, 30))
+
+
+def _extract_datetime(text, anchorDate=None, lang=None, default_time=None):
+    """Resolve "tomorrow" the way mycroft-core does; nothing else is a date."""
+    if "tomorrow" not in text:
+        return None
+    midnight = anchorDate.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    return midnight + timedelta(days=1), ""
+
+
+class TestUtteranceDatetimeCache(TestCase):
+    def setUp(self):
+        patcher = patch("skill.util.extract_datetime", wraps=_extract_datetime)
+        self.addCleanup(patcher.stop)
+        self.extract_datetime = patcher.start()
+        self.cache = UtteranceDatetimeCache()
+
+    def test_reuses_a_normalized_utterance(self):
+        first = self.cache.extract("what's the weather tomorrow", ANCHOR, "en-us")
+        second = self.cache.extract(
+            "  What's the   weather TOMORROW", ANCHOR + timedelta(minutes=30), "en-us"
+        )
+
+        self.assertEqual(first, second)
+        self.assertEqual(second.date(), ANCHOR.date() + timedelta(days=1))
+        self.assertEqual(self.extract_datetime.call_count, 1)
+
+    def test_language_is_part_of_the_key(self):
+        self.cache.extract("what's the weather tomorrow", ANCHOR, "en-us")
+        self.cache.extract("what's the weather tomorrow", ANCHOR, "en-gb")
+
+        self.assertEqual(self.extract_datetime.call_count, 2)
+
+    def test_timezone_is_part_of_the_key(self):
+        self.cache.extract("what's the weather tomorrow", ANCHOR, "en-us")
+        sydney_anchor = SYDNEY.localize(datetime(2026, 10, 17, 9, 15, 30))
+        self.cache.extract("what's the weather tomorrow", sydney_anchor, "en-us")
+
+        self.assertEqual(self.extract_datetime.call_count, 2)
+
+    def test_date_and_hour_are_part_of_the_key(self):
+        self.cache.extract("what's the weather tomorrow", ANCHOR, "en-us")
+        next_hour = ANCHOR + timedelta(hours=1)
+        next_day = ANCHOR + timedelta(days=1)
+        self.cache.extract("what's the weather tomorrow", next_hour, "en-us")
+        tomorrow = self.cache.extract("what's the weather tomorrow", next_day, "en-us")
+
+        self.assertEqual(self.extract_datetime.call_count, 3)
+        self.assertEqual(tomorrow.date(), next_day.date() + timedelta(days=1))
+
+    def test_remembers_utterances_without_a_datetime(self):
+        first = self.cache.extract("what's the weather", ANCHOR, "en-us")
+        second = self.cache.extract("what's the weather", ANCHOR, "en-us")
+
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+        self.assertEqual(self.extract_datetime.call_count, 1)
+
+    def test_drops_the_least_recently_used_utterance(self):
+        self.cache.max_size = 2
+        self.cache.extract("weather tomorrow", ANCHOR, "en-us")
+        self.cache.extract("forecast tomorrow", ANCHOR, "en-us")
+        self.cache.extract("weather tomorrow", ANCHOR, "en-us")
+        self.cache.extract("temperature tomorrow", ANCHOR, "en-us")
+        self.extract_datetime.reset_mock()
+
+        self.cache.extract("weather tomorrow", ANCHOR, "en-us")
+        self.cache.extract("forecast tomorrow", ANCHOR, "en-us")
+
+        self.assertEqual(self.extract_datetime.call_count, 1)
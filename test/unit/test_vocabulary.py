@@ -0,0 +1,129 @@
+# Copyright 2021, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for matching all the vocabulary of a language in one pass."""
+import json
+import re
+from unittest import TestCase
+
+from skill.vocabulary import parse_vocabulary, VocabularyMatcher
+from .fixtures import SKILL_DIRECTORY
+
+LOCALE_DIRECTORY = SKILL_DIRECTORY.joinpath("locale")
+LANGUAGES = sorted(path.name for path in LOCALE_DIRECTORY.iterdir() if path.is_dir())
+REGEX_CHARACTERS = set("\\.^$*+?{}[]()|")
+EXAMPLE_PATTERN = re.compile(r"^\s*\|\s*(.+?)\s*\|\s*$")
+
+
+def voc_match(utterance: str, phrases: list) -> bool:
+    """Match an utterance against a vocabulary file like MycroftSkill.voc_match()."""
+    return any(re.match(r".*\b" + phrase + r"\b.*", utterance) for phrase in phrases)
+
+
+def has_top_level_alternation(phrase: str) -> bool:
+    """Determine if a phrase has a "|" that is not inside parentheses."""
+    depth = 0
+    for character in phrase:
+        if character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and not depth:
+            return True
+
+    return False
+
+
+def read_vocabularies(language: str) -> dict:
+    """Read the phrases of every vocabulary file of a language."""
+    vocabulary_directory = LOCALE_DIRECTORY.joinpath(language, "vocabulary")
+    return {
+        voc_path.stem: parse_vocabulary(voc_path.read_text(encoding="utf-8"))
+        for voc_path in sorted(vocabulary_directory.glob("**/*.voc"))
+    }
+
+
+def list_intent_utterances() -> list:
+    """List the English utterances of the intent and behave tests."""
+    utterances = []
+    for intent_path in SKILL_DIRECTORY.joinpath("test", "intent").glob("*.json*"):
+        with open(intent_path) as intent_file:
+            utterances.append(json.load(intent_file)["utterance"])
+    for feature_path in SKILL_DIRECTORY.joinpath("test", "behave").glob("*.feature"):
+        for line in feature_path.read_text(encoding="utf-8").splitlines():
+            example = EXAMPLE_PATTERN.match(line)
+            if example is not None and "<" not in line:
+                utterances.append(example.group(1).lower())
+
+    return utterances
+
+
+def list_utterances(language: str, vocabularies: dict) -> list:
+    """List utterances for a language: its literal phrases and any test utterances.
+
+    Only English has intent tests, so every phrase without regular expression
+    syntax is also used as an utterance, alone and within a sentence.
+    """
+    utterances = list_intent_utterances() if language == "en-us" else []
+    for phrases in vocabularies.values():
+        for phrase in phrases:
+            if not REGEX_CHARACTERS.intersection(phrase):
+                utterances.extend([phrase, "so " + phrase + " then"])
+
+    return utterances
+
+
+class TestVocabularyMatcher(TestCase):
+    def test_matches_like_voc_match_in_every_language(self):
+        for language in LANGUAGES:
+            vocabularies = read_vocabularies(language)
+            matcher = VocabularyMatcher(vocabularies)
+            # Files with a top-level alternation are checked separately below.
+            compared = {
+                name: phrases
+                for name, phrases in vocabularies.items()
+                if not any(map(has_top_level_alternation, phrases))
+            }
+            differences = []
+            for utterance in list_utterances(language, vocabularies):
+                matched = matcher.match(utterance)
+                differences.extend(
+                    (utterance, name)
+                    for name, phrases in compared.items()
+                    if (name in matched) != voc_match(utterance, phrases)
+                )
+            with self.subTest(language=language):
+                self.assertEqual(differences, [])
+
+    def test_alternation_matches_anywhere(self):
+        vocabularies = read_vocabularies("es-es")
+        matcher = VocabularyMatcher(vocabularies)
+        self.assertIn("clima|tiempo", vocabularies["weather"])
+
+        for utterance in ("tiempo", "clima de hoy", "qué clima hace"):
+            with self.subTest(utterance=utterance):
+                self.assertIn("weather", matcher.match(utterance))
+                self.assertTrue(voc_match(utterance, vocabularies["weather"]))
+        # voc_match() only finds the last alternative at the start of the
+        # utterance; the matcher finds it anywhere, on whole words.
+        self.assertIn("weather", matcher.match("qué tiempo hace"))
+        self.assertFalse(voc_match("qué tiempo hace", vocabularies["weather"]))
+        self.assertNotIn("weather", matcher.match("qué climatología"))
+
+    def test_regexes_match_from_the_start_ignoring_case(self):
+        matcher = VocabularyMatcher(
+            dict(), dict(location=[r".*\bin (?P<Location>.+)$"])
+        )
+
+        self.assertEqual(matcher.match("Weather IN Paris"), {"location"})
+        self.assertEqual(matcher.match("weather"), frozenset())